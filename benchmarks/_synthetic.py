@@ -0,0 +1,67 @@
+"""Synthetic inputs shared by the bench_* modules, nothing here needs CHeart itself."""
+
+import dataclasses as dc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from aorta_personalization.mesh._types import BCPatchTag
+from aorta_personalization.mesh.types import CylinderDims, ElementTypes, Geometries, MeshInfo
+from aorta_personalization.storage.api import chwrite_d_utf
+from pytools.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from pytools.arrays import A2
+    from pytools.logging import ILogger
+
+
+# (radial, circumferential, longitudinal) element counts, smallest to production size
+NELEM: list[tuple[int, int, int]] = [(1, 8, 16), (2, 16, 64), (3, 32, 100)]
+N_NODES = [5_000, 20_000, 80_000]
+N_STEPS = 20
+
+
+@dc.dataclass(slots=True, frozen=True)
+class Benchmark[P, S]:
+    """One timed case per param, setup builds the inputs in a fresh directory and is not timed."""
+
+    name: str
+    params: Sequence[P]
+    setup: Callable[[P, Path], S]
+    run: Callable[[S], object]
+
+
+def quiet_logger() -> ILogger:
+    return get_logger(level="ERROR")
+
+
+def cylinder_mesh_info(root: Path, nelem: tuple[int, int, int]) -> MeshInfo:
+    return MeshInfo(
+        GEO=Geometries["STRAIGHT_CYLINDER"],
+        DIR=root / "mesh",
+        SPEC=CylinderDims(shape=(9.0, 12.0, 200.0), nelem=nelem),
+        DISP="cyl_quad",
+        PRES="cyl_lin",
+        ELEM=ElementTypes["HEX"],
+        ORDER=2,
+        FIELD="CenterLineField-0.D",
+        NORMAL="CenterNormalField-0.D",
+        INLET=BCPatchTag("inlet", 1),
+        OUTLET=BCPatchTag("outlet", 2),
+        INNER=BCPatchTag("inner", 3),
+        OUTER=BCPatchTag("outer", 4),
+        ENDS=[1, 2],
+    )
+
+
+def centerline_coords(n_nodes: int, seed: int = 0) -> A2[np.float64]:
+    """Columns are the normalized longitudinal and circumferential coordinates in [0, 1]."""
+    return np.random.default_rng(seed).random((n_nodes, 2))
+
+
+def write_steps(root: Path, prefix: str, shape: tuple[int, int], n_steps: int = N_STEPS) -> None:
+    rng = np.random.default_rng(len(prefix))
+    for i in range(1, n_steps + 1):
+        chwrite_d_utf(root / f"{prefix}-{i}.D", rng.random(shape))
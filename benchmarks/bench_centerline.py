@@ -0,0 +1,82 @@
+"""CL topology generation and interpolation of CL variables back onto the main mesh."""
+
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+from _synthetic import (
+    N_NODES,
+    N_STEPS,
+    Benchmark,
+    centerline_coords,
+    cylinder_mesh_info,
+    quiet_logger,
+    write_steps,
+)
+from aorta_personalization.mesh._cylinder import remake_cylinder_mesh
+from aorta_personalization.mesh.api import prep_topology_meshes
+from aorta_personalization.prep import expand_cl_variables_to_main_topology
+from cheartpy.cl.mesh import create_cl_partition
+from pytools.path import clear_dir
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from aorta_personalization.mesh.types import MeshInfo
+    from cheartpy.cl.struct import CLPartition
+    from cheartpy.mesh.struct import CheartMesh
+    from pytools.arrays import A2
+
+
+_N_SEG = [4, 8, 16, 32]
+_CL_SURF = 4
+
+
+class _TopologyInputs(NamedTuple):
+    n_seg: int
+    mesh: MeshInfo
+    cheart_mesh: CheartMesh[np.float64, np.intc]
+    cl: A2[np.float64]
+
+
+def _setup_topology(n_seg: int, root: Path) -> _TopologyInputs:
+    mesh = cylinder_mesh_info(root, (2, 16, 64))
+    cheart_mesh, cl = remake_cylinder_mesh(
+        mesh, mesh.SPEC, quad=True, warp=False, log=quiet_logger()
+    )
+    return _TopologyInputs(n_seg, mesh, cheart_mesh, cl)
+
+
+def _run_topology(inputs: _TopologyInputs) -> object:
+    # without the topology files prep_topology_meshes rebuilds instead of skipping
+    clear_dir(inputs.mesh.DIR, "CL*_FE.T")
+    return prep_topology_meshes(
+        "CL",
+        _CL_SURF,
+        inputs.n_seg,
+        (inputs.mesh, inputs.cheart_mesh, inputs.cl),
+        log=quiet_logger(),
+    ).unwrap()
+
+
+class _ExpandInputs(NamedTuple):
+    part: CLPartition[np.float64, np.intc]
+    cl: A2[np.float64]
+    root: Path
+
+
+def _setup_expand(n_nodes: int, root: Path) -> _ExpandInputs:
+    part = create_cl_partition(("CL", _CL_SURF), ne=16, ftype=np.float64, dtype=np.intc)
+    write_steps(root, "CLLM", (part.nn, 3), N_STEPS)
+    return _ExpandInputs(part, centerline_coords(n_nodes), root)
+
+
+def _run_expand(inputs: _ExpandInputs) -> object:
+    return expand_cl_variables_to_main_topology(
+        inputs.part, inputs.cl, "LM", root_dir=inputs.root
+    ).unwrap()
+
+
+BENCHMARKS = [
+    Benchmark("prep_topology_meshes", _N_SEG, _setup_topology, _run_topology),
+    Benchmark("expand_cl_variables_to_main_topology", N_NODES, _setup_expand, _run_expand),
+]
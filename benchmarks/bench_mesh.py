@@ -0,0 +1,82 @@
+"""Structured cylinder generation and the nodal fields derived from it."""
+
+from typing import TYPE_CHECKING
+
+from _synthetic import NELEM, Benchmark, cylinder_mesh_info, quiet_logger
+from aorta_personalization.mesh._cylinder import remake_cylinder_mesh
+from aorta_personalization.mesh._structured import element_template, structured_cylinder
+from aorta_personalization.mesh._variables import (
+    create_center_pos,
+    create_fiber_field,
+    define_centerline_field,
+    warp_in_y,
+)
+from cheartpy.mesh.cylinder_core.api import create_cylinder_mesh
+from cheartpy.mesh.surface_core.normals import normalize_by_row
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import numpy as np
+    from aorta_personalization.mesh.types import MeshInfo
+    from cheartpy.mesh.struct import CheartMesh
+    from pytools.arrays import A2
+
+
+def _quad_cylinder(nelem: tuple[int, int, int]) -> CheartMesh[np.float64, np.intc]:
+    lin_mesh, quad_mesh = create_cylinder_mesh((9.0, 12.0, 200.0, 0.0), nelem, "x", make_quad=True)
+    return quad_mesh or lin_mesh
+
+
+def _run_remake(mesh: MeshInfo) -> object:
+    return remake_cylinder_mesh(
+        mesh, mesh.SPEC, quad=True, warp=False, log=quiet_logger(), fast=False
+    )
+
+
+def _run_remake_fast(mesh: MeshInfo) -> object:
+    return remake_cylinder_mesh(mesh, mesh.SPEC, quad=True, warp=False, log=quiet_logger())
+
+
+def _setup_remake_fast(nelem: tuple[int, int, int], root: Path) -> MeshInfo:
+    # the element layout is learned once per process, keep that out of the timed region
+    element_template(quad=True)
+    return cylinder_mesh_info(root, nelem)
+
+
+def _setup_structured(nelem: tuple[int, int, int], _root: Path) -> tuple[int, int, int]:
+    element_template(quad=True)
+    return nelem
+
+
+def _run_structured(nelem: tuple[int, int, int]) -> object:
+    return structured_cylinder((9.0, 12.0, 200.0), nelem, quad=True)
+
+
+def _setup_warp(nelem: tuple[int, int, int], _root: Path) -> A2[np.float64]:
+    return _quad_cylinder(nelem).space.v
+
+
+def _setup_fibers(
+    nelem: tuple[int, int, int], _root: Path
+) -> tuple[A2[np.float64], A2[np.float64]]:
+    mesh = _quad_cylinder(nelem)
+    cl = define_centerline_field(mesh)
+    normal = normalize_by_row(mesh.space.v - create_center_pos(mesh, cl))
+    return cl, normal
+
+
+def _run_fibers(inputs: tuple[A2[np.float64], A2[np.float64]]) -> object:
+    return create_fiber_field(*inputs, warp=True)
+
+
+BENCHMARKS = [
+    Benchmark(
+        "remake_cylinder_mesh", NELEM, lambda n, root: cylinder_mesh_info(root, n), _run_remake
+    ),
+    Benchmark("remake_cylinder_mesh_fast", NELEM, _setup_remake_fast, _run_remake_fast),
+    Benchmark("create_cylinder_mesh", NELEM, lambda n, _: n, _quad_cylinder),
+    Benchmark("structured_cylinder", NELEM, _setup_structured, _run_structured),
+    Benchmark("warp_in_y", NELEM, _setup_warp, warp_in_y),
+    Benchmark("create_fiber_field", NELEM, _setup_fibers, _run_fibers),
+]
@@ -0,0 +1,87 @@
+"""Postprocessing stages run on generated .D directories."""
+
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+from _synthetic import (
+    N_NODES,
+    N_STEPS,
+    Benchmark,
+    centerline_coords,
+    cylinder_mesh_info,
+    quiet_logger,
+    write_steps,
+)
+from aorta_personalization.prep._postprocessing import postprocess_physical_space
+from aorta_personalization.prep.api import make_reference_data_for_inverse_estimation
+from aorta_personalization.problem.types import Labels, MaterialProperty, ProblemParameters
+from aorta_personalization.storage.api import chwrite_d_utf
+from cheartpy.cl.mesh import create_cl_partition
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from aorta_personalization.mesh.types import MeshInfo
+    from cheartpy.cl.struct import CLPartition
+    from pytools.arrays import A2
+
+
+def _setup_physical_space(n_nodes: int, root: Path) -> Path:
+    chwrite_d_utf(root / "X.D", np.random.default_rng(0).random((n_nodes, 3)))
+    write_steps(root, "Disp", (n_nodes, 3))
+    return root
+
+
+def _run_physical_space(root: Path) -> object:
+    return postprocess_physical_space(
+        root / "X.D", "Disp", home=root, cores=1, log=quiet_logger()
+    ).unwrap()
+
+
+class _ReferenceInputs(NamedTuple):
+    pb: ProblemParameters
+    mesh: MeshInfo
+    cl: A2[np.float64]
+    cl_part: CLPartition[np.float64, np.intc]
+    dl_part: CLPartition[np.float64, np.intc]
+
+
+def _setup_reference(n_nodes: int, root: Path) -> _ReferenceInputs:
+    mesh = cylinder_mesh_info(root, (2, 16, 64))
+    mesh.DIR.mkdir()
+    normal = np.random.default_rng(1).normal(size=(n_nodes, 3))
+    chwrite_d_utf(mesh.DIR / mesh.NORMAL, normal / np.linalg.norm(normal, axis=1, keepdims=True))
+    pb = ProblemParameters(
+        P=Labels(N="bench", D=root / "out", CL="CL", CL_n=16, CL_i=4, DL="DL", DL_n=16, DL_i=3),
+        track=root / "track",
+        init=root / "init",
+        motion_var="Zeros",
+        matpars=MaterialProperty("grad", 10.0, 5.0),
+        nt=N_STEPS,
+        noise=0.05,
+    )
+    for d in (pb.P.D, root / "track", root / "init"):
+        d.mkdir()
+    cl_part = create_cl_partition(("CL", 4), ne=16, ftype=np.float64, dtype=np.intc)
+    dl_part = create_cl_partition(("DL", 3), ne=16, ftype=np.float64, dtype=np.intc)
+    write_steps(root / "track", "Disp", (n_nodes, 3))
+    for prefix, shape in [
+        ("Space", (n_nodes, 3)),
+        ("Disp", (n_nodes, 3)),
+        ("Pres", (n_nodes // 8, 1)),
+        ("CLLM", (cl_part.nn, 3)),
+    ]:
+        write_steps(root / "init", prefix, shape)
+    return _ReferenceInputs(pb, mesh, centerline_coords(n_nodes), cl_part, dl_part)
+
+
+def _run_reference(inputs: _ReferenceInputs) -> object:
+    return make_reference_data_for_inverse_estimation(*inputs, log=quiet_logger()).unwrap()
+
+
+BENCHMARKS = [
+    Benchmark("postprocess_physical_space", N_NODES, _setup_physical_space, _run_physical_space),
+    Benchmark(
+        "make_reference_data_for_inverse_estimation", N_NODES, _setup_reference, _run_reference
+    ),
+]
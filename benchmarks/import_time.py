@@ -0,0 +1,86 @@
+# /// script
+# require-python = ">=3.14"
+# dependencies = [
+#     "aorta_personalization",
+# ]
+# ///
+"""Import-time regression check for the public api modules.
+
+Every case runs in a fresh interpreter with -X importtime. The script fails if a case exceeds
+its budget or pulls in a module it must not need (e.g. SciPy for a write_subvar worker).
+"""
+
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+_RESULTS = Path(__file__).parent / "results"
+_REPEATS = 5
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+
+class _Case(NamedTuple):
+    name: str
+    code: str
+    budget_ms: float
+    forbidden: tuple[str, ...] = ()
+
+
+_CASES = [
+    _Case("mesh.api", "import aorta_personalization.mesh.api", 15.0, ("cheartpy", "numpy")),
+    _Case("problem.api", "import aorta_personalization.problem.api", 15.0, ("cheartpy",)),
+    _Case("solid.api", "import aorta_personalization.solid.api", 15.0, ("cheartpy",)),
+    _Case("prep.api", "import aorta_personalization.prep.api", 15.0, ("scipy", "cheartpy")),
+    _Case(
+        "prep.api.write_subvar",
+        "from aorta_personalization.prep.api import write_subvar",
+        250.0,
+        ("scipy", "cheartpy.paraview", "cheartpy.cl"),
+    ),
+]
+
+
+def _profile(code: str) -> dict[str, int]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {m.group(3): int(m.group(1)) for m in _IMPORT_LINE.finditer(proc.stderr)}
+
+
+def _measure(code: str, startup: set[str]) -> tuple[float, set[str]]:
+    # only count what the case imports on top of a bare interpreter start
+    runs = [_profile(code) for _ in range(_REPEATS)]
+    modules = set(runs[0]) - startup
+    # the fastest run is the least disturbed by the rest of the machine
+    elapsed = min(sum(us for m, us in r.items() if m not in startup) for r in runs)
+    return elapsed / 1000.0, modules
+
+
+def main() -> int:
+    results: dict[str, float] = {}
+    failed: list[str] = []
+    startup = set(_profile("pass"))
+    for case in _CASES:
+        elapsed, modules = _measure(case.code, startup)
+        results[case.name] = elapsed
+        leaked = sorted(m for m in modules if m.startswith(case.forbidden))
+        status = "ok" if elapsed <= case.budget_ms and not leaked else "FAIL"
+        print(f"{case.name:<24} {elapsed:8.2f} ms (budget {case.budget_ms:.0f} ms) {status}")
+        if leaked:
+            print(f"    imports forbidden modules: {', '.join(leaked[:5])}")
+        if status == "FAIL":
+            failed.append(case.name)
+    _RESULTS.mkdir(exist_ok=True)
+    with (_RESULTS / "import_time.json").open("w") as f:
+        json.dump(results, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
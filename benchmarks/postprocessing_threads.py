@@ -0,0 +1,92 @@
+# /// script
+# require-python = ">=3.14"
+# dependencies = [
+#     "numpy",
+#     "pytools",
+#     "cheartpy",
+#     "aorta_personalization",
+# ]
+# ///
+"""Thread scaling of the prep postprocessing stages on synthetic data.
+
+Run it once with the default interpreter and once with the free-threaded build (python3.14t)
+and compare the per-thread throughput, e.g.
+
+    uv run benchmarks/postprocessing_threads.py
+    uv run --python 3.14t benchmarks/postprocessing_threads.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from aorta_personalization.prep._postprocessing import postprocess_physical_space, update_stiffness
+from cheartpy.io.api import chwrite_d_utf
+from pytools.parallel import ThreadedRunner
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+_N_NODES = 20_000
+_N_STEPS = 64
+_THREADS = [1, 2, 4, 8, 16]
+_RESULTS = Path(__file__).parent / "results"
+
+
+def gil_enabled() -> bool:
+    # sys._is_gil_enabled only exists from 3.13 on, older builds always have the GIL
+    is_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_enabled is None else bool(is_enabled())
+
+
+def make_synthetic_data(root: Path) -> None:
+    rng = np.random.default_rng(0)
+    chwrite_d_utf(root / "X.D", rng.random((_N_NODES, 3)))
+    for i in range(1, _N_STEPS + 1):
+        chwrite_d_utf(root / f"Disp-{i}.D", rng.random((_N_NODES, 3)))
+        chwrite_d_utf(root / f"DM-{i}.D", rng.random((_N_NODES, 1)))
+
+
+def _stiffness(root: Path, threads: int) -> None:
+    with ThreadedRunner(thread=threads) as exe:
+        for i in range(1, _N_STEPS + 1):
+            exe.submit(update_stiffness, root, i)
+
+
+_STAGES: dict[str, Callable[[Path, int], object]] = {
+    "postprocess_physical_space": lambda root, n: postprocess_physical_space(
+        root / "X.D", "Disp", home=root, cores=n
+    ),
+    "update_stiffness": _stiffness,
+}
+
+
+def main() -> None:
+    build = "gil" if gil_enabled() else "nogil"
+    results: dict[str, dict[int, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_synthetic_data(root)
+        for name, stage in _STAGES.items():
+            results[name] = {}
+            for n in (t for t in _THREADS if t <= (os.cpu_count() or 1)):
+                start = time.perf_counter()
+                stage(root, n)
+                elapsed = time.perf_counter() - start
+                # steps per second per thread, flat means perfect scaling
+                results[name][n] = _N_STEPS / elapsed / n
+                rate = results[name][n]
+                print(f"{build:>5} {name:<28} threads={n:<3} {rate:8.2f} steps/s/thread")
+    _RESULTS.mkdir(exist_ok=True)
+    with (_RESULTS / f"postprocessing_threads_{build}.json").open("w") as f:
+        json.dump({"python": sys.version, "build": build, "stages": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
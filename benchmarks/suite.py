@@ -0,0 +1,126 @@
+# /// script
+# require-python = ">=3.14"
+# dependencies = [
+#     "numpy",
+#     "pytools",
+#     "cheartpy",
+#     "aorta_personalization",
+# ]
+# ///
+"""Run the bench_* modules on synthetic data and keep one result file per commit.
+
+    uv run benchmarks/suite.py                     # run everything, compare to the last result
+    uv run benchmarks/suite.py -k postprocess      # only benchmarks whose name matches
+    uv run benchmarks/suite.py --against 1aa8a2c   # compare to a specific commit
+
+Results go to benchmarks/results/<commit>.json. A case is flagged as a regression when its best
+time is more than --threshold slower than in the reference file, and the script then exits 1.
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from _synthetic import Benchmark
+
+
+_HERE = Path(__file__).parent
+_RESULTS = _HERE / "results"
+
+
+def _git(*args: str) -> str:
+    proc = subprocess.run(["git", *args], cwd=_HERE, capture_output=True, text=True, check=False)
+    return proc.stdout.strip()
+
+
+def _discover() -> list[Benchmark[Any, Any]]:
+    sys.path.insert(0, str(_HERE))
+    modules = [importlib.import_module(f.stem) for f in sorted(_HERE.glob("bench_*.py"))]
+    return [b for m in modules for b in m.BENCHMARKS]
+
+
+def _time_case(bench: Benchmark[Any, Any], param: object, repeat: int) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        state = bench.setup(param, Path(tmp))
+        # first call warms caches and lazy imports, it is not counted
+        bench.run(state)
+        times: list[float] = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            bench.run(state)
+            times.append(time.perf_counter() - start)
+    return {"min": min(times), "median": statistics.median(times), "repeat": repeat}
+
+
+def _reference(commit: str, against: str | None) -> Path | None:
+    if against is not None:
+        full = _git("rev-parse", "--short", against) or against
+        return f if (f := _RESULTS / f"{full}.json").is_file() else None
+    # the most recent result from another commit
+    others = [f for f in _RESULTS.glob("*.json") if f.stem != commit and f.stem.isalnum()]
+    return max(others, key=lambda f: json.loads(f.read_text())["timestamp"], default=None)
+
+
+def _compare(results: dict[str, dict[str, float]], ref_file: Path, threshold: float) -> list[str]:
+    ref = json.loads(ref_file.read_text())["results"]
+    print(f"\nCompared to {ref_file.stem}:")
+    regressions: list[str] = []
+    for case, r in results.items():
+        if case not in ref:
+            continue
+        ratio = r["min"] / ref[case]["min"]
+        flag = "REGRESSION" if ratio > 1.0 + threshold else ""
+        print(f"  {case:<56} {ratio:6.2f}x {flag}")
+        if flag:
+            regressions.append(case)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the benchmarks and compare to a commit.")
+    parser.add_argument("-k", "--filter", default="", help="substring of the benchmark names")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--against", default=None, help="commit to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+    commit = _git("rev-parse", "--short", "HEAD") or "unknown"
+    results: dict[str, dict[str, float]] = {}
+    for bench in _discover():
+        if args.filter not in bench.name:
+            continue
+        for param in bench.params:
+            case = f"{bench.name}[{param}]"
+            results[case] = _time_case(bench, param, args.repeat)
+            print(f"{case:<56} {results[case]['min'] * 1e3:10.2f} ms")
+    ref_file = _reference(commit, args.against)
+    _RESULTS.mkdir(exist_ok=True)
+    with (_RESULTS / f"{commit}.json").open("w") as f:
+        json.dump(
+            {
+                "commit": commit,
+                "dirty": bool(_git("status", "--porcelain", "--", "src")),
+                "timestamp": datetime.now(UTC).isoformat(),
+                "python": sys.version,
+                "machine": platform.platform(),
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    if ref_file is None:
+        return 0
+    return 1 if _compare(results, ref_file, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
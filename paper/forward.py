@@ -12,12 +12,14 @@ from typing import TYPE_CHECKING, TypedDict, Unpack
 from aorta_personalization.prep._cl_variables import expand_cl_variables_to_main_topology
 from aorta_personalization.prep.api import (
     check_for_vars,
+    forward_step_postprocessing,
     make_longitudinal_field,
     postprocess_physical_space,
     run_setup,
     run_simulation,
     run_vtu,
 )
+from aorta_personalization.profiling.api import export_chrome_trace
 from cheartpy.io.api import fix_ch_sfx
 from meshes import BENT_CYLINDER_QUAD_MESH, BULGE_CYLINDER_QUAD_MESH, STRAIGHT_CYLINDER_QUAD_MESH
 from pfiles.forward_centerline_constrained import create_pfile as create_forward_pfile
@@ -63,31 +65,48 @@ def main_forward(pb: ProblemParameters, mesh: MeshInfo, **kwargs: Unpack[MainSim
     log.brief(f"Starting forward simulation for problem at {pb.P.D}")
     pb.P.D.mkdir(parents=True, exist_ok=True)
     cl, cl_top, _ = run_setup(pb, mesh, log=log).unwrap()
+    ref_space = mesh.DIR / (fix_ch_sfx(mesh.DISP) + "X")
     if not _overwrite and is_completed(pb, _SIMULATION_OUTPUTS):
         log.info(f"Output directory {pb.P.D} is not empty, skipping simulation.")
+        if is_completed(pb, _POSTPROCESSING_OUTPUTS):
+            log.info(f"Postprocessing already completed for problem with output dir: {pb.P.D}.")
+            export_chrome_trace(pb.P.D / "trace.json")
+            return
     else:
         log.info(
             f"Running forward simulation for problem with output dir:"
             f"{pb.P.D}={any(pb.P.D.iterdir())}."
         )
         clear_dir(pb.P.D)
-        run_simulation(create_forward_pfile, pb, mesh, cl_top, log=log, pedantic=True, cores=_cores)
-    if is_completed(pb, _POSTPROCESSING_OUTPUTS):
-        log.info(f"Postprocessing already completed for problem with output dir: {pb.P.D}.")
-        return
+        # Space and LM are produced step by step while the solver is still running
+        on_output = forward_step_postprocessing(
+            ref_space, "Disp", home=pb.P.D, cl_top=cl_top, cl=cl, cl_vars=["LM"]
+        )
+        run_simulation(
+            create_forward_pfile,
+            pb,
+            mesh,
+            cl_top,
+            log=log,
+            pedantic=True,
+            cores=_cores,
+            on_output=on_output,
+            watch=["Disp", "CLLM"] if cl_top is not None else ["Disp"],
+        )
     postprocess_physical_space(
-        mesh.DIR / (fix_ch_sfx(mesh.DISP) + "X"), "Disp", home=pb.P.D, cores=_cores, prog_bar=_bar
+        ref_space, "Disp", home=pb.P.D, cores=_cores, prog_bar=_bar, overwrite=False
     ).unwrap()
-    match expand_cl_variables_to_main_topology(cl_top, cl, "LM", root_dir=pb.P.D):
+    match expand_cl_variables_to_main_topology(cl_top, cl, "LM", root_dir=pb.P.D, overwrite=False):
         case Ok(cl_vars):
             cl_vars = ["CLz", *cl_vars]
         case Err(e):
             log.error(f"Failed to expand CL variables: {e}")
             cl_vars: list[str] = []
     if cl_top is not None:
-        make_longitudinal_field(pb.P.D, cores=_cores, prog_bar=_bar).unwrap()
+        make_longitudinal_field(pb.P.D).unwrap()
     export_vars = check_for_vars(pb.P.D, "Space", "Disp", "CLField", "Stiff", *cl_vars)
     run_vtu(mesh, pb, *export_vars, cores=_cores)
+    export_chrome_trace(pb.P.D / "trace.json")
 
 
 def main_cli(**kwargs: Unpack[MainSimKwargs]) -> None:
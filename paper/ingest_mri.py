@@ -0,0 +1,30 @@
+# /// script
+# require-python = ">=3.14"
+# dependencies = [
+#     "numpy",
+#     "pytools",
+#     "aorta_personalization",
+# ]
+# ///
+"""Convert the tracked MRI sequence in DATA_AORTA into the memory mapped store read by setup."""
+
+from pathlib import Path
+
+from aorta_personalization.storage.api import ingest_tracked_sequence
+from pytools.logging import get_logger
+
+_MRI_DIR = Path("DATA_AORTA")
+_MRI_FIELDS = ("CenterLineField-0.D", "CenterNormalField-0.D")
+
+
+def main() -> None:
+    log = get_logger(level="INFO")
+    # without precomputed fields setup derives them from the mesh
+    fields = [f for f in _MRI_FIELDS if (_MRI_DIR / f).is_file()]
+    store = ingest_tracked_sequence(_MRI_DIR, _MRI_DIR / "tracked_store", fields=fields).unwrap()
+    n_frames, n_nodes, dim = store.frames.shape
+    log.info(f"Stored {n_frames} frames of {n_nodes} x {dim} nodes in {store.root}")
+
+
+if __name__ == "__main__":
+    main()
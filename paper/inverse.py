@@ -17,6 +17,7 @@ from aorta_personalization.prep.api import (
     run_simulation,
     run_vtu,
 )
+from aorta_personalization.profiling.api import export_chrome_trace
 from meshes import BENT_CYLINDER_QUAD_MESH, BULGE_CYLINDER_QUAD_MESH, STRAIGHT_CYLINDER_QUAD_MESH
 from pfiles.inverse_parameter_estimation import create_inverse_pfile
 from problems import (
@@ -45,7 +46,6 @@ _SIMULATION_OUTPUTS = [
     "DLDM",
     "P0",
     "Pt",
-    "Stiff",
     "U0",
     "Ut",
     "X0",
@@ -86,6 +86,7 @@ def main_reverse(pb: ProblemParameters, mesh: MeshInfo, **kwargs: Unpack[MainSim
         )
     if not is_completed(pb, _SIMULATION_OUTPUTS):
         log.error("Simulation did not complete successfully.")
+        export_chrome_trace(pb.P.D / "trace.json")
         return
     if is_completed(pb, _POSTPROCESSING_OUTPUTS) and not kwargs.get("overwrite", False):
         log.info(f"{pb.P.D} post-processing is complete, skipping.")
@@ -93,8 +94,9 @@ def main_reverse(pb: ProblemParameters, mesh: MeshInfo, **kwargs: Unpack[MainSim
     exported_vars = postprocess_inverse_prob(
         pb, mesh, cl, cl_top, dl_top, log=log, cores=_cores, prog_bar=_bar
     )
-    make_longitudinal_field(pb.P.D, cores=_cores, prog_bar=_bar)
+    make_longitudinal_field(pb.P.D)
     run_vtu(mesh, pb, *exported_vars, space=str(pb.P.D / "Xi.INIT"), cores=_cores)
+    export_chrome_trace(pb.P.D / "trace.json")
 
 
 def main_cli(**kwargs: Unpack[MainSimKwargs]) -> None:
@@ -8,7 +8,13 @@
 from pathlib import Path
 
 from aorta_personalization.mesh._types import BCPatchTag
-from aorta_personalization.mesh.types import CylinderDims, ElementTypes, Geometries, MeshInfo
+from aorta_personalization.mesh.types import (
+    BranchDims,
+    CylinderDims,
+    ElementTypes,
+    Geometries,
+    MeshInfo,
+)
 
 _DEFAULT_CYLINDER = CylinderDims(shape=(9.0, 12.0, 200.0), nelem=(2, 16, 64))
 
@@ -62,3 +68,27 @@ BULGE_CYLINDER_QUAD_MESH = MeshInfo(
     OUTER=BCPatchTag("outer", 4),
     ENDS=[1, 2],
 )
+BRANCHED_CYLINDER_QUAD_MESH = MeshInfo(
+    GEO=Geometries["BRANCHED_CYLINDER"],
+    DIR=Path("mesh_branched_cylinder"),
+    SPEC=CylinderDims(
+        shape=_DEFAULT_CYLINDER.shape,
+        nelem=_DEFAULT_CYLINDER.nelem,
+        structured=True,
+        branches=(
+            BranchDims(at=0.3, angle=90.0, nelem=(1, 4, 16)),
+            BranchDims(at=0.7, angle=270.0, nelem=(1, 4, 16)),
+        ),
+    ),
+    DISP="cyl_quad",
+    PRES="cyl_lin",
+    ELEM=ElementTypes["HEX"],
+    ORDER=2,
+    FIELD="CenterLineField-0.D",
+    NORMAL="CenterNormalField-0.D",
+    INLET=BCPatchTag("inlet", 1),
+    OUTLET=BCPatchTag("outlet", 2),
+    INNER=BCPatchTag("inner", 3),
+    OUTER=BCPatchTag("outer", 4),
+    ENDS=[1, 2, 5, 6],
+)
@@ -53,10 +53,14 @@ def create_pfile[F: np.floating, I: np.integer](
     prob.P.D.mkdir(parents=True, exist_ok=True)
     time = create_time_scheme("time", prob.t0, prob.nt, prob.dt)
     tops, interfaces = create_topology_list(mesh)
-    field = create_variable("CLField", tops.U, 2, mesh.DIR / mesh.FIELD, freq=prob.ex_freq)
+    field = create_variable(
+        "CLField", tops.U, 2, mesh.DIR / mesh.FIELD, freq=prob.export_frequency("CLField")
+    )
     cl_top, cl_interfaces = create_centerline_topology_list(mesh, tops, cl, field).unwrap()
-    svars = create_solid_vars(tops, tops.U, freq=prob.ex_freq)
-    lm_cl = create_lm_on_cl(cl_top, 3, freq=prob.ex_freq)
+    svars = create_solid_vars(
+        tops, tops.U, freq=prob.export_frequency("Space", "Disp", "Pres", "Stiff")
+    )
+    lm_cl = create_lm_on_cl(cl_top, 3, freq=prob.export_frequency(f"{prob.P.CL}LM"))
     motion_var = create_motion_variable(prob.motion_var, "CLDisp", tops, prob).unwrap()
     pres_expr = create_pres_expressions("loading_pres_expr", "ramp", amp=prob.pres)
     stiff_expr = create_stiffness_expressions(prob.matpars, field=field).unwrap()
@@ -69,7 +73,7 @@ def create_pfile[F: np.floating, I: np.integer](
     )
     solid_matrix.add_setting("ordering", "parallel")
     solid_matrix.add_setting("SolverMatrixCalculation", "evaluate_every_build")
-    strain_var = create_variable("Strain", tops.P, 9, freq=prob.ex_freq)
+    strain_var = create_variable("Strain", tops.P, 9, freq=prob.export_frequency("Strain"))
     strain_prob = L2SolidProjection(
         "strain_prob", svars.X, strain_var, solid_prob, "deformation_gradient"
     )
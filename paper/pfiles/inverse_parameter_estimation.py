@@ -60,18 +60,31 @@ def create_inverse_pfile[F: np.floating, I: np.integer](
     Path(prob.P.D).mkdir(parents=True, exist_ok=True)
     time = create_time_scheme("time", prob.t0, prob.nt, prob.dt)
     tops, interfaces = create_topology_list(mesh)
-    field = create_variable("CLField", tops.U, 2, mesh.DIR / mesh.FIELD, freq=prob.ex_freq)
+    field = create_variable(
+        "CLField", tops.U, 2, mesh.DIR / mesh.FIELD, freq=prob.export_frequency("CLField")
+    )
     cl_top, cl_interfaces = create_centerline_topology_list(mesh, tops, cl, field).unwrap()
     dl_top, dl_interfaces = create_centerline_topology_list(mesh, tops, dl, field).unwrap()
     # Initial Solid variable
     svar = {
-        s: create_solid_vars(tops, tops.U, freq=prob.ex_freq, pfx=("X", "U", "P"), sfx=s)
+        s: create_solid_vars(
+            tops,
+            tops.U,
+            freq=prob.export_frequency(f"X{s}", f"U{s}", f"P{s}"),
+            pfx=("X", "U", "P"),
+            sfx=s,
+        )
         for s in ["i", "0", "t"]
     }
     [set_solid_ic(s, root=prob.P.D) for s in svar.values()]
     # Lagrange multipliers
-    lm = {s: create_lm_on_cl(cl_top, 3, freq=prob.ex_freq, sfx=f"{s}LM") for s in ["0", "t"]}
-    dm = create_dm_on_cl(dl_top, dl_top.nn, freq=prob.ex_freq)
+    lm = {
+        s: create_lm_on_cl(
+            cl_top, 3, freq=prob.export_frequency(f"{prob.P.CL}{s}LM"), sfx=f"{s}LM"
+        )
+        for s in ["0", "t"]
+    }
+    dm = create_dm_on_cl(dl_top, dl_top.nn, freq=prob.export_frequency("DM"))
     [set_clvar_ic(v, prob.P.D / f"{v}.INIT") for v in [*lm.values(), dm]]
     stiffness = create_stiffness_expressions(dm, top=dl_top).unwrap()
     # Loading and BCs
@@ -102,6 +115,8 @@ def create_inverse_pfile[F: np.floating, I: np.integer](
             state_vars=[dm],
             bcs=bcs[s],
             pres=pres[s] if s == "0" else None,
+            # rebuilt from DM in postprocessing
+            stiff=None,
         )
         for s in ["0", "t"]
     }
@@ -8,11 +8,26 @@
 from pathlib import Path
 from typing import Literal
 
-from aorta_personalization.problem.types import Labels, MaterialProperty, ProblemParameters
+from aorta_personalization.problem.api import merge_output_plans, reference_data_output_plan
+from aorta_personalization.problem.types import (
+    Labels,
+    MaterialProperty,
+    OutputPlan,
+    ProblemParameters,
+)
 
 _stiffness: float = 30.0
 _mode: list[Literal["const", "grad", "sine", "circ"]] = ["sine", "grad"]
 _target: float = 0.5
+_nt: int = 100
+# forward runs feed the inverse reference data and the figures (make_figures.REF_MAP), the
+# other exported fields follow the same steps so that every vtu frame has all variables
+_FORWARD_OUTPUTS = merge_output_plans(
+    reference_data_output_plan(_target, _nt),
+    OutputPlan(dict.fromkeys(["Disp", "CLField", "Strain"], frozenset({int(_target * _nt), _nt}))),
+)
+# the figures compare U0, Ut and the stiffness (rebuilt from DM) at the final step
+_INVERSE_OUTPUTS = OutputPlan(dict.fromkeys(["U0", "Ut", "DM"], frozenset({_nt})))
 TRACKING_FORWARD_BULGE = ProblemParameters(
     P=Labels(
         N="tracking_bulge_raw",
@@ -33,6 +48,7 @@ TRACKING_FORWARD_BULGE = ProblemParameters(
     dt=0.01,
     nt=100,
     target=_target,
+    outputs=OutputPlan(full_history=True),
 )
 
 PROBS_FORWARD_STRAIGHT = {
@@ -57,6 +73,7 @@ PROBS_FORWARD_STRAIGHT = {
             dt=0.01,
             nt=100,
             target=_target,
+            outputs=_FORWARD_OUTPUTS,
         )
         for i in [2, 4, 8, 16]
     ]
@@ -85,6 +102,7 @@ PROBS_FORWARD_BENT = {
             dt=0.01,
             nt=100,
             target=_target,
+            outputs=_FORWARD_OUTPUTS,
         )
         for i in [2, 4, 8, 16]
     ]
@@ -113,6 +131,7 @@ PROBS_FORWARD_BULGE = {
             dt=0.01,
             nt=100,
             target=_target,
+            outputs=_FORWARD_OUTPUTS,
         )
         for i in [2, 4, 8, 16]
     ]
@@ -142,6 +161,7 @@ PROBS_INVERSE_STRAIGHT = {
             dt=0.01,
             nt=100,
             target=_target,
+            outputs=_INVERSE_OUTPUTS,
         )
         for i in [2, 4, 8, 16]
     ]
@@ -169,6 +189,7 @@ PROBS_NOISE_STRAIGHT = [
         dt=0.01,
         nt=100,
         target=_target,
+        outputs=_INVERSE_OUTPUTS,
         spac=j,
         noise=n,
     )
@@ -202,6 +223,7 @@ PROBS_INVERSE_BENT = {
             dt=0.01,
             nt=100,
             target=_target,
+            outputs=_INVERSE_OUTPUTS,
         )
         for i in [2, 4, 8, 16]
     ]
@@ -230,6 +252,7 @@ PROBS_NOISE_BENT = [
         dt=0.01,
         nt=100,
         target=_target,
+        outputs=_INVERSE_OUTPUTS,
         spac=j,
         noise=n,
     )
@@ -263,6 +286,7 @@ PROBS_INVERSE_BULGE = {
             dt=0.01,
             nt=100,
             target=_target,
+            outputs=_INVERSE_OUTPUTS,
         )
         for i in [2, 4, 8, 16]
     ]
@@ -291,6 +315,7 @@ PROBS_NOISE_BULGE = [
         dt=0.01,
         nt=100,
         target=_target,
+        outputs=_INVERSE_OUTPUTS,
         spac=j,
         noise=n,
     )
@@ -0,0 +1,57 @@
+# /// script
+# require-python = ">=3.14"
+# dependencies = [
+#     "numpy",
+#     "cheartpy",
+#     "aorta_personalization"
+# ]
+# ///
+
+import dataclasses as dc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from aorta_personalization.prep.api import calibrate_scaling, run_setup, run_simulation
+from meshes import BENT_CYLINDER_QUAD_MESH, STRAIGHT_CYLINDER_QUAD_MESH
+from pfiles.forward_centerline_constrained import create_pfile as create_forward_pfile
+from problems import PROBS_FORWARD_BENT, PROBS_FORWARD_STRAIGHT
+from pytools.logging import get_logger
+from pytools.path import clear_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from aorta_personalization.mesh.types import MeshInfo
+    from aorta_personalization.problem.types import ProblemParameters
+
+
+_CORES = [1, 2, 4, 8, 16, 32]
+_CALIBRATION_STEPS = 10
+_STORE = Path("scaling.json")
+
+
+def calibrate_forward(pb: ProblemParameters, mesh: MeshInfo, cores: Sequence[int]) -> None:
+    log = get_logger(level="INFO")
+    # a few load steps are enough to measure the per-step cost
+    label = dc.replace(pb.P, N=f"scaling/{Path(pb.P.N).name}", D=Path("scaling") / pb.P.D.name)
+    short = dc.replace(pb, P=label, nt=_CALIBRATION_STEPS)
+    short.P.D.mkdir(parents=True, exist_ok=True)
+    _, cl_top, _ = run_setup(short, mesh, log=log).unwrap()
+
+    def _run(p: int) -> None:
+        clear_dir(short.P.D)
+        run_simulation(create_forward_pfile, short, mesh, cl_top, log=log, cores=p)
+
+    calibrate_scaling(_run, short, mesh, cores, log=log, store=_STORE).unwrap()
+
+
+def main_cli() -> None:
+    # the material law does not change the cost, one mode per CL size is enough
+    for p in next(iter(PROBS_FORWARD_STRAIGHT.values())):
+        calibrate_forward(p, STRAIGHT_CYLINDER_QUAD_MESH, _CORES)
+    for p in next(iter(PROBS_FORWARD_BENT.values())):
+        calibrate_forward(p, BENT_CYLINDER_QUAD_MESH, _CORES)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,26 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, MutableMapping
+
+
+def lazy_getattr(
+    namespace: MutableMapping[str, Any], attrs: Mapping[str, str]
+) -> Callable[[str], object]:
+    """Module level __getattr__ (PEP 562) importing attrs[name] from its submodule on first use.
+
+    The resolved object is stored in the module namespace, so later lookups are plain
+    attribute accesses.
+    """
+    module_name, package = namespace["__name__"], namespace["__package__"]
+
+    def __getattr__(name: str) -> object:  # noqa: N807
+        if (submodule := attrs.get(name)) is None:
+            msg = f"module {module_name!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(import_module(submodule, package), name)
+        namespace[name] = value
+        return value
+
+    return __getattr__
@@ -1,36 +1,104 @@
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 from aorta_personalization.mesh._types import MeshTuple
-from cheartpy.io.api import chread_d, chwrite_d_utf
+from aorta_personalization.storage.api import (
+    TIMESERIES_META,
+    TimeSeriesStore,
+    chread_d,
+    chwrite_d_utf,
+    is_up_to_date,
+)
+from cheartpy.io.api import fix_ch_sfx
 from cheartpy.mesh.api import import_cheart_mesh
 from pytools.path import clear_dir
 from pytools.result import Err, Ok
 
+from ._parameterize import patch_nodes, vessel_fields
+from ._structured import read_ch_array
+
 if TYPE_CHECKING:
-    import numpy as np
     from aorta_personalization.mesh._types import MeshInfo
+    from pytools.arrays import A2
     from pytools.logging import ILogger
 
 
 _MRI_DIR = Path("DATA_AORTA")
+# written by ingest_tracked_sequence, used instead of the text frames when present
+_MRI_STORE = "tracked_store"
+_MRI_MESH = "model_Tracked_forward"
+_MRI_FIELDS = ("CenterLineField-0.D", "CenterNormalField-0.D")
+
+
+def aorta_data_root(mesh: MeshInfo) -> Path:
+    return _MRI_DIR if mesh.DATA is None else mesh.DATA
+
+
+def _use_store(root: Path, step: int) -> bool:
+    """The store is read unless a text file it is ingested from was written after it."""
+    meta = root / _MRI_STORE / TIMESERIES_META
+    text = [root / f"TrackedSpace-{step}.D", *(root / f for f in _MRI_FIELDS)]
+    return meta.is_file() and is_up_to_date(meta, *text)
+
+
+def aorta_sources(mesh: MeshInfo, step: int = 2) -> list[Path]:
+    """The patient files setup_aorta_mesh builds mesh.DIR from."""
+    root = aorta_data_root(mesh)
+    sources = [root / f"{fix_ch_sfx(_MRI_MESH)}{ext}" for ext in ("X", "T", "B")]
+    if _use_store(root, step):
+        return [*sources, root / _MRI_STORE / TIMESERIES_META]
+    # precomputed fields are optional, without them they are derived from the mesh itself
+    fields = [root / f for f in _MRI_FIELDS if (root / f).is_file()]
+    return [*sources, root / f"TrackedSpace-{step}.D", *fields]
+
+
+def aorta_mesh_is_current(mesh: MeshInfo, step: int = 2) -> bool:
+    """True if mesh.DIR holds a mesh written after every patient file it is built from."""
+    sources = aorta_sources(mesh, step)
+    disp = fix_ch_sfx(mesh.DISP)
+    outputs = [mesh.DIR / f"{disp}{ext}" for ext in ("X", "T", "B")]
+    outputs += [mesh.DIR / mesh.FIELD, mesh.DIR / mesh.NORMAL]
+    return all(f.is_file() for f in sources) and all(is_up_to_date(f, *sources) for f in outputs)
 
 
 def setup_aorta_mesh(
     mesh: MeshInfo, step: int = 2, *, log: ILogger
 ) -> Ok[MeshTuple[np.float64, np.intc]] | Err:
-    log.debug(f"Reading tracked MRI data from {_MRI_DIR}")
-    match import_cheart_mesh(_MRI_DIR / "model_Tracked_forward"):
+    root = aorta_data_root(mesh)
+    store_dir = root / _MRI_STORE
+    log.debug(f"Reading tracked MRI data from {root}")
+    match import_cheart_mesh(root / _MRI_MESH):
         case Ok(disp_mesh):
-            mesh.DIR.mkdir(exist_ok=True)
+            mesh.DIR.mkdir(parents=True, exist_ok=True)
         case Err(e):
             return Err(e)
-    log.debug(f"Updating space from {_MRI_DIR / f'TrackedSpace-{step}.D'}")
-    disp_mesh.space.v = chread_d(_MRI_DIR / f"TrackedSpace-{step}.D")
-    log.debug(f"Reading CL field from {_MRI_DIR / 'CenterLineField-0.D'}")
-    cl = chread_d(_MRI_DIR / "CenterLineField-0.D")
-    log.debug(f"Reading normals from {_MRI_DIR / 'CenterNormalField-0.D'}")
-    normal = chread_d(_MRI_DIR / "CenterNormalField-0.D")
+    fields: list[A2[np.float64]] = []
+    use_store = _use_store(root, step)
+    if not use_store and (store_dir / TIMESERIES_META).is_file():
+        log.info(f"{store_dir} is older than the text data in {root}, reading the text files")
+    if use_store:
+        log.debug(f"Reading space, CL field and normals from the store {store_dir}")
+        try:
+            store = TimeSeriesStore.open(store_dir)
+            disp_mesh.space.v = np.array(store.frame(step))
+            if all(f in store.fields for f in _MRI_FIELDS):
+                fields = [np.array(store.field(f)) for f in _MRI_FIELDS]
+        except (OSError, KeyError, ValueError) as e:
+            return Err(e)
+    else:
+        log.debug(f"Updating space from {root / f'TrackedSpace-{step}.D'}")
+        disp_mesh.space.v = chread_d(root / f"TrackedSpace-{step}.D")
+        if all((root / f).is_file() for f in _MRI_FIELDS):
+            log.debug(f"Reading CL field and normals from {root}")
+            fields = [chread_d(root / f) for f in _MRI_FIELDS]
+    if fields:
+        cl, normal = fields
+    else:
+        log.info(f"No CL field and normals in {root}, computing them from the mesh")
+        _, bnd = read_ch_array(root / f"{fix_ch_sfx(_MRI_MESH)}B", np.intp)
+        inlet, outlet = patch_nodes(bnd, mesh.INLET.side), patch_nodes(bnd, mesh.OUTLET.side)
+        cl, normal, _ = vessel_fields(disp_mesh.space.v, disp_mesh.top.v, inlet, outlet)
     log.debug(f"Mesh will be saved to {mesh.DIR}")
     clear_dir(mesh.DIR)
     disp_mesh.save(mesh.DIR / mesh.DISP)
@@ -0,0 +1,409 @@
+from typing import TYPE_CHECKING, Literal, NamedTuple
+
+import numpy as np
+from aorta_personalization.storage.api import chwrite_d_utf
+from pytools.path import clear_dir
+
+from ._cache import load_mesh_tuple
+from ._structured import StructuredCylinder, StructuredMesh, element_template, save_structured_mesh
+
+if TYPE_CHECKING:
+    from pytools.arrays import A1, A2, A3
+    from pytools.logging import ILogger
+
+    from ._structured import _Template
+    from ._types import CylinderDims, MeshInfo, MeshTuple
+
+
+# patch tags of the branch ends follow the four of the main cylinder
+_FIRST_BRANCH_TAG = 5
+# fraction of the branch length over which its root window is morphed into a circular tube
+_BLEND = 0.3
+# collars wrapped further around the main vessel fold their corner elements on the way up
+_MAX_COLLAR_ARC = 0.375
+
+
+class _Window(NamedTuple):
+    """Root of a branch in main element units: window [t0, t0 + m) x [x0, x0 + m), collar w."""
+
+    t0: int
+    x0: int
+    m: int
+    w: int
+    nz: int
+    length: float
+    tag: int
+
+
+class BranchedFields(NamedTuple):
+    cl: A2[np.float64]
+    normal: A2[np.float64]
+    fibers: A2[np.float64]
+    branch_cl: dict[int, A2[np.float64]]
+
+
+class BranchedCylinder(NamedTuple):
+    mesh: StructuredCylinder
+    fields: BranchedFields
+
+
+def branch_ends(spec: CylinderDims) -> dict[int, Literal[2, 3]]:
+    """Patch tag of each branch end and the displacement component along that branch."""
+    ends: dict[int, Literal[2, 3]] = {}
+    for i, b in enumerate(spec.branches):
+        q = np.deg2rad(b.angle)
+        ends[_FIRST_BRANCH_TAG + i] = 2 if abs(np.cos(q)) >= abs(np.sin(q)) else 3
+    return ends
+
+
+def _windows(spec: CylinderDims) -> list[_Window]:
+    _, nc, nx = spec.nelem
+    windows: list[_Window] = []
+    for i, b in enumerate(spec.branches):
+        w, m, nz = b.nelem
+        t0 = round(b.angle / 360.0 * nc - 0.5 * m) % nc
+        x0 = round(b.at * nx - 0.5 * m)
+        if x0 - w < 1 or x0 + m + w > nx - 1:
+            msg = f"Branch {i} with {w} collar and {m} window elements does not fit at {b.at}"
+            raise ValueError(msg)
+        if m + 2 * w > _MAX_COLLAR_ARC * nc:
+            msg = f"Branch {i} spans {m + 2 * w} of {nc} elements around the main vessel"
+            raise ValueError(msg)
+        windows.append(_Window(t0, x0, m, w, nz, b.length, _FIRST_BRANCH_TAG + i))
+    for i, a in enumerate(windows):
+        for b in windows[:i]:
+            dt = (b.t0 - a.t0) % nc
+            overlap_t = dt < a.m + a.w + b.w or nc - dt < b.m + a.w + b.w
+            overlap_x = abs((a.x0 + 0.5 * a.m) - (b.x0 + 0.5 * b.m)) < 0.5 * (a.m + b.m) + a.w + b.w
+            if overlap_t and overlap_x:
+                msg = f"The collars of branch ends {a.tag} and {b.tag} overlap"
+                raise ValueError(msg)
+    return windows
+
+
+def _face_slots(tmpl: _Template) -> dict[tuple[int, bool], A1[np.intp]]:
+    """Local face nodes by (lattice axis, at max), in the order create_cylinder_mesh uses.
+
+    Circumferential faces are never tagged on a cylinder, their order is taken from the
+    longitudinal faces by the cyclic axis permutation (r, theta, x) -> (theta, x, r), which
+    keeps the orientation.
+    """
+    slots = {(f.axis, f.at_max): f.slots for f in tmpl.faces}
+    lookup = {tuple(o): k for k, o in enumerate(tmpl.offsets)}
+    for at_max in (False, True):
+        old = tmpl.offsets[slots[2, at_max]]
+        slots[1, at_max] = np.array([lookup[(o[1], o[2], o[0])] for o in old], dtype=np.intp)
+    return slots
+
+
+def _tags(tmpl: _Template) -> dict[tuple[int, bool], int]:
+    tags = {(f.axis, f.at_max): f.tag for f in tmpl.faces}
+    if max(tags.values()) >= _FIRST_BRANCH_TAG:
+        msg = f"Cylinder patch tags {sorted(tags.values())} collide with the branch end tags"
+        raise ValueError(msg)
+    return tags
+
+
+class _Lattice(NamedTuple):
+    """Node lattice of one block at resolution k per element, and its node positions."""
+
+    keep: A3[np.bool_]
+    vertex: A3[np.bool_]
+    space: A2[np.float64]
+
+
+def _main_lattice(
+    dims: tuple[float, float, float], nelem: tuple[int, int, int], windows: list[_Window], k: int
+) -> _Lattice:
+    nr, nc, nx = nelem
+    shape = (k * nx + 1, k * nc, k * nr + 1)
+    ix, it, ir = np.indices(shape, sparse=True)
+    keep = np.ones(shape, dtype=bool)
+    for win in windows:
+        rel = (it - k * win.t0) % (k * nc)
+        hole = (rel > 0) & (rel < k * win.m) & (ix > k * win.x0) & (ix < k * (win.x0 + win.m))
+        keep &= ~hole
+    vertex = (ix % k == 0) & (it % k == 0) & (ir % k == 0)
+    ix, it, ir = (a.ravel() for a in np.indices(shape))
+    r = dims[0] + (dims[1] - dims[0]) * ir / (k * nr)
+    q = 2.0 * np.pi * it / (k * nc)
+    space = np.column_stack((dims[2] * ix / (k * nx), r * np.cos(q), r * np.sin(q)))
+    return _Lattice(keep, np.broadcast_to(vertex, shape), space)
+
+
+class _BranchGeometry(NamedTuple):
+    blend: A1[np.float64]
+    s: A1[np.float64]
+    phi: A1[np.float64]
+    base_normal: A2[np.float64]
+    axis: A1[np.float64]
+    root: A1[np.float64]
+
+
+def _branch_lattice(
+    dims: tuple[float, float, float], nelem: tuple[int, int, int], win: _Window, k: int
+) -> tuple[_Lattice, _BranchGeometry]:
+    """Collar block of a branch on its (u, v, z) lattice, u and v follow theta and x at the root.
+
+    Every node starts on the outer wall of the main cylinder, rises along the branch axis and
+    is moved from its rectangular ring about the window onto a circle over the first _BLEND of
+    the branch length.
+    """
+    r_in, r_out, length = dims
+    _, nc, nx = nelem
+    n = win.m + 2 * win.w
+    shape = (k * n + 1, k * n + 1, k * win.nz + 1)
+    iu, iv, iz = np.indices(shape, sparse=True)
+    lo, hi = k * win.w, k * (win.w + win.m)
+    keep = np.broadcast_to(~((iu > lo) & (iu < hi) & (iv > lo) & (iv < hi)), shape)
+    vertex = np.broadcast_to((iu % k == 0) & (iv % k == 0) & (iz % k == 0), shape)
+    iu, iv, iz = (a.ravel() for a in np.indices(shape))
+    q = 2.0 * np.pi * (k * (win.t0 - win.w) + iu) / (k * nc)
+    x = length * (k * (win.x0 - win.w) + iv) / (k * nx)
+    qc = 2.0 * np.pi * (win.t0 + 0.5 * win.m) / nc
+    xc = length * (win.x0 + 0.5 * win.m) / nx
+    axis = np.array([0.0, np.cos(qc), np.sin(qc)])
+    e_q = np.array([0.0, -np.sin(qc), np.cos(qc)])
+    e_x = np.array([1.0, 0.0, 0.0])
+    base_normal = np.column_stack((np.zeros_like(q), np.cos(q), np.sin(q)))
+    base = r_out * base_normal
+    base[:, 0] = x
+    # rectangular ring about the window each node sits on, in element units
+    du = np.maximum(0, np.maximum(lo - iu, iu - hi)) / k
+    dv = np.maximum(0, np.maximum(lo - iv, iv - hi)) / k
+    ring = np.maximum(du, dv)
+    hu, hv = r_out * 2.0 * np.pi / nc, length / nx
+    pu, pv = r_out * (q - qc), x - xc
+    phi = np.arctan2(pv / (hv * (0.5 * win.m + ring)), pu / (hu * (0.5 * win.m + ring)))
+    rho = np.sqrt(0.25 * win.m * win.m * hu * hv) + ring / win.w * (r_out - r_in)
+    s = iz / (k * win.nz)
+    blend = np.minimum(1.0, s / _BLEND)
+    root = r_out * axis + xc * e_x
+    circle = root + rho[:, None] * (np.cos(phi)[:, None] * e_q + np.sin(phi)[:, None] * e_x)
+    space = base + (s * win.length)[:, None] * axis + blend[:, None] * (circle - base)
+    geo = _BranchGeometry(blend, s, phi, base_normal, axis, root)
+    return _Lattice(keep, vertex, space), geo
+
+
+def _number(
+    main: _Lattice, branches: list[_Lattice], windows: list[_Window], nc: int, k: int
+) -> tuple[list[A3[np.intp]], A2[np.float64], int]:
+    """Global node numbers and positions, vertex nodes first.
+
+    The root layer of each branch is not numbered again, it is the outer wall of the main block.
+    Also returns the number of vertex nodes, i.e. the nodes of the linear mesh.
+    """
+    blocks = [main, *branches]
+    ids = [np.full(b.keep.shape, -1, dtype=np.intp) for b in blocks]
+    own = [main.keep] + [b.keep & (np.arange(b.keep.shape[2]) > 0) for b in branches]
+    chunks: list[A2[np.float64]] = []
+    count, nv = 0, 0
+    for vertex in (True, False):
+        for num, block, mask in zip(ids, blocks, own, strict=True):
+            sel = mask & (block.vertex == vertex)
+            n = int(sel.sum())
+            num[sel] = np.arange(count, count + n)
+            chunks.append(block.space[sel.ravel()])
+            count += n
+        nv = nv or count
+    for num, block, win in zip(ids[1:], branches, windows, strict=True):
+        num[..., 0] = np.where(block.keep[..., 0], _root_ids(ids[0], win, nc, k), -1)
+    return ids, np.vstack(chunks), nv
+
+
+def _root_ids(main_ids: A3[np.intp], win: _Window, nc: int, k: int) -> A2[np.intp]:
+    n = k * (win.m + 2 * win.w) + 1
+    iu, iv = np.indices((n, n))
+    it = (k * (win.t0 - win.w) + iu) % (k * nc)
+    ix = k * (win.x0 - win.w) + iv
+    return main_ids[ix, it, -1]
+
+
+def _patch(
+    top: A2[np.intp], elems: A1[np.intp], slots: A1[np.intp], tag: int, base: int
+) -> A2[np.intp]:
+    tags = np.full_like(elems, tag)
+    return np.column_stack((elems + base, top[elems][:, slots] + 1, tags))
+
+
+def _build(
+    nelem: tuple[int, int, int],
+    windows: list[_Window],
+    ids: list[A3[np.intp]],
+    k: int,
+    tmpl: _Template,
+) -> tuple[A2[np.intp], A2[np.intp]]:
+    nr, nc, nx = nelem
+    o, s = tmpl.offsets, k // tmpl.order
+    slots, tags = _face_slots(tmpl), _tags(tmpl)
+    inner, outer = tags[0, False], tags[0, True]
+    ex, et, er = (a.ravel() for a in np.indices((nx, nc, nr)))
+    removed = np.zeros_like(ex, dtype=bool)
+    collar = np.zeros_like(ex, dtype=bool)
+    for win in windows:
+        rel = (et - win.t0) % nc
+        in_x = (ex >= win.x0) & (ex < win.x0 + win.m)
+        removed |= (rel < win.m) & in_x
+        rel_c = (et - win.t0 + win.w) % nc
+        collar |= (rel_c < win.m + 2 * win.w) & (ex >= win.x0 - win.w) & (
+            ex < win.x0 + win.m + win.w
+        )
+    ex, et, er = ex[~removed], et[~removed], er[~removed]
+    collar = collar[~removed]
+    tops = [
+        ids[0][
+            k * ex[:, None] + s * o[:, 2],
+            (k * et[:, None] + s * o[:, 1]) % (k * nc),
+            k * er[:, None] + s * o[:, 0],
+        ]
+    ]
+    faces: list[tuple[A1[np.bool_], tuple[int, bool], int]] = [
+        (ex == 0, (2, False), tags[2, False]),
+        (ex == nx - 1, (2, True), tags[2, True]),
+        (er == 0, (0, False), inner),
+        ((er == nr - 1) & ~collar, (0, True), outer),
+    ]
+    for win in windows:
+        rel = (et - win.t0) % nc
+        in_x = (ex >= win.x0) & (ex < win.x0 + win.m)
+        in_t = rel < win.m
+        # the cut through the main wall is part of the lumen surface
+        faces += [
+            ((rel == nc - 1) & in_x, (1, True), inner),
+            ((rel == win.m) & in_x, (1, False), inner),
+            ((ex == win.x0 - 1) & in_t, (2, True), inner),
+            ((ex == win.x0 + win.m) & in_t, (2, False), inner),
+        ]
+    top = tops[0]
+    patches = [_patch(top, np.flatnonzero(m), slots[f], t, tmpl.elem_base) for m, f, t in faces]
+    offset = len(top)
+    for win, num in zip(windows, ids[1:], strict=True):
+        n = win.m + 2 * win.w
+        eu, ev, ez = (a.ravel() for a in np.indices((n, n, win.nz)))
+        hole = (eu >= win.w) & (eu < win.w + win.m) & (ev >= win.w) & (ev < win.w + win.m)
+        eu, ev, ez = eu[~hole], ev[~hole], ez[~hole]
+        # (r, theta, x) of the local layout map to (z, u, v), the same orientation at the root
+        btop = num[
+            k * eu[:, None] + s * o[:, 1],
+            k * ev[:, None] + s * o[:, 2],
+            k * ez[:, None] + s * o[:, 0],
+        ]
+        lo, hi = win.w, win.w + win.m
+        in_u, in_v = (eu >= lo) & (eu < hi), (ev >= lo) & (ev < hi)
+        bfaces = [
+            (ez == win.nz - 1, (0, True), win.tag),
+            ((eu == lo - 1) & in_v, (1, True), inner),
+            ((eu == hi) & in_v, (1, False), inner),
+            ((ev == lo - 1) & in_u, (2, True), inner),
+            ((ev == hi) & in_u, (2, False), inner),
+            (eu == 0, (1, False), outer),
+            (eu == n - 1, (1, True), outer),
+            (ev == 0, (2, False), outer),
+            (ev == n - 1, (2, True), outer),
+        ]
+        patches += [
+            _patch(btop, np.flatnonzero(m), slots[f], t, tmpl.elem_base + offset)
+            for m, f, t in bfaces
+        ]
+        tops.append(btop)
+        offset += len(btop)
+    top = np.vstack(tops)
+    if (top < 0).any():
+        msg = "Branched cylinder elements reference removed nodes"
+        raise ValueError(msg)
+    return top, np.vstack(patches)
+
+
+def _fields(
+    space: A2[np.float64],
+    dims: tuple[float, float, float],
+    windows: list[_Window],
+    branches: list[tuple[A3[np.intp], _BranchGeometry]],
+) -> BranchedFields:
+    """CL field of the main vessel, branch nodes take the value at their root.
+
+    Each branch also gets its own (s, circumferential) field, zero off the branch. Normals and
+    the longitudinal fiber direction turn from those of the main wall to the branch axis along
+    with the shape of the branch.
+    """
+    r_out, length = dims[1], dims[2]
+    nn = len(space)
+    cl = np.column_stack((space[:, 0] / length, (space[:, 2] + r_out) / (2.0 * r_out)))
+    normal = np.zeros((nn, 3))
+    normal[:, 1:] = space[:, 1:]
+    along = np.zeros((nn, 3))
+    along[:, 0] = 1.0
+    branch_cl: dict[int, A2[np.float64]] = {}
+    for win, (num, geo) in zip(windows, branches, strict=True):
+        ids = num.ravel()
+        own = (ids >= 0) & (geo.s > 0.0)
+        nodes, b = ids[own], geo.blend[own][:, None]
+        cl[nodes] = [geo.root[0] / length, (geo.root[2] + r_out) / (2.0 * r_out)]
+        e_q = np.array([0.0, -geo.axis[2], geo.axis[1]])
+        circ = np.cos(geo.phi[own])[:, None] * e_q
+        circ[:, 0] += np.sin(geo.phi[own])
+        normal[nodes] = (1.0 - b) * geo.base_normal[own] + b * circ
+        along[nodes] = (1.0 - b) * np.array([1.0, 0.0, 0.0]) + b * geo.axis
+        field = np.zeros((nn, 2))
+        field[nodes, 0] = geo.s[own]
+        field[nodes, 1] = np.mod(geo.phi[own], 2.0 * np.pi) / (2.0 * np.pi)
+        branch_cl[win.tag] = field
+    normal /= np.linalg.norm(normal, axis=-1)[:, None]
+    along -= normal * np.einsum("nd,nd->n", along, normal)[:, None]
+    along /= np.linalg.norm(along, axis=-1)[:, None]
+    # same column layout as create_fiber_field: longitudinal, circumferential (r x z), radial
+    fibers = np.hstack((along, np.cross(normal, along), normal))
+    return BranchedFields(cl, normal, fibers, branch_cl)
+
+
+def branched_cylinder(
+    dims: tuple[float, float, float], spec: CylinderDims, *, quad: bool
+) -> BranchedCylinder:
+    """Cylinder along x with side branches, built block-wise with index arithmetic only.
+
+    Each branch removes a window of elements through the main wall and grows from the ring of
+    outer wall faces (the collar) around it, so the mesh is conforming and the lumen continues
+    into the branch. Layouts, face orders and tags follow create_cylinder_mesh; branch i ends
+    on patch 5 + i. With quad the pressure mesh is the leading vertex sub-mesh.
+    """
+    disp_tmpl, pres_tmpl = element_template(quad=quad)
+    k = disp_tmpl.order
+    windows = _windows(spec)
+    main = _main_lattice(dims, spec.nelem, windows, k)
+    branches = [_branch_lattice(dims, spec.nelem, win, k) for win in windows]
+    ids, space, nv = _number(main, [b for b, _ in branches], windows, spec.nelem[1], k)
+    top, bnd = _build(spec.nelem, windows, ids, k, disp_tmpl)
+    disp = StructuredMesh(space, top, bnd)
+    pres = disp
+    if pres_tmpl is not None:
+        top, bnd = _build(spec.nelem, windows, ids, k, pres_tmpl)
+        pres = StructuredMesh(space[:nv], top, bnd)
+    geos = [(num, geo) for num, (_, geo) in zip(ids[1:], branches, strict=True)]
+    return BranchedCylinder(StructuredCylinder(disp, pres), _fields(space, dims, windows, geos))
+
+
+def _branch_field_name(mesh: MeshInfo, tag: int) -> str:
+    return f"Branch{tag}{mesh.FIELD}"
+
+
+def remake_branched_mesh(
+    mesh: MeshInfo, dim: CylinderDims, *, quad: bool, log: ILogger
+) -> MeshTuple[np.float64, np.intc]:
+    """Regenerate a BRANCHED_CYLINDER and its fields in mesh.DIR.
+
+    Besides the usual CL, normal and fiber fields every branch gets Branch{tag}{mesh.FIELD}.
+    """
+    log.info(f"Clearing all files in {mesh.DIR}", f"Remaking branched mesh with Quad={quad}")
+    mesh.DIR.mkdir(exist_ok=True)
+    clear_dir(mesh.DIR)
+    res = branched_cylinder(dim.shape, dim, quad=quad)
+    fields = res.fields
+    written = [(mesh.FIELD, fields.cl), (mesh.NORMAL, fields.normal), ("Fibers-0.D", fields.fibers)]
+    written += [(f"{s}-0.D", fields.fibers[:, 3 * i : 3 * i + 3]) for i, s in enumerate("ZCR")]
+    written += [(_branch_field_name(mesh, tag), v) for tag, v in fields.branch_cl.items()]
+    for k, v in written:
+        chwrite_d_utf(mesh.DIR / k, v)
+    log.debug("Exporting branched cylinder fields to:", *[str(mesh.DIR / k) for k, _ in written])
+    save_structured_mesh(mesh.DIR / mesh.PRES, res.mesh.pres)
+    save_structured_mesh(mesh.DIR / mesh.DISP, res.mesh.disp)
+    return load_mesh_tuple(mesh).unwrap()
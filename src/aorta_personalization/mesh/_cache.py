@@ -0,0 +1,224 @@
+import dataclasses as dc
+import threading
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, Self
+
+import numpy as np
+from aorta_personalization.storage.api import chread_d
+from cheartpy.io.api import fix_ch_sfx
+from cheartpy.mesh.api import import_cheart_mesh
+from pytools.result import Err, Ok
+
+from ._types import MeshTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+    from ._types import MeshInfo
+
+
+# (path, st_mtime_ns, st_size) of every file a cached entry was parsed from
+type FileStamp = tuple[tuple[str, int, int], ...]
+
+_ALIGN = 64
+_LOCK = threading.Lock()
+_CACHE: dict[Path, tuple[FileStamp, MeshTuple[np.float64, np.intc]]] = {}
+# segments attached in a worker process, kept open for as long as their arrays are in use
+_ATTACHED: dict[str, SharedMemory] = {}
+
+
+def mesh_files(mesh: MeshInfo) -> list[Path]:
+    disp = fix_ch_sfx(mesh.DISP)
+    return [mesh.DIR / f"{disp}{ext}" for ext in ("X", "T", "B")] + [mesh.DIR / mesh.FIELD]
+
+
+def file_stamp(files: list[Path]) -> FileStamp:
+    stamp: list[tuple[str, int, int]] = []
+    for f in files:
+        st = f.stat()
+        stamp.append((str(f), st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+def read_topology_header(file: Path) -> tuple[int, int]:
+    """Element and node counts from the first line of a CHeart topology file."""
+    with file.open("r") as f:
+        ne, nn, *_ = f.readline().split()
+    return int(ne), int(nn)
+
+
+def mesh_size(mesh: MeshInfo) -> tuple[int, int]:
+    """Element and node counts of the displacement mesh, from its topology header."""
+    return read_topology_header(mesh.DIR / (fix_ch_sfx(mesh.DISP) + "T"))
+
+
+def check_mesh_headers(mesh: MeshInfo) -> Ok[None] | Err:
+    """Check that the displacement and pressure meshes match without parsing either."""
+    try:
+        disp, _ = read_topology_header(mesh.DIR / (fix_ch_sfx(mesh.DISP) + "T"))
+        pres, _ = read_topology_header(mesh.DIR / (fix_ch_sfx(mesh.PRES) + "T"))
+    except (OSError, ValueError) as e:
+        return Err(e)
+    if disp != pres:
+        return Err(ValueError("Displacement and Pressure mesh do not match"))
+    return Ok(None)
+
+
+def load_mesh_tuple(mesh: MeshInfo) -> Ok[MeshTuple[np.float64, np.intc]] | Err:
+    """Parsed displacement mesh and centerline field of a mesh directory.
+
+    Entries are reused for as long as none of the source files changed (path, mtime and size).
+    Their arrays are shared between callers and therefore read-only, copy them before editing.
+    """
+    files = mesh_files(mesh)
+    try:
+        stamp = file_stamp(files)
+    except OSError as e:
+        return Err(e)
+    with _LOCK:
+        entry = _CACHE.get(mesh.DIR)
+    if entry is not None and entry[0] == stamp:
+        return Ok(entry[1])
+    match import_cheart_mesh(mesh.DIR / mesh.DISP):
+        case Ok(disp):
+            pass
+        case Err(e):
+            return Err(e)
+    res = MeshTuple(disp, chread_d(mesh.DIR / mesh.FIELD))
+    # an in-place edit by one caller would otherwise show up in every later hit
+    arrays: list[np.ndarray] = []
+    _flatten(res, arrays)
+    for a in arrays:
+        a.flags.writeable = False
+    with _LOCK:
+        _CACHE[mesh.DIR] = (stamp, res)
+    return Ok(res)
+
+
+def clear_mesh_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()
+
+
+class _ArraySpec(NamedTuple):
+    offset: int
+    shape: tuple[int, ...]
+    dtype: str
+
+
+def _flatten(obj: Any, arrays: list[np.ndarray]) -> Any:
+    match obj:
+        case np.ndarray():
+            arrays.append(obj)
+            return ("array", len(arrays) - 1)
+        case _ if dc.is_dataclass(obj) and not isinstance(obj, type):
+            fields = {f.name: _flatten(getattr(obj, f.name), arrays) for f in dc.fields(obj)}
+            return ("dataclass", type(obj), fields)
+        case tuple() if hasattr(obj, "_fields"):
+            return ("namedtuple", type(obj), [_flatten(v, arrays) for v in obj])
+        case tuple() | list():
+            return (type(obj).__name__, [_flatten(v, arrays) for v in obj])
+        case dict():
+            return ("dict", {k: _flatten(v, arrays) for k, v in obj.items()})
+        case _:
+            return ("value", obj)
+
+
+def _rebuild(spec: Any, arrays: list[np.ndarray]) -> Any:
+    match spec:
+        case ("array", idx):
+            return arrays[idx]
+        case ("dataclass", cls, fields):
+            return cls(**{k: _rebuild(v, arrays) for k, v in fields.items()})
+        case ("namedtuple", cls, items):
+            return cls(*(_rebuild(v, arrays) for v in items))
+        case ("tuple", items):
+            return tuple(_rebuild(v, arrays) for v in items)
+        case ("list", items):
+            return [_rebuild(v, arrays) for v in items]
+        case ("dict", items):
+            return {k: _rebuild(v, arrays) for k, v in items.items()}
+        case ("value", value):
+            return value
+    msg = f"Unknown shared mesh layout {spec!r}"
+    raise ValueError(msg)
+
+
+@dc.dataclass(slots=True, frozen=True)
+class SharedMeshHandle:
+    """Picklable description of one cached entry placed in a shared memory segment."""
+
+    directory: Path
+    stamp: FileStamp
+    segment: str
+    layout: Any
+    arrays: tuple[_ArraySpec, ...]
+
+
+class SharedMeshCache:
+    """Copies of the driver's mesh cache in shared memory, owned by the driver process.
+
+    Pass handles to worker processes (e.g. through the initargs of a ProcessPoolExecutor with
+    attach_mesh_cache as initializer); the segments are unlinked when the context exits.
+    """
+
+    __slots__ = ("_segments", "handles")
+
+    def __init__(self) -> None:
+        self._segments: list[SharedMemory] = []
+        self.handles: tuple[SharedMeshHandle, ...] = ()
+
+    def __enter__(self) -> Self:
+        with _LOCK:
+            entries = list(_CACHE.items())
+        self.handles = tuple(self._export(d, stamp, res) for d, (stamp, res) in entries)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        for shm in self._segments:
+            shm.close()
+            shm.unlink()
+        self._segments.clear()
+        self.handles = ()
+
+    def _export(self, directory: Path, stamp: FileStamp, res: MeshTuple) -> SharedMeshHandle:
+        arrays: list[np.ndarray] = []
+        layout = _flatten(res, arrays)
+        specs: list[_ArraySpec] = []
+        offset = 0
+        for a in arrays:
+            specs.append(_ArraySpec(offset, a.shape, a.dtype.str))
+            offset += -(-a.nbytes // _ALIGN) * _ALIGN
+        shm = SharedMemory(create=True, size=max(offset, 1))
+        self._segments.append(shm)
+        for a, spec in zip(arrays, specs, strict=True):
+            view = np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf, offset=spec.offset)
+            view[...] = a
+        return SharedMeshHandle(directory, stamp, shm.name, layout, tuple(specs))
+
+
+def attach_mesh_cache(handles: Iterable[SharedMeshHandle]) -> None:
+    """Seed this process's mesh cache from segments exported by the driver.
+
+    The arrays are read-only views into shared memory; entries whose source files changed since
+    the export are dropped by the usual stamp check on the next load.
+    """
+    for h in handles:
+        shm = _ATTACHED.get(h.segment)
+        if shm is None:
+            # the driver owns the segment, the worker must not unlink it on exit
+            shm = _ATTACHED[h.segment] = SharedMemory(name=h.segment, track=False)
+        arrays: list[np.ndarray] = []
+        for spec in h.arrays:
+            view = np.ndarray(spec.shape, dtype=spec.dtype, buffer=shm.buf, offset=spec.offset)
+            view.flags.writeable = False
+            arrays.append(view)
+        with _LOCK:
+            _CACHE[h.directory] = (h.stamp, _rebuild(h.layout, arrays))
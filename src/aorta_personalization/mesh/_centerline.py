@@ -1,19 +1,19 @@
 from typing import TYPE_CHECKING
 
 import numpy as np
+from aorta_personalization.profiling.api import span
+from aorta_personalization.storage.api import chread_d, chwrite_d_utf
 from cheartpy.cl.mesh import (
     create_cheart_cl_nodal_meshes,
     create_cheart_cl_topology_meshes,
     create_cl_partition,
 )
-from cheartpy.io.api import (
-    check_for_meshes,
-    chread_d,
-    chwrite_d_utf,
-)
+from cheartpy.io.api import check_for_meshes
 from pytools.path import clear_dir
 from pytools.result import Err, Ok
 
+from ._lock import mesh_lock
+
 if TYPE_CHECKING:
     from cheartpy.cl.struct import CLPartition
     from cheartpy.mesh.struct import CheartMesh
@@ -35,6 +35,18 @@ def setup_separated_cl_meshes[F: np.floating, I: np.integer](
 ) -> Ok[CLPartition[F, I]] | Ok[None] | Err:
     if prefix is None:
         return Ok(None)
+    with mesh_lock(mesh_tuple[0]):
+        return _setup_separated_cl_meshes(prefix, in_surf, n_seg, mesh_tuple, log=log)
+
+
+def _setup_separated_cl_meshes[F: np.floating, I: np.integer](
+    prefix: str,
+    in_surf: int,
+    n_seg: int,
+    mesh_tuple: _MeshInput[F, I],
+    *,
+    log: ILogger,
+) -> Ok[CLPartition[F, I]] | Err:
     mesh, cheart_mesh, cl = mesh_tuple
     ftype = cheart_mesh.space.v.dtype
     dtype = cheart_mesh.top.v.dtype
@@ -79,6 +91,18 @@ def prep_topology_meshes[F: np.floating, I: np.integer](
 ) -> Ok[CLPartition[F, I]] | Ok[None] | Err:
     if prefix is None:
         return Ok(None)
+    with span(f"prep_topology_meshes[{prefix}]", log=log), mesh_lock(mesh_tuple[0]):
+        return _prep_topology_meshes(prefix, in_surf, n_seg, mesh_tuple, log=log)
+
+
+def _prep_topology_meshes[F: np.floating, I: np.integer](
+    prefix: str,
+    in_surf: int,
+    n_seg: int,
+    mesh_tuple: _MeshInput[F, I],
+    *,
+    log: ILogger,
+) -> Ok[CLPartition[F, I]] | Err:
     mesh, cheart_mesh, cl = mesh_tuple
     ftype = cheart_mesh.space.v.dtype
     dtype = cheart_mesh.top.v.dtype
@@ -1,16 +1,24 @@
 from typing import TYPE_CHECKING, Literal, NamedTuple
 
-from cheartpy.io.api import chwrite_d_utf
+from aorta_personalization.storage.api import chwrite_d_utf
 from cheartpy.mesh.cylinder_core.api import create_cylinder_mesh
-from cheartpy.mesh.surface_core.normals import normalize_by_row
 from pytools.logging import ILogger, LogEnum
 from pytools.path import clear_dir
 
+from ._cache import load_mesh_tuple
+from ._structured import save_structured_mesh, structured_cylinder
 from ._types import MeshTuple
-from ._variables import create_center_pos, create_fiber_field, define_centerline_field, warp_in_y
+from ._variables import (
+    centerline_field_from_space,
+    create_fiber_field,
+    define_centerline_field,
+    normal_from_space,
+    warp_in_y,
+)
 
 if TYPE_CHECKING:
     import numpy as np
+    from pytools.arrays import A2
 
     from ._types import CylinderDims, MeshInfo
 
@@ -39,34 +47,77 @@ def _remake_cylinder_mesh_msgs(
     return _TupleLogMessage(info, debug)
 
 
+def _write_cylinder_fields(
+    mesh: MeshInfo, space: A2[np.float64], cl: A2[np.float64], *, warp: bool
+) -> None:
+    """Write the CL, normal and fiber fields, space is the straight cylinder.
+
+    The normal accounts for warp itself, so the coordinates can be warped in place afterwards.
+    """
+    normal = normal_from_space(space, cl, warp=warp)
+    fibers = create_fiber_field(cl, normal, warp=warp)
+    for k, v in [
+        (mesh.FIELD, cl),
+        (mesh.NORMAL, normal),
+        ("Fibers-0.D", fibers),
+        ("Z-0.D", fibers[:, 0:3]),
+        ("C-0.D", fibers[:, 3:6]),
+        ("R-0.D", fibers[:, 6:9]),
+    ]:
+        chwrite_d_utf(mesh.DIR / k, v)
+
+
+def _remake_structured(
+    mesh: MeshInfo, dim: CylinderDims, *, quad: bool, warp: bool
+) -> MeshTuple[np.float64, np.intc]:
+    disp, pres = structured_cylinder(dim.shape, dim.nelem, quad=quad)
+    # the pressure nodes are the leading vertex nodes of the displacement mesh, share them
+    pres = pres._replace(space=disp.space[: len(pres.space)])
+    cl = centerline_field_from_space(disp.space)
+    _write_cylinder_fields(mesh, disp.space, cl, warp=warp)
+    if warp:
+        warp_in_y(disp.space, out=disp.space)
+    save_structured_mesh(mesh.DIR / mesh.PRES, pres)
+    save_structured_mesh(mesh.DIR / mesh.DISP, disp)
+    # parsed once here, every later find_meshes in this process is served from the cache
+    return load_mesh_tuple(mesh).unwrap()
+
+
 def remake_cylinder_mesh(
-    mesh: MeshInfo, dim: CylinderDims, *, quad: bool, warp: bool, log: ILogger
+    mesh: MeshInfo,
+    dim: CylinderDims,
+    *,
+    quad: bool,
+    warp: bool,
+    log: ILogger,
+    fast: bool = True,
 ) -> MeshTuple[np.float64, np.intc]:
+    """Regenerate the cylinder mesh files and derived fields in mesh.DIR.
+
+    fast builds the mesh with structured_cylinder, whose pressure mesh shares the coordinates
+    of the displacement mesh's vertex nodes so they are held and warped once. It falls back to
+    create_cylinder_mesh, which keeps a copy per mesh, if the element layout cannot be learned
+    from its reference cylinder.
+    """
     log_info, log_debug = _remake_cylinder_mesh_msgs(mesh, level=log.level, quad=quad, warp=warp)
     log.info(*log_info)
     log.debug(*log_debug)
     mesh.DIR.mkdir(exist_ok=True)
     clear_dir(mesh.DIR)
+    if fast:
+        try:
+            return _remake_structured(mesh, dim, quad=quad, warp=warp)
+        except ValueError as e:
+            log.info(f"Structured cylinder unavailable ({e}), using create_cylinder_mesh")
+            clear_dir(mesh.DIR)
     lin_mesh, quad_mesh = create_cylinder_mesh((*dim.shape, 0.0), dim.nelem, "x", make_quad=quad)
     disp_mesh = quad_mesh or lin_mesh
     cl = define_centerline_field(disp_mesh)
-    center = create_center_pos(disp_mesh, cl)
+    _write_cylinder_fields(mesh, disp_mesh.space.v, cl, warp=warp)
     if warp:
-        lin_mesh.space.v = warp_in_y(lin_mesh.space.v)
-        disp_mesh.space.v = warp_in_y(disp_mesh.space.v)
-        center = warp_in_y(center)
-    normal = disp_mesh.space.v - center
-    normal = normalize_by_row(normal)
-    fibers = create_fiber_field(cl, normal, warp=warp)
+        # without quad the displacement mesh is the linear one, warp it only once
+        for m in [lin_mesh] if quad_mesh is None else [lin_mesh, quad_mesh]:
+            warp_in_y(m.space.v, out=m.space.v)
     lin_mesh.save(mesh.DIR / mesh.PRES)
     disp_mesh.save(mesh.DIR / mesh.DISP)
-    for k, v in [
-        (mesh.FIELD, cl),
-        (mesh.NORMAL, normal),
-        ("Fibers-0.D", fibers),
-        ("Z-0.D", fibers[:, 0:3]),
-        ("C-0.D", fibers[:, 3:6]),
-        ("R-0.D", fibers[:, 6:9]),
-    ]:
-        chwrite_d_utf(mesh.DIR / k, v)
     return MeshTuple(disp_mesh, cl)
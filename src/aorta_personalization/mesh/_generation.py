@@ -1,11 +1,14 @@
 from typing import TYPE_CHECKING
 
-from cheartpy.io.api import check_for_meshes, chread_d
-from cheartpy.mesh.api import import_cheart_mesh
+from aorta_personalization.profiling.api import traced
+from cheartpy.io.api import check_for_meshes
 from pytools.result import Err, Ok
 
 from ._aorta import setup_aorta_mesh
+from ._branched import remake_branched_mesh
+from ._cache import check_mesh_headers, load_mesh_tuple
 from ._cylinder import remake_cylinder_mesh
+from ._lock import mesh_lock
 from ._types import Geometries, MeshInfo, MeshTuple
 
 if TYPE_CHECKING:
@@ -18,20 +21,11 @@ def find_meshes(
 ) -> Ok[MeshTuple[np.float64, np.intc]] | Err:
     if not check_for_meshes(mesh.DISP, mesh.PRES, home=mesh.DIR):
         return Err(FileExistsError(f"Mesh for {mesh.DIR} does not exist"))
-    match import_cheart_mesh(mesh.DIR / mesh.DISP):
-        case Ok(disp):
-            pass
+    match check_mesh_headers(mesh):
+        case Ok():
+            return load_mesh_tuple(mesh)
         case Err(e):
             return Err(e)
-    match import_cheart_mesh(mesh.DIR / mesh.PRES):
-        case Ok(pres):
-            pass
-        case Err(e):
-            return Err(e)
-    if disp.top.n != pres.top.n:
-        return Err(ValueError("Displacement and Pressure mesh do not match"))
-    cl = chread_d(mesh.DIR / mesh.FIELD)
-    return Ok(MeshTuple(disp, cl))
 
 
 _QUAD_IS_2_RUFF = 2
@@ -42,28 +36,52 @@ def create_mesh(mesh: MeshInfo, *, log: ILogger) -> Ok[MeshTuple[np.float64, np.
         case Geometries.STRAIGHT_CYLINDER:
             return Ok(
                 remake_cylinder_mesh(
-                    mesh, mesh.SPEC, quad=(mesh.ORDER == _QUAD_IS_2_RUFF), warp=False, log=log
+                    mesh,
+                    mesh.SPEC,
+                    quad=(mesh.ORDER == _QUAD_IS_2_RUFF),
+                    warp=False,
+                    log=log,
+                    fast=mesh.SPEC.structured,
                 )
             )
         case Geometries.BENT_CYLINDER:
             return Ok(
                 remake_cylinder_mesh(
-                    mesh, mesh.SPEC, quad=(mesh.ORDER == _QUAD_IS_2_RUFF), warp=True, log=log
+                    mesh,
+                    mesh.SPEC,
+                    quad=(mesh.ORDER == _QUAD_IS_2_RUFF),
+                    warp=True,
+                    log=log,
+                    fast=mesh.SPEC.structured,
                 )
             )
         case Geometries.AORTA:
             return setup_aorta_mesh(mesh, log=log).next()
         case Geometries.BRANCHED_CYLINDER:
-            raise NotImplementedError
+            try:
+                return Ok(
+                    remake_branched_mesh(
+                        mesh, mesh.SPEC, quad=(mesh.ORDER == _QUAD_IS_2_RUFF), log=log
+                    )
+                )
+            except ValueError as e:
+                return Err(e)
 
 
+@traced()
 def prep_cheart_mesh(
     mesh: MeshInfo, *, log: ILogger, override: bool = False
 ) -> Ok[MeshTuple[np.float64, np.intc]] | Err:
     if not override:
-        match find_meshes(mesh):
-            case Ok() as res:
-                return res
-            case Err(e):
-                log.info(str(e), "Creating new mesh")
-    return create_mesh(mesh, log=log).next()
+        # runs on an existing mesh only read it, they do not wait for each other
+        with mesh_lock(mesh, shared=True):
+            match find_meshes(mesh):
+                case Ok() as res:
+                    return res
+                case Err(e):
+                    log.info(str(e), "Creating new mesh")
+    with mesh_lock(mesh):
+        # another process may have made the mesh while no lock was held
+        if not override and isinstance(res := find_meshes(mesh), Ok):
+            return res
+        return create_mesh(mesh, log=log).next()
@@ -0,0 +1,53 @@
+import fcntl
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from ._types import MeshInfo
+
+
+# lock files this thread holds and whether only shared, nested calls reuse the outer lock
+_HELD = threading.local()
+
+
+def mesh_lock_file(mesh: MeshInfo) -> Path:
+    # kept next to the directory so that clear_dir(mesh.DIR) never removes it
+    return mesh.DIR.parent / f".{mesh.DIR.name}.lock"
+
+
+def _held_locks() -> dict[Path, bool]:
+    if not hasattr(_HELD, "locks"):
+        _HELD.locks = {}
+    return _HELD.locks
+
+
+@contextmanager
+def mesh_lock(mesh: MeshInfo, *, shared: bool = False) -> Iterator[None]:
+    """Hold an advisory lock on a shared mesh directory.
+
+    Writers (mesh and topology generation) take the exclusive lock, runs staging the mesh into
+    their scratch directory take the shared lock. The lock is reentrant within a thread: nested
+    calls for the same mesh run under the outer lock. flock cannot upgrade a shared lock without
+    releasing it, so asking for the exclusive lock inside a shared one raises RuntimeError.
+    """
+    lock_file = mesh_lock_file(mesh).absolute()
+    held = _held_locks()
+    if lock_file in held:
+        if held[lock_file] and not shared:
+            msg = f"Exclusive lock on {mesh.DIR} requested while holding the shared lock"
+            raise RuntimeError(msg)
+        yield
+        return
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    with lock_file.open("a") as f:
+        fcntl.flock(f, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        held[lock_file] = shared
+        try:
+            yield
+        finally:
+            del held[lock_file]
+            fcntl.flock(f, fcntl.LOCK_UN)
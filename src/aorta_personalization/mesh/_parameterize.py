@@ -0,0 +1,137 @@
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+from scipy.sparse import coo_array, diags_array
+from scipy.sparse.linalg import cg
+
+from ._structured import reference_nodes
+from ._transfer import hex_order
+
+if TYPE_CHECKING:
+    from pytools.arrays import A1, A2
+
+
+_RTOL = 1e-10
+_MAXITER = 20000
+
+
+class VesselFields(NamedTuple):
+    """cl is (longitudinal, transverse) in [0, 1], the layout of CenterLineField."""
+
+    cl: A2[np.float64]
+    normal: A2[np.float64]
+    centerline: A2[np.float64]
+
+
+def _element_edges(order: int) -> A2[np.intp]:
+    """Pairs of local nodes one lattice step apart along one reference axis."""
+    ref = np.rint(reference_nodes(order) * order).astype(np.intp)
+    step = np.abs(ref[:, None, :] - ref[None, :, :])
+    edge = (step.sum(axis=-1) == 1) & (np.arange(len(ref))[:, None] < np.arange(len(ref)))
+    return np.argwhere(edge)
+
+
+def _laplace(
+    x: A2[np.float64], top: A2[np.intp], fixed: A1[np.intp], values: A1[np.float64]
+) -> A1[np.float64]:
+    """Harmonic field on the element edge graph, weighted by inverse squared edge length."""
+    pairs = top[:, _element_edges(hex_order(top.shape[1]))].reshape(-1, 2)
+    pairs = np.unique(np.sort(pairs, axis=1), axis=0)
+    i, j = pairs.T
+    n = len(x)
+    w = 1.0 / np.einsum("ed,ed->e", x[i] - x[j], x[i] - x[j])
+    rows, cols = np.concatenate((i, j)), np.concatenate((j, i))
+    adj = coo_array((np.concatenate((w, w)), (rows, cols)), shape=(n, n)).tocsr()
+    lap = (coo_array((adj.sum(axis=1), (np.arange(n), np.arange(n))), shape=(n, n)) - adj).tocsr()
+    free = np.setdiff1d(np.arange(n), fixed)
+    u = np.empty(n)
+    u[fixed] = values
+    rhs = -lap[free][:, fixed] @ values
+    a = lap[free][:, free]
+    # symmetric positive definite, Jacobi preconditioned CG beats a direct solve on long vessels
+    u[free], info = cg(a, rhs, rtol=_RTOL, maxiter=_MAXITER, M=diags_array(1.0 / a.diagonal()))
+    if info:
+        msg = f"Centerline Laplace solve did not converge in {info} iterations"
+        raise ValueError(msg)
+    return u
+
+
+def _transport_frame(tangent: A2[np.float64]) -> A2[np.float64]:
+    """Rotation minimising reference directions along the centerline, by double reflection."""
+    ref = np.empty_like(tangent)
+    seed = np.eye(3)[np.abs(tangent[0]).argmin()]
+    ref[0] = seed - tangent[0] * (seed @ tangent[0])
+    ref[0] /= np.linalg.norm(ref[0])
+    for k in range(1, len(tangent)):
+        t = tangent[k] + tangent[k - 1]
+        r = ref[k - 1] - 2.0 * t * (ref[k - 1] @ t) / (t @ t)
+        ref[k] = r - tangent[k] * (r @ tangent[k])
+        ref[k] /= np.linalg.norm(ref[k])
+    return ref
+
+
+def vessel_fields(
+    space: A2[np.floating],
+    top: A2[np.integer],
+    inlet: A1[np.integer],
+    outlet: A1[np.integer],
+    *,
+    sections: int = 128,
+) -> VesselFields:
+    """Centerline coordinate, circumferential coordinate and wall normals of a vessel mesh.
+
+    A Laplace problem with 0 on the inlet nodes and 1 on the outlet nodes orders the nodes
+    along the vessel; weighted centroids about its level sets trace the centerline, which
+    reparameterises the coordinate by arc length. Normals point from the centerline to each
+    node, orthogonal to it. The second coordinate is the offset from the centerline along the
+    binormal of a rotation minimising frame, scaled to [0, 1] like the normalised z of
+    centerline_field_from_space, which it equals on a straight cylinder along x. top holds
+    0-based indices of CHeart hex elements.
+    """
+    x = np.asarray(space, dtype=np.float64)
+    top = np.asarray(top, dtype=np.intp)
+    inlet, outlet = np.unique(inlet), np.unique(outlet)
+    fixed = np.concatenate((inlet, outlet))
+    values = np.concatenate((np.zeros(len(inlet)), np.ones(len(outlet))))
+    phi = np.clip(_laplace(x, top, fixed, values), 0.0, 1.0)
+    # centroids about evenly spaced level sets with hat weights, which are continuous in phi so
+    # a ring of nodes is never split between sections by round-off
+    pos = phi * (sections - 1)
+    lo = np.minimum(pos.astype(np.intp), sections - 2)
+    frac = pos - lo
+    idx = np.concatenate((lo, lo + 1))
+    wts = np.concatenate((1.0 - frac, frac))
+    total = np.bincount(idx, wts, sections)
+    used = total > 0.0
+    centers = np.stack(
+        [np.bincount(idx, wts * np.tile(x[:, d], 2), sections) for d in range(3)], axis=-1
+    )
+    centers = centers[used] / total[used][:, None]
+    levels = np.flatnonzero(used) / (sections - 1)
+    seg = np.linalg.norm(np.diff(centers, axis=0), axis=-1)
+    arc = np.concatenate(([0.0], np.cumsum(seg)))
+    arc /= arc[-1]
+    s = np.interp(phi, levels, arc)
+    # per node centerline point and tangent, interpolated between the section centroids
+    c = np.stack([np.interp(s, arc, centers[:, d]) for d in range(3)], axis=-1)
+    tangents = np.gradient(centers, arc, axis=0)
+    tangents /= np.linalg.norm(tangents, axis=-1)[:, None]
+    frame = _transport_frame(tangents)
+    t = np.stack([np.interp(s, arc, tangents[:, d]) for d in range(3)], axis=-1)
+    t /= np.linalg.norm(t, axis=-1)[:, None]
+    e1 = np.stack([np.interp(s, arc, frame[:, d]) for d in range(3)], axis=-1)
+    e1 -= t * np.einsum("nd,nd->n", e1, t)[:, None]
+    e1 /= np.linalg.norm(e1, axis=-1)[:, None]
+    e2 = np.cross(t, e1)
+    normal = x - c
+    normal -= t * np.einsum("nd,nd->n", normal, t)[:, None]
+    w = np.einsum("nd,nd->n", normal, e2)
+    normal /= np.linalg.norm(normal, axis=-1)[:, None]
+    cl = np.column_stack((s, (w - w.min()) / (w.max() - w.min())))
+    return VesselFields(cl, normal, centers)
+
+
+def patch_nodes(bnd: A2[np.integer], tag: int) -> A1[np.intp]:
+    """0-based nodes of a boundary patch, from the rows of a CHeart B file."""
+    rows = bnd[bnd[:, -1] == tag]
+    return np.unique(rows[:, 1:-1]).astype(np.intp) - 1
@@ -0,0 +1,187 @@
+import dataclasses as dc
+from typing import TYPE_CHECKING
+
+import numpy as np
+from aorta_personalization.storage.api import chread_d, chwrite_d_utf
+from cheartpy.io.api import fix_ch_sfx
+from pytools.result import Err, Ok
+
+from ._structured import lattice_index, read_ch_array
+from ._transfer import lagrange_1d
+from ._types import Geometries
+from ._variables import unwarp_in_y
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from pytools.arrays import A2
+
+    from ._types import MeshInfo
+
+
+_CYLINDERS = (Geometries.STRAIGHT_CYLINDER, Geometries.BENT_CYLINDER)
+_PHASE_TOL = 1e-6
+
+
+@dc.dataclass(slots=True, frozen=True)
+class LatticeProlongation:
+    """Tensor product interpolation between the (r, theta, x) node lattices of two cylinders.
+
+    coarse and fine map the nodes of each mesh to their lattice index, the axes hold one 1D
+    interpolation matrix per lattice axis. The interpolant is exact whenever the coarse space
+    is contained in the fine one, i.e. the element counts divide and the order does not drop.
+    """
+
+    coarse: A2[np.intp]
+    fine: A2[np.intp]
+    axes: tuple[A2[np.float64], A2[np.float64], A2[np.float64]]
+
+    def __call__[F: np.floating](self, field: A2[F]) -> A2[F]:
+        shape = tuple(a.shape[1] for a in self.axes)
+        lattice = np.empty((*shape, field.shape[1]), dtype=np.float64)
+        lattice[tuple(self.coarse.T)] = field
+        for axis, mat in enumerate(self.axes):
+            lattice = np.moveaxis(np.tensordot(mat, lattice, axes=(1, axis)), 0, axis)
+        return lattice[tuple(self.fine.T)].astype(field.dtype)
+
+
+@dc.dataclass(slots=True, frozen=True)
+class CylinderProlongation:
+    disp: LatticeProlongation
+    pres: LatticeProlongation
+
+
+def _axis_matrix(nc: int, kc: int, nf: int, kf: int, *, periodic: bool) -> A2[np.float64]:
+    """Weights of the coarse lattice nodes (order kc, nc elements) at the fine ones."""
+    nodes = nf * kf + (0 if periodic else 1)
+    cols = nc * kc + (0 if periodic else 1)
+    t = np.arange(nodes) * (nc / (nf * kf))
+    elem = np.minimum(np.floor(t + _PHASE_TOL), nc - 1).astype(np.intp)
+    weights, _ = lagrange_1d(t - elem, kc)
+    idx = elem[:, None] * kc + np.arange(kc + 1)
+    if periodic:
+        idx %= cols
+    mat = np.zeros((nodes, cols))
+    np.add.at(mat, (np.arange(nodes)[:, None], idx), weights)
+    return mat
+
+
+def _mesh_lattice(mesh: MeshInfo, name: str, order: int) -> Ok[tuple[A2[np.intp], float]] | Err:
+    """Lattice index of every node of a cylinder mesh file and the angle of theta index 0.
+
+    Bent cylinders are straightened first, the lattice is that of the straight cylinder.
+    """
+    try:
+        _, x = read_ch_array(mesh.DIR / f"{fix_ch_sfx(name)}X", np.float64)
+    except (OSError, ValueError) as e:
+        return Err(e)
+    if mesh.GEO is Geometries.BENT_CYLINDER:
+        x = unwarp_in_y(x, mesh.SPEC.shape[2])
+    try:
+        idx = lattice_index(x, mesh.SPEC.nelem, order)
+    except ValueError as e:
+        return Err(e)
+    nr, nc, nx = mesh.SPEC.nelem
+    if len(x) != (order * nr + 1) * (order * nc) * (order * nx + 1):
+        return Err(ValueError(f"{name} in {mesh.DIR} does not fill a full order {order} lattice"))
+    phase = float(np.mod(np.arctan2(x[:, 2], x[:, 1]), 2.0 * np.pi).min())
+    return Ok((idx, phase))
+
+
+def _lattice_prolongation(
+    coarse: MeshInfo, fine: MeshInfo, names: tuple[str, str], orders: tuple[int, int]
+) -> Ok[LatticeProlongation] | Err:
+    match _mesh_lattice(coarse, names[0], orders[0]):
+        case Ok((idx_c, phase_c)):
+            pass
+        case Err(e):
+            return Err(e)
+    match _mesh_lattice(fine, names[1], orders[1]):
+        case Ok((idx_f, phase_f)):
+            pass
+        case Err(e):
+            return Err(e)
+    # both lattices start at their own first node, align the fine one to the coarse one
+    ntheta = orders[1] * fine.SPEC.nelem[1]
+    shift = (phase_f - phase_c) * ntheta / (2.0 * np.pi)
+    if abs(shift - round(shift)) > _PHASE_TOL:
+        return Err(ValueError("Coarse and fine cylinder nodes are not at matching angles"))
+    idx_f[:, 1] = (idx_f[:, 1] + round(shift)) % ntheta
+    axes = tuple(
+        _axis_matrix(c, orders[0], f, orders[1], periodic=(axis == 1))
+        for axis, (c, f) in enumerate(zip(coarse.SPEC.nelem, fine.SPEC.nelem, strict=True))
+    )
+    return Ok(LatticeProlongation(idx_c, idx_f, axes))
+
+
+def cylinder_prolongation(coarse: MeshInfo, fine: MeshInfo) -> Ok[CylinderProlongation] | Err:
+    """Index maps from the displacement and pressure meshes of coarse onto those of fine.
+
+    Both must be cylinders of the same geometry and shape as made by remake_cylinder_mesh, with
+    either generator; node numbering is recovered from the coordinates, not assumed.
+    """
+    if coarse.GEO not in _CYLINDERS or coarse.GEO is not fine.GEO:
+        msg = f"Prolongation needs two cylinders of one geometry, got {coarse.GEO}, {fine.GEO}"
+        return Err(ValueError(msg))
+    if coarse.SPEC.shape != fine.SPEC.shape:
+        return Err(ValueError(f"Cylinder shapes differ: {coarse.SPEC.shape}, {fine.SPEC.shape}"))
+    match _lattice_prolongation(
+        coarse, fine, (coarse.DISP, fine.DISP), (coarse.ORDER, fine.ORDER)
+    ):
+        case Ok(disp):
+            pass
+        case Err(e):
+            return Err(e)
+    match _lattice_prolongation(coarse, fine, (coarse.PRES, fine.PRES), (1, 1)):
+        case Ok(pres):
+            return Ok(CylinderProlongation(disp, pres))
+        case Err(e):
+            return Err(e)
+
+
+def prolong_solution(
+    coarse: MeshInfo,
+    fine: MeshInfo,
+    src: Path,
+    step: int,
+    dest: Path,
+    *,
+    disp_vars: Sequence[str] = ("Space", "Disp"),
+    pres_vars: Sequence[str] = ("Pres",),
+    positions: Sequence[str] = ("Space",),
+    suffix: str = ".INIT",
+) -> Ok[list[Path]] | Err:
+    """Write {var}-{step}.D of a coarse run in src as {var}{suffix} on the fine mesh in dest.
+
+    The defaults are the files set_solid_ic reads, so a fine run can start from the coarse
+    solution. Node-wise fields on the main topology (e.g. LM after expansion from the centerline)
+    go in disp_vars. Variables in positions are coordinates: their offset from the coarse nodes
+    is prolonged and added to the fine nodes, so the fine geometry is kept exactly.
+    """
+    match cylinder_prolongation(coarse, fine):
+        case Ok(prolong):
+            pass
+        case Err(e):
+            return Err(e)
+    mesh_space: dict[str, tuple[A2[np.float64], A2[np.float64]]] = {}
+    if positions:
+        _, xc = read_ch_array(coarse.DIR / f"{fix_ch_sfx(coarse.DISP)}X", np.float64)
+        _, xf = read_ch_array(fine.DIR / f"{fix_ch_sfx(fine.DISP)}X", np.float64)
+        mesh_space = {v: (xc, xf) for v in positions}
+    dest.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
+    for op, names in [(prolong.disp, disp_vars), (prolong.pres, pres_vars)]:
+        for v in names:
+            file = src / f"{v}-{step}.D"
+            if not file.is_file():
+                return Err(FileNotFoundError(f"{file} does not exist"))
+            data = chread_d(file)
+            if v in mesh_space:
+                xc, xf = mesh_space[v]
+                data = xf + op(data - xc)
+            else:
+                data = op(data)
+            chwrite_d_utf(dest / f"{v}{suffix}", data)
+            written.append(dest / f"{v}{suffix}")
+    return Ok(written)
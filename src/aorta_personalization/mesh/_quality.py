@@ -0,0 +1,187 @@
+import dataclasses as dc
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+from aorta_personalization.storage.api import chread_d
+from pytools.result import Err, Ok
+
+from ._cache import file_stamp, mesh_files
+from ._transfer import HexBasis, hex_order
+from ._types import ElementTypes
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cheartpy.mesh.struct import CheartMesh
+    from pytools.arrays import A1, A2, A3
+    from pytools.logging import ILogger
+
+    from ._cache import FileStamp
+    from ._types import MeshInfo
+
+
+# Gauss points per axis by element order, those of a full integration of the element
+_GAUSS = {1: 2, 2: 3}
+_LISTED = 10
+# elements per batch, bounds the (elements, points, 3, 3) Jacobian arrays to a few MB
+_CHUNK = 4096
+_LOCK = threading.Lock()
+# passed reports by mesh directory, with the stamp of the files and the limits they were made for
+_PASSED: dict[Path, tuple[FileStamp, float, float, MeshQualityReport]] = {}
+
+
+@dc.dataclass(slots=True, frozen=True)
+class MeshQualityReport:
+    """Element checks of a hex mesh, each array holds 0-based element indices.
+
+    inverted: the Jacobian determinant changes sign or vanishes at a Gauss point, measured
+        against the orientation most elements share.
+    distorted: the scaled Jacobian (det J over the product of its column norms) drops below
+        the limit somewhere in the element.
+    stretched: the ratio of the longest to the shortest element edge direction is too large.
+    flipped: the element's through-wall direction points against the normal field.
+    """
+
+    elements: int
+    min_jacobian: float
+    max_aspect: float
+    inverted: A1[np.intp]
+    distorted: A1[np.intp]
+    stretched: A1[np.intp]
+    flipped: A1[np.intp]
+
+    @property
+    def ok(self) -> bool:
+        checks = (self.inverted, self.distorted, self.stretched, self.flipped)
+        return not any(elems.size for elems in checks)
+
+    def summary(self) -> list[str]:
+        lines = [
+            f"{self.elements} elements, min scaled Jacobian {self.min_jacobian:.3g}, "
+            f"max aspect ratio {self.max_aspect:.3g}"
+        ]
+        for name in ("inverted", "distorted", "stretched", "flipped"):
+            elems: A1[np.intp] = getattr(self, name)
+            if elems.size:
+                more = ", ..." if elems.size > _LISTED else ""
+                listed = ", ".join(str(e) for e in elems[:_LISTED])
+                lines.append(f"{elems.size} {name} elements: {listed}{more}")
+        return lines
+
+
+def _gauss_points(order: int) -> A2[np.float64]:
+    x, _ = np.polynomial.legendre.leggauss(_GAUSS[order])
+    x = 0.5 * (x + 1.0)
+    return np.stack(np.meshgrid(x, x, x, indexing="ij"), axis=-1).reshape(-1, 3)
+
+
+def _flipped(normal: A2[np.floating], top: A2[np.intp], jac: A3[np.float64]) -> A1[np.intp]:
+    """Elements whose through-wall axis disagrees in sign with the mesh-wide majority.
+
+    The through-wall axis is the local axis best aligned with the normal field over the mesh,
+    found per mesh rather than assumed, so imported meshes with other local layouts work too.
+    Elements whose wall runs along another local axis, e.g. those of a branch, are not judged.
+    """
+    n = normal[top].mean(axis=1)
+    cos = np.einsum("ed,eda->ea", n, jac)
+    cos /= np.linalg.norm(n, axis=-1)[:, None] * np.linalg.norm(jac, axis=1) + 1e-300
+    axis = int(np.median(np.abs(cos), axis=0).argmax())
+    sign = 1.0 if (cos[:, axis] >= 0.0).sum() * 2 >= len(cos) else -1.0
+    along = np.abs(cos).argmax(axis=1) == axis
+    return np.flatnonzero(along & (sign * cos[:, axis] <= 0.0))
+
+
+def check_mesh_quality(
+    space: A2[np.floating],
+    top: A2[np.integer],
+    normal: A2[np.floating] | None = None,
+    *,
+    min_jacobian: float = 0.05,
+    max_aspect: float = 100.0,
+) -> MeshQualityReport:
+    """Jacobian, aspect ratio and normal checks over all elements of a hex mesh, in batches.
+
+    top holds 0-based node indices of 8 or 27 node hex elements in CHeart order. normal is the
+    node-wise wall normal, e.g. CenterNormalField, and is skipped if None.
+    """
+    x = np.asarray(space, dtype=np.float64)
+    top = np.asarray(top, dtype=np.intp)
+    order = hex_order(top.shape[1])
+    basis = HexBasis(order)
+    pts = np.vstack((_gauss_points(order), np.full((1, 3), 0.5)))
+    _, grad = basis(pts)
+    ne = len(top)
+    lo_scaled, hi_scaled = np.empty(ne), np.empty(ne)
+    center = np.empty((ne, 3, 3))
+    for lo in range(0, ne, _CHUNK):
+        hi = min(lo + _CHUNK, ne)
+        # (elements, points, space dim, local axis), the last point is the element center
+        jac = np.einsum("ekd,gka->egda", x[top[lo:hi]], grad)
+        scaled = np.linalg.det(jac) / np.linalg.norm(jac, axis=2).prod(axis=-1)
+        lo_scaled[lo:hi], hi_scaled[lo:hi] = scaled.min(axis=1), scaled.max(axis=1)
+        center[lo:hi] = jac[:, -1]
+    det = np.linalg.det(center)
+    # the scaled Jacobian only flips sign with the element orientation
+    worst = lo_scaled if (det > 0.0).sum() * 2 >= ne else -hi_scaled
+    cols = np.linalg.norm(center, axis=1)
+    aspect = cols.max(axis=-1) / cols.min(axis=-1)
+    inverted = np.flatnonzero(worst <= 0.0)
+    return MeshQualityReport(
+        elements=ne,
+        min_jacobian=float(worst.min()),
+        max_aspect=float(aspect.max()),
+        inverted=inverted,
+        distorted=np.flatnonzero((worst > 0.0) & (worst < min_jacobian)),
+        stretched=np.flatnonzero(aspect > max_aspect),
+        flipped=(
+            np.empty(0, dtype=np.intp) if normal is None else _flipped(normal, top, center)
+        ),
+    )
+
+
+def preflight_mesh_check(
+    mesh: MeshInfo,
+    cheart_mesh: CheartMesh,
+    *,
+    log: ILogger,
+    min_jacobian: float = 0.05,
+    max_aspect: float = 100.0,
+) -> Ok[MeshQualityReport | None] | Err:
+    """Check the displacement mesh against mesh.NORMAL before any solver is started.
+
+    Err carries the report summary; tet meshes are not checked and give Ok(None). A passed
+    report is reused until the mesh or normal files change, like load_mesh_tuple's entries.
+    """
+    if mesh.ELEM is not ElementTypes.HEX:
+        log.info(f"Mesh quality checks cover hex elements only, skipping {mesh.ELEM} mesh")
+        return Ok(None)
+    normal_file = mesh.DIR / mesh.NORMAL
+    has_normal = normal_file.is_file()
+    try:
+        stamp = file_stamp([*mesh_files(mesh), *([normal_file] if has_normal else [])])
+    except OSError as e:
+        return Err(e)
+    with _LOCK:
+        entry = _PASSED.get(mesh.DIR)
+    if entry is not None and entry[:3] == (stamp, min_jacobian, max_aspect):
+        log.debug(f"Mesh {mesh.DIR} is unchanged since it passed the quality checks")
+        return Ok(entry[3])
+    normal = chread_d(normal_file) if has_normal else None
+    try:
+        report = check_mesh_quality(
+            cheart_mesh.space.v,
+            cheart_mesh.top.v,
+            normal,
+            min_jacobian=min_jacobian,
+            max_aspect=max_aspect,
+        )
+    except ValueError as e:
+        return Err(e)
+    if not report.ok:
+        log.error(f"Mesh {mesh.DIR} failed the quality checks:", *report.summary())
+        return Err(ValueError("\n".join([f"Bad mesh in {mesh.DIR}", *report.summary()])))
+    log.debug("Mesh quality:", *report.summary())
+    with _LOCK:
+        _PASSED[mesh.DIR] = (stamp, min_jacobian, max_aspect, report)
+    return Ok(report)
@@ -0,0 +1,190 @@
+import functools
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+from cheartpy.io.api import fix_ch_sfx
+from cheartpy.mesh.cylinder_core.api import create_cylinder_mesh
+
+if TYPE_CHECKING:
+    from pytools.arrays import A1, A2
+
+
+# lattice axes are (radial, circumferential, longitudinal), the circumferential one is periodic
+_REF_NELEM = (1, 4, 2)
+_REF_SHAPE = (9.0, 12.0, 20.0, 0.0)
+_LATTICE_TOL = 1e-6
+_QUAD_ORDER = 2
+
+
+class _Face(NamedTuple):
+    tag: int
+    axis: int
+    at_max: bool
+    slots: A1[np.intp]
+
+
+class _Template(NamedTuple):
+    """Local node layout of the elements create_cylinder_mesh builds, in lattice offsets."""
+
+    order: int
+    offsets: A2[np.intp]
+    faces: tuple[_Face, ...]
+    elem_base: int
+
+
+class StructuredMesh(NamedTuple):
+    space: A2[np.float64]
+    top: A2[np.intp]
+    bnd: A2[np.intp]
+
+
+class StructuredCylinder(NamedTuple):
+    disp: StructuredMesh
+    pres: StructuredMesh
+
+
+def read_ch_array(file: Path, dtype: type) -> tuple[list[int], np.ndarray]:
+    with file.open("r") as f:
+        header = [int(v) for v in f.readline().split()]
+    return header, np.loadtxt(file, skiprows=1, dtype=dtype, ndmin=2)
+
+
+def lattice_index(x: A2[np.float64], nelem: tuple[int, int, int], order: int) -> A2[np.intp]:
+    r = np.hypot(x[:, 1], x[:, 2])
+    q = np.mod(np.arctan2(x[:, 2], x[:, 1]), 2.0 * np.pi)
+    span = np.array([r.max() - r.min(), 2.0 * np.pi, x[:, 0].max() - x[:, 0].min()])
+    rel = np.column_stack((r - r.min(), q - q.min(), x[:, 0] - x[:, 0].min()))
+    lat = rel / span * (order * np.asarray(nelem))
+    idx = np.rint(lat)
+    if np.abs(lat - idx).max() > _LATTICE_TOL:
+        msg = "Reference cylinder nodes are not on a uniform (r, theta, x) lattice"
+        raise ValueError(msg)
+    idx = idx.astype(np.intp)
+    idx[:, 1] %= order * nelem[1]
+    return idx
+
+
+def _learn_template(x: A2[np.float64], top: A2[np.intp], bnd: A2[np.intp], order: int) -> _Template:
+    nc = order * _REF_NELEM[1]
+    lat = lattice_index(x, _REF_NELEM, order)
+    # offsets relative to the first node, unwrapped across the circumferential seam
+    d = lat[top] - lat[top[:, :1]]
+    d[..., 1] = (d[..., 1] + nc // 2) % nc - nc // 2
+    offsets = d - d.min(axis=1, keepdims=True)
+    if not (offsets == offsets[0]).all() or (offsets[0].max(axis=0) != order).any():
+        msg = "Reference cylinder elements do not share one local node layout"
+        raise ValueError(msg)
+    elem_base = 1 if np.isin(bnd[:, 1:-1] - 1, top[bnd[:, 0] - 1]).all() else 0
+    elems, nodes, tags = bnd[:, 0] - elem_base, bnd[:, 1:-1] - 1, bnd[:, -1]
+    slots = (top[elems][:, None, :] == nodes[:, :, None]).argmax(axis=-1)
+    faces: list[_Face] = []
+    for tag in np.unique(tags):
+        tag_slots = slots[tags == tag]
+        if not (tag_slots == tag_slots[0]).all():
+            msg = f"Boundary patch {tag} does not use one local face layout"
+            raise ValueError(msg)
+        face = offsets[0][tag_slots[0]]
+        (axis,) = np.flatnonzero((face == face[0]).all(axis=0))
+        if axis == 1:
+            msg = f"Boundary patch {tag} lies on a circumferential face"
+            raise ValueError(msg)
+        faces.append(_Face(int(tag), int(axis), bool(face[0, axis]), tag_slots[0]))
+    return _Template(order, offsets[0], tuple(faces), elem_base)
+
+
+@functools.cache
+def element_template(*, quad: bool) -> tuple[_Template, _Template | None]:
+    """Learn the (displacement, pressure) element layouts from a small reference cylinder.
+
+    Node ordering, face ordering and patch tags then follow create_cylinder_mesh exactly, only
+    the global numbering differs. The pressure template is None for linear meshes.
+    """
+    lin, quad_mesh = create_cylinder_mesh(_REF_SHAPE, _REF_NELEM, "x", make_quad=quad)
+    with tempfile.TemporaryDirectory() as tmp:
+        templates: list[_Template] = []
+        for name, m, order in [("lin", lin, 1), ("quad", quad_mesh, 2)]:
+            if m is None:
+                continue
+            m.save(Path(tmp) / name)
+            prefix = Path(tmp) / fix_ch_sfx(name)
+            (nn, _), x = read_ch_array(Path(f"{prefix}X"), np.float64)
+            (ne, _), top = read_ch_array(Path(f"{prefix}T"), np.intp)
+            (nb, *_), bnd = read_ch_array(Path(f"{prefix}B"), np.intp)
+            if (nn, ne, nb) != (len(x), len(top), len(bnd)):
+                msg = f"Unexpected CHeart file headers for the reference {name} mesh"
+                raise ValueError(msg)
+            templates.append(_learn_template(x, top - 1, bnd, order))
+    if quad:
+        return templates[1], templates[0]
+    return templates[0], None
+
+
+def reference_nodes(order: int) -> A2[np.float64]:
+    """Reference coordinates in [0, 1]^3 of the local nodes of a CHeart hex of this order."""
+    tmpl, _ = element_template(quad=order == _QUAD_ORDER)
+    return tmpl.offsets / tmpl.order
+
+
+def _numbering(shape: tuple[int, int, int], order: int) -> A2[np.intp]:
+    """Global node numbers on the (x, theta, r) lattice, vertex nodes first in lattice order."""
+    ix, it, ir = np.indices(shape, sparse=True)
+    vertex = (ix % order == 0) & (it % order == 0) & (ir % order == 0)
+    num = np.empty(shape, dtype=np.intp)
+    nv = int(vertex.sum())
+    num[vertex] = np.arange(nv)
+    num[~vertex] = np.arange(nv, num.size)
+    return num
+
+
+def _build(
+    dims: tuple[float, float, float], nelem: tuple[int, int, int], tmpl: _Template
+) -> StructuredMesh:
+    k = tmpl.order
+    nr, nc, nx = nelem
+    shape = (k * nx + 1, k * nc, k * nr + 1)
+    num = _numbering(shape, k)
+    ix, it, ir = (a.ravel() for a in np.indices(shape))
+    r = dims[0] + (dims[1] - dims[0]) * ir / (k * nr)
+    q = 2.0 * np.pi * it / (k * nc)
+    space = np.empty((num.size, 3), dtype=np.float64)
+    space[num.ravel()] = np.column_stack((dims[2] * ix / (k * nx), r * np.cos(q), r * np.sin(q)))
+    # elements in (x, theta, r) order, the same for every order so lin and quad elements match
+    ex, et, er = (a.ravel()[:, None] for a in np.indices((nx, nc, nr)))
+    o = tmpl.offsets
+    top = num[k * ex + o[:, 2], (k * et + o[:, 1]) % (k * nc), k * er + o[:, 0]]
+    base = {0: er[:, 0], 2: ex[:, 0]}
+    last = {0: nr - 1, 2: nx - 1}
+    patches: list[A2[np.intp]] = []
+    for face in tmpl.faces:
+        elems = np.flatnonzero(base[face.axis] == (last[face.axis] if face.at_max else 0))
+        tags = np.full_like(elems, face.tag)
+        patches.append(
+            np.column_stack((elems + tmpl.elem_base, top[elems][:, face.slots] + 1, tags))
+        )
+    return StructuredMesh(space, top, np.vstack(patches))
+
+
+def structured_cylinder(
+    dims: tuple[float, float, float], nelem: tuple[int, int, int], *, quad: bool
+) -> StructuredCylinder:
+    """Structured hex cylinder along x, built with index arithmetic only.
+
+    dims are the inner radius, outer radius and length, nelem the radial, circumferential and
+    longitudinal element counts. With quad the displacement mesh is quadratic and the pressure
+    mesh is its linear vertex sub-mesh, whose nodes are numbered first and identically in both.
+    """
+    disp_tmpl, pres_tmpl = element_template(quad=quad)
+    disp = _build(dims, nelem, disp_tmpl)
+    pres = disp if pres_tmpl is None else _build(dims, nelem, pres_tmpl)
+    return StructuredCylinder(disp, pres)
+
+
+def save_structured_mesh(prefix: Path, mesh: StructuredMesh) -> None:
+    """Write prefix_FE.X/T/B, node and element numbers are 1-based on disk."""
+    stem = str(prefix.parent / fix_ch_sfx(prefix.name))
+    nn, ne = len(mesh.space), len(mesh.top)
+    np.savetxt(f"{stem}X", mesh.space, fmt="%.16e", header=f"{nn} 3", comments="")
+    np.savetxt(f"{stem}T", mesh.top + 1, fmt="%d", header=f"{ne} {nn}", comments="")
+    np.savetxt(f"{stem}B", mesh.bnd, fmt="%d", header=f"{len(mesh.bnd)}", comments="")
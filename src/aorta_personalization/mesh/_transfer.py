@@ -0,0 +1,185 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy.sparse import csr_array
+from scipy.spatial import cKDTree
+
+from ._structured import reference_nodes
+
+if TYPE_CHECKING:
+    from cheartpy.mesh.struct import CheartMesh
+    from pytools.arrays import A1, A2, A3
+
+
+# nodes per element of the CHeart hex elements the locator can invert, by element order
+_HEX_ORDER = {8: 1, 27: 2}
+_NEWTON_ITER = 12
+_FRAME_NDIM = 2
+
+
+def lagrange_1d(t: np.ndarray, order: int) -> tuple[np.ndarray, np.ndarray]:
+    """Values and derivatives of the 1D Lagrange basis on order + 1 equispaced nodes in [0, 1].
+
+    Both have shape (*t.shape, order + 1), e.g. one set per reference axis for (points, 3).
+    """
+    nodes = np.linspace(0.0, 1.0, order + 1)
+    diff = t[..., None] - nodes
+    val = np.ones((*t.shape, order + 1))
+    der = np.zeros((*t.shape, order + 1))
+    for j in range(order + 1):
+        others = [m for m in range(order + 1) if m != j]
+        denom = np.prod(nodes[j] - nodes[others])
+        val[..., j] = np.prod(diff[..., others], axis=-1) / denom
+        for m in others:
+            rest = [n for n in others if n != m]
+            der[..., j] += np.prod(diff[..., rest], axis=-1) / denom
+    return val, der
+
+
+def hex_order(nodes: int) -> int:
+    if nodes not in _HEX_ORDER:
+        msg = f"Only 8 and 27 node hex elements are supported, got {nodes} nodes"
+        raise ValueError(msg)
+    return _HEX_ORDER[nodes]
+
+
+class HexBasis:
+    """Tensor product Lagrange basis in the local node order of CHeart hex elements."""
+
+    __slots__ = ("idx", "order")
+
+    def __init__(self, order: int) -> None:
+        self.order = order
+        self.idx = np.rint(reference_nodes(order) * order).astype(np.intp)
+
+    def __call__(self, xi: A2[np.float64]) -> tuple[A2[np.float64], A3[np.float64]]:
+        """Shape functions (points, nodes) and their gradients (points, nodes, 3) at xi."""
+        val, der = lagrange_1d(xi, self.order)
+        v = val[:, [0, 1, 2], self.idx]
+        d = der[:, [0, 1, 2], self.idx]
+        grad = np.empty_like(d)
+        for a in range(3):
+            grad[..., a] = np.where(np.arange(3) == a, d, v).prod(axis=-1)
+        return v.prod(axis=-1), grad
+
+
+def _invert(
+    basis: HexBasis, x_elem: A3[np.float64], pts: A2[np.float64]
+) -> tuple[A2[np.float64], A1[np.float64]]:
+    """Local coordinates of pts in their elements by Newton iteration.
+
+    Also returns how far each xi lies outside the reference cube, 0 for points inside.
+    """
+    xi = np.full((len(pts), 3), 0.5)
+    for _ in range(_NEWTON_ITER):
+        n, grad = basis(xi)
+        res = np.einsum("pk,pkd->pd", n, x_elem) - pts
+        jac = np.einsum("pkd,pka->pda", x_elem, grad)
+        ok = np.abs(np.linalg.det(jac)) > 0.0
+        step = np.zeros_like(xi)
+        step[ok] = np.linalg.solve(jac[ok], res[ok][..., None])[..., 0]
+        # keep iterates near the cube, far candidates only need to be recognised as outside
+        xi = np.clip(xi - step, -1.0, 2.0)
+    outside = np.linalg.norm(np.maximum(0.0, np.maximum(-xi, xi - 1.0)), axis=-1)
+    return xi, outside
+
+
+class MeshTransfer:
+    """Node-wise interpolation from one hex mesh onto the nodes of another, built once.
+
+    Each target node is located in a source element (candidates from a KD-tree over element
+    centroids, local coordinates by inverting the element map) and the source basis evaluated
+    there is stored as a sparse (target, source) matrix. Nodes shared with the source copy the
+    source value exactly; nodes outside the source mesh take the value at the closest point of
+    the nearest candidate element, their count is kept in `outside`.
+    """
+
+    __slots__ = ("matrix", "outside")
+
+    def __init__(self, matrix: csr_array, outside: int) -> None:
+        self.matrix = matrix
+        self.outside = outside
+
+    @classmethod
+    def build(
+        cls,
+        source_space: A2[np.floating],
+        source_top: A2[np.integer],
+        target_space: A2[np.floating],
+        *,
+        candidates: int = 8,
+        tol: float = 1e-6,
+    ) -> MeshTransfer:
+        """Locate target_space in the source mesh; source_top holds 0-based node indices.
+
+        tol is relative to the source bounding box for coincident nodes and absolute in local
+        coordinates for the inside test.
+        """
+        x = np.asarray(source_space, dtype=np.float64)
+        top = np.asarray(source_top, dtype=np.intp)
+        pts = np.asarray(target_space, dtype=np.float64)
+        basis = HexBasis(hex_order(top.shape[1]))
+        nt, k = len(pts), top.shape[1]
+        cols = np.zeros((nt, k), dtype=np.intp)
+        vals = np.zeros((nt, k))
+        # coincident nodes first, most of the work for refinements and shared meshes
+        scale = float(np.ptp(x, axis=0).max()) or 1.0
+        dist, near = cKDTree(x).query(pts)
+        same = dist <= tol * scale
+        cols[same, 0] = near[same]
+        vals[same, 0] = 1.0
+        todo = np.flatnonzero(~same)
+        ncand = min(candidates, len(top))
+        _, cand = cKDTree(x[top].mean(axis=1)).query(pts[todo], k=ncand)
+        cand = cand.reshape(len(todo), ncand)
+        best = np.full(len(todo), np.inf)
+        best_elem = np.zeros(len(todo), dtype=np.intp)
+        best_xi = np.zeros((len(todo), 3))
+        for c in range(ncand):
+            open_ = np.flatnonzero(best > tol)
+            if not open_.size:
+                break
+            elems = cand[open_, c]
+            xi, outside = _invert(basis, x[top[elems]], pts[todo[open_]])
+            better = outside < best[open_]
+            upd = open_[better]
+            best[upd], best_elem[upd], best_xi[upd] = outside[better], elems[better], xi[better]
+        n, _ = basis(np.clip(best_xi, 0.0, 1.0))
+        cols[todo], vals[todo] = top[best_elem], n
+        rows = np.repeat(np.arange(nt), k)
+        matrix = csr_array((vals.ravel(), (rows, cols.ravel())), shape=(nt, len(x)))
+        matrix.sum_duplicates()
+        matrix.eliminate_zeros()
+        return cls(matrix, int((best > tol).sum()))
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.matrix.shape
+
+    def __call__[F: np.floating](
+        self, field: A2[F] | A3[F], *, batch: int = 64
+    ) -> A2[F] | A3[F]:
+        """Interpolate a (source, dim) field or a (frames, source, dim) series of frames.
+
+        Frames are transferred batch at a time as one sparse product, so memory mapped series
+        (e.g. TimeSeriesStore.frames) are read once, in order.
+        """
+        if field.ndim == _FRAME_NDIM:
+            return (self.matrix @ np.asarray(field, dtype=np.float64)).astype(field.dtype)
+        nf, ns, dim = field.shape
+        out = np.empty((nf, self.shape[0], dim), dtype=field.dtype)
+        for lo in range(0, nf, batch):
+            chunk = np.asarray(field[lo : lo + batch], dtype=np.float64)
+            cols = chunk.transpose(1, 0, 2).reshape(ns, -1)
+            res = (self.matrix @ cols).reshape(self.shape[0], len(chunk), dim)
+            out[lo : lo + len(chunk)] = res.transpose(1, 0, 2)
+        return out
+
+
+def mesh_transfer(
+    source: CheartMesh, target: CheartMesh, *, candidates: int = 8, tol: float = 1e-6
+) -> MeshTransfer:
+    """MeshTransfer from the nodes and elements of source onto the nodes of target."""
+    return MeshTransfer.build(
+        source.space.v, source.top.v, target.space.v, candidates=candidates, tol=tol
+    )
@@ -36,10 +36,30 @@ class BCPatchTag(NamedTuple):
     side: int
 
 
+@dc.dataclass(slots=True, frozen=True)
+class BranchDims:
+    """Side branch of a BRANCHED_CYLINDER, grown from a window cut through the main wall.
+
+    at is the root position along the main vessel in [0, 1], angle the direction around it in
+    degrees. nelem are the collar (wall) elements around the window, the window elements per
+    side and the elements along the branch; collar and window may span at most 3/8 of the
+    elements around the main vessel.
+    """
+
+    at: float = 0.5
+    angle: float = 90.0
+    length: float = 40.0
+    nelem: T3[int] = (2, 4, 16)
+
+
 @dc.dataclass(slots=True, frozen=True)
 class CylinderDims:
     shape: T3[float] = (9.0, 12.0, 200.0)
     nelem: T3[int] = (3, 32, 100)
+    # build with the vectorized structured generator, False forces create_cylinder_mesh
+    structured: bool = True
+    # side branches, only used by BRANCHED_CYLINDER
+    branches: Sequence[BranchDims] = ()
 
 
 @dc.dataclass(slots=True, frozen=True)
@@ -58,6 +78,8 @@ class MeshInfo:
     INLET: BCPatchTag
     OUTLET: BCPatchTag
     ENDS: Sequence[int]
+    # patient data root (tracked MRI sequence) for AORTA meshes, None for the default DATA_AORTA
+    DATA: Path | None = None
 
 
 # symbols follow continuum-mechanics notation
@@ -7,35 +7,102 @@ if TYPE_CHECKING:
     from pytools.arrays import A2
 
 
-def create_fiber_field[F: np.floating](cl: A2[F], normal: A2[F], *, warp: bool = False) -> A2[F]:
-    r = normal
-    z = np.zeros_like(normal)
+def create_fiber_field[F: np.floating](
+    cl: A2[F], normal: A2[F], *, warp: bool = False, out: A2[F] | None = None
+) -> A2[F]:
+    """Columns are the longitudinal (z), circumferential (c = r x z) and radial (r) directions.
+
+    z only has x and z components, so the cross product is expanded by hand and every column is
+    written straight into out (n, 9) without stacking temporaries.
+    """
+    if out is None:
+        out = np.empty((normal.shape[0], 9), dtype=cl.dtype)
+    z0, z1, z2 = out[:, 0], out[:, 1], out[:, 2]
+    r0, r1, r2 = normal[:, 0], normal[:, 1], normal[:, 2]
+    z1[...] = 0.0
     if warp:
-        q = 0.5 * np.pi * cl[:, 0]
-        z[:, 0] = np.cos(q)
-        z[:, 2] = -np.sin(q)
+        q = np.multiply(cl[:, 0], 0.5 * np.pi)
+        np.cos(q, out=z0)
+        np.sin(q, out=z2)
+        np.negative(z2, out=z2)
     else:
-        z[:, 0] = 1.0
-    c = np.cross(r, z)
-    return np.column_stack((z, c, r)).astype(cl.dtype)
+        z0[...] = 1.0
+        z2[...] = 0.0
+    np.multiply(r1, z2, out=out[:, 3])
+    np.multiply(r2, z0, out=out[:, 4])
+    out[:, 4] -= r0 * z2
+    np.multiply(r1, z0, out=out[:, 5])
+    np.negative(out[:, 5], out=out[:, 5])
+    out[:, 6:9] = normal
+    return out
+
+
+def warp_in_y[F: np.floating](x: A2[F], *, out: A2[F] | None = None) -> A2[F]:
+    """Bend the cylinder along x into a quarter circle in the x-z plane, out may be x itself."""
+    if out is None:
+        out = np.empty_like(x)
+    x_max = x[:, 0].max()
+    radius = 2.0 * x_max / np.pi
+    # q and r are taken before any column of out is written, so out=x is safe
+    q = np.multiply(x[:, 0], -0.5 * np.pi / x_max)
+    q += 0.5 * np.pi
+    r = np.add(x[:, 2], radius)
+    if out is not x:
+        out[:, 1] = x[:, 1]
+    np.cos(q, out=out[:, 0])
+    out[:, 0] *= r
+    np.sin(q, out=out[:, 2])
+    out[:, 2] *= r
+    return out
+
+
+def unwarp_in_y[F: np.floating](x: A2[F], length: float) -> A2[F]:
+    """Inverse of warp_in_y for a cylinder of the given length, i.e. its original x_max."""
+    radius = 2.0 * length / np.pi
+    q = np.arctan2(x[:, 2], x[:, 0])
+    out = np.empty_like(x)
+    out[:, 0] = (0.5 * np.pi - q) * (length / (0.5 * np.pi))
+    out[:, 1] = x[:, 1]
+    out[:, 2] = np.hypot(x[:, 0], x[:, 2]) - radius
+    return out
 
 
-def warp_in_y[F: np.floating](x: A2[F]) -> A2[F]:
-    c = np.zeros_like(x)
-    radius = 2.0 * x[:, 0].max() / np.pi
-    q = 0.5 * np.pi * (1.0 - x[:, 0] / x[:, 0].max())
-    r = radius + x[:, 2]
-    c[:, 0] = r * np.cos(q)
-    c[:, 1] = x[:, 1]
-    c[:, 2] = r * np.sin(q)
-    return c
+def centerline_field_from_space[F: np.floating](
+    space: A2[F], *, out: A2[F] | None = None
+) -> A2[F]:
+    if out is None:
+        out = np.empty((space.shape[0], 2), dtype=space.dtype)
+    np.divide(space[:, 0], space[:, 0].max(), out=out[:, 0])
+    x = space[:, 2]
+    x_min = x.min()
+    np.subtract(x, x_min, out=out[:, 1])
+    out[:, 1] /= x.max() - x_min
+    return out
+
+
+def normal_from_space[F: np.floating](
+    space: A2[F], cl: A2[F], *, warp: bool = False, out: A2[F] | None = None
+) -> A2[F]:
+    """Unit normal from the centerline to each node of the straight cylinder in space.
+
+    With warp the normal is the one of the warped cylinder (see warp_in_y), which lets the
+    coordinates be warped in place afterwards without keeping a warped copy of the centers.
+    """
+    if out is None:
+        out = np.empty_like(space)
+    out[:, 0] = 0.0
+    out[:, 1:] = space[:, 1:]
+    if warp:
+        q = np.multiply(cl[:, 0], -0.5 * np.pi)
+        q += 0.5 * np.pi
+        np.multiply(out[:, 2], np.cos(q), out=out[:, 0])
+        out[:, 2] *= np.sin(q)
+    out /= np.sqrt(np.einsum("ij,ij->i", out, out))[:, None]
+    return out
 
 
 def define_centerline_field[F: np.floating, I: np.integer](mesh: CheartMesh[F, I]) -> A2[F]:
-    center_line = mesh.space.v[:, [0]] / mesh.space.v[:, 0].max()
-    x = mesh.space.v[:, 2]
-    circval = (x - x.min()) / (x.max() - x.min())
-    return np.hstack((center_line, circval[:, None]))
+    return centerline_field_from_space(mesh.space.v)
 
 
 def create_center_pos[F: np.floating, I: np.integer](mesh: CheartMesh[F, I], cl: A2[F]) -> A2[F]:
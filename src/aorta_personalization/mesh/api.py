@@ -1,11 +1,86 @@
-from ._centerline import prep_topology_meshes
-from ._cylinder import remake_cylinder_mesh
-from ._generation import prep_cheart_mesh
-from ._topology import create_topology_list
+from typing import TYPE_CHECKING
+
+from aorta_personalization._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from ._aorta import aorta_mesh_is_current
+    from ._branched import branch_ends, branched_cylinder
+    from ._cache import (
+        SharedMeshCache,
+        SharedMeshHandle,
+        attach_mesh_cache,
+        clear_mesh_cache,
+        load_mesh_tuple,
+        mesh_size,
+    )
+    from ._centerline import prep_topology_meshes
+    from ._cylinder import remake_cylinder_mesh
+    from ._generation import prep_cheart_mesh
+    from ._lock import mesh_lock
+    from ._parameterize import VesselFields, vessel_fields
+    from ._prolong import cylinder_prolongation, prolong_solution
+    from ._quality import MeshQualityReport, check_mesh_quality, preflight_mesh_check
+    from ._structured import structured_cylinder
+    from ._topology import create_topology_list
+    from ._transfer import MeshTransfer, mesh_transfer
 
 __all__ = [
+    "MeshQualityReport",
+    "MeshTransfer",
+    "SharedMeshCache",
+    "SharedMeshHandle",
+    "VesselFields",
+    "aorta_mesh_is_current",
+    "attach_mesh_cache",
+    "branch_ends",
+    "branched_cylinder",
+    "check_mesh_quality",
+    "clear_mesh_cache",
     "create_topology_list",
+    "cylinder_prolongation",
+    "load_mesh_tuple",
+    "mesh_lock",
+    "mesh_size",
+    "mesh_transfer",
+    "preflight_mesh_check",
     "prep_cheart_mesh",
     "prep_topology_meshes",
+    "prolong_solution",
     "remake_cylinder_mesh",
+    "structured_cylinder",
+    "vessel_fields",
 ]
+
+__getattr__ = lazy_getattr(
+    globals(),
+    {
+        "MeshQualityReport": "._quality",
+        "MeshTransfer": "._transfer",
+        "SharedMeshCache": "._cache",
+        "SharedMeshHandle": "._cache",
+        "VesselFields": "._parameterize",
+        "aorta_mesh_is_current": "._aorta",
+        "attach_mesh_cache": "._cache",
+        "branch_ends": "._branched",
+        "branched_cylinder": "._branched",
+        "check_mesh_quality": "._quality",
+        "clear_mesh_cache": "._cache",
+        "create_topology_list": "._topology",
+        "cylinder_prolongation": "._prolong",
+        "load_mesh_tuple": "._cache",
+        "mesh_lock": "._lock",
+        "mesh_size": "._cache",
+        "mesh_transfer": "._transfer",
+        "preflight_mesh_check": "._quality",
+        "prep_cheart_mesh": "._generation",
+        "prep_topology_meshes": "._centerline",
+        "prolong_solution": "._prolong",
+        "remake_cylinder_mesh": "._cylinder",
+        "structured_cylinder": "._structured",
+        "vessel_fields": "._parameterize",
+    },
+)
+
+
+def __dir__() -> list[str]:
+    return __all__
@@ -1,3 +1,10 @@
-from ._types import CylinderDims, ElementTypes, Geometries, MeshInfo, ProblemTopologies
+from ._types import BranchDims, CylinderDims, ElementTypes, Geometries, MeshInfo, ProblemTopologies
 
-__all__ = ["CylinderDims", "ElementTypes", "Geometries", "MeshInfo", "ProblemTopologies"]
+__all__ = [
+    "BranchDims",
+    "CylinderDims",
+    "ElementTypes",
+    "Geometries",
+    "MeshInfo",
+    "ProblemTopologies",
+]
@@ -1,7 +1,24 @@
-from ._cl_variables import expand_cl_variables_to_main_topology
-from ._tools import write_subvar
+from typing import TYPE_CHECKING
+
+from aorta_personalization._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from ._cl_variables import expand_cl_variables_to_main_topology
+    from ._tools import write_subvar
 
 __all__ = [
     "expand_cl_variables_to_main_topology",
     "write_subvar",
 ]
+
+__getattr__ = lazy_getattr(
+    globals(),
+    {
+        "expand_cl_variables_to_main_topology": "._cl_variables",
+        "write_subvar": "._tools",
+    },
+)
+
+
+def __dir__() -> list[str]:
+    return __all__
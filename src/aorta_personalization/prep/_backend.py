@@ -0,0 +1,206 @@
+import dataclasses as dc
+import os
+import re
+import sys
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, TextIO
+
+import numpy as np
+from aorta_personalization.storage.api import chread_d, chwrite_d_utf
+from cheartpy.fe.cmd import run_prep, run_problem
+from pytools.result import Err, Ok
+
+from ._types import SolverCommand
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+
+    from pytools.arrays import A2
+
+
+_CHEART = "cheartsolver.out"
+
+@dc.dataclass(slots=True, frozen=True)
+class CHeartBackend:
+    """Runs cheartsolver.out through cheartpy."""
+
+    def prep(self, prob_name: str, *, log: str) -> int:
+        return run_prep(prob_name, log=log)
+
+    def problem(self, prob_name: str, *, pedantic: bool, cores: int, log: str) -> int:
+        return run_problem(prob_name, pedantic=pedantic, cores=cores, log=log)
+
+    def prep_command(self, prob_name: str) -> SolverCommand:
+        return SolverCommand([_CHEART, prob_name, "--prep"])
+
+    def problem_command(self, prob_name: str, *, pedantic: bool, cores: int) -> SolverCommand:
+        cmd = ["mpiexec", "-n", str(cores), _CHEART, prob_name]
+        return SolverCommand([*cmd, "--pedantic-printing"] if pedantic else cmd)
+
+
+_DIRECTIVE = re.compile(r"^\s*!(\w+)\s*=\s*\{(.*)\}")
+
+
+class _Output(NamedTuple):
+    name: str
+    shape: tuple[int, int]
+    initial: Path | None
+    freq: int
+
+
+class _MockPlan(NamedTuple):
+    output_dir: Path
+    steps: range
+    outputs: list[_Output]
+
+
+def _directives(pfile: Path) -> Iterator[tuple[str, list[str], str]]:
+    """Yield (directive, fields, next line) for every !Directive={a|b|...} in the P-file."""
+    lines = [ln.split("%", 1)[0] for ln in pfile.read_text().splitlines()]
+    for i, line in enumerate(lines):
+        if m := _DIRECTIVE.match(line):
+            fields = [f.strip() for f in m.group(2).split("|")]
+            yield m.group(1), fields, lines[i + 1] if i + 1 < len(lines) else ""
+
+
+def _topology_nodes(path: str) -> int:
+    # the _FE.X header is "<nodes> <dim>", topologies without one (e.g. on the CL) have one node
+    file = Path(path + "_FE.X")
+    if not file.is_file():
+        return 1
+    with file.open() as f:
+        return int(f.readline().split()[0])
+
+
+def _mock_plan(pfile: Path) -> Ok[_MockPlan] | Err:
+    topologies: dict[str, int] = {}
+    variables: dict[str, tuple[str, Path | None, int]] = {}
+    freqs: dict[str, int] = {}
+    output_dir, steps = Path(), None
+    for key, fields, following in _directives(pfile):
+        match key, fields:
+            case "DefTimeStepScheme", _:
+                t0, nt, *_ = following.split()
+                steps = range(int(t0), int(nt) + 1)
+            case "SetOutputPath", [path]:
+                output_dir = Path(path)
+            case "DefTopology", [name, path, *_]:
+                topologies[name] = _topology_nodes(path)
+            case "DefVariablePointer", [name, top, dim]:
+                variables[name] = (top, None, int(dim))
+            case "DefVariablePointer", [name, top, file, dim]:
+                variables[name] = (top, Path(file), int(dim))
+            case "SetExportFrequency", [*names, freq]:
+                freqs.update(dict.fromkeys(names, int(freq)))
+            case _:
+                pass
+    if steps is None:
+        return Err(ValueError(f"No !DefTimeStepScheme found in {pfile}"))
+    outputs = [
+        _Output(name, (topologies.get(top, 1), dim), initial, freqs[name])
+        for name, (top, initial, dim) in variables.items()
+        if freqs.get(name, 0) > 0
+    ]
+    return Ok(_MockPlan(output_dir, steps, outputs))
+
+
+def _open_log(log: str) -> AbstractContextManager[TextIO]:
+    # "-" is the standard output, where the subprocess form of MockBackend writes its log
+    return nullcontext(sys.stdout) if log == "-" else Path(log).open("w")
+
+
+# run by the command lines of MockBackend: <prep|problem> <P-file> <prep_time> <step_time>
+_MOCK_MAIN = """
+import sys
+from aorta_personalization.prep.api import MockBackend
+cmd, prob, prep_time, step_time = sys.argv[1:]
+mock = MockBackend(step_time=float(step_time), prep_time=float(prep_time))
+if cmd == "prep":
+    sys.exit(mock.prep(prob, log="-"))
+sys.exit(mock.problem(prob, pedantic=False, cores=1, log="-"))
+"""
+
+
+def _initial_value(out: _Output) -> A2[np.float64]:
+    if out.initial is not None and out.initial.is_file():
+        data = chread_d(out.initial)
+        if data.shape == out.shape:
+            return data
+    return np.zeros(out.shape, dtype=np.float64)
+
+
+@dc.dataclass(slots=True, frozen=True)
+class MockBackend:
+    """Local stand-in for CHeart that needs nothing but the P-file and the mesh files.
+
+    The problem run writes every exported variable for every export step, shaped from its
+    topology (node count from the _FE.X header) and dimension, so postprocessing and the
+    drivers run end to end. The values are the initial condition plus a small ramp in time and
+    carry no physics. step_time (seconds per time step) simulates solver cost. The command
+    lines run the same passes in a Python subprocess, writing the log to its standard output.
+    """
+
+    step_time: float = 0.0
+    prep_time: float = 0.0
+
+    def prep(self, prob_name: str, *, log: str) -> int:
+        with _open_log(log) as f:
+            match _mock_plan(Path(prob_name)):
+                case Ok(plan):
+                    time.sleep(self.prep_time)
+                    f.write(f"Mock prep: {len(plan.outputs)} exported variables\n")
+                    return 0
+                case Err(e):
+                    f.write(f"{e}\n")
+                    return 1
+
+    def problem(
+        self,
+        prob_name: str,
+        *,
+        pedantic: bool,  # noqa: ARG002
+        cores: int,  # noqa: ARG002
+        log: str,
+    ) -> int:
+        with _open_log(log) as f:
+            match _mock_plan(Path(prob_name)):
+                case Ok(plan):
+                    pass
+                case Err(e):
+                    f.write(f"{e}\n")
+                    return 1
+            plan.output_dir.mkdir(parents=True, exist_ok=True)
+            initial = {out.name: _initial_value(out) for out in plan.outputs}
+            for step in plan.steps:
+                time.sleep(self.step_time)
+                f.write(f"Time step {step}\n")
+                f.flush()
+                ramp = 1.0e-3 * step / plan.steps.stop
+                for out in plan.outputs:
+                    if step % out.freq == 0:
+                        file = plan.output_dir / f"{out.name}-{step}.D"
+                        chwrite_d_utf(file, initial[out.name] + ramp)
+        return 0
+
+    def _command(self, cmd: str, prob_name: str) -> SolverCommand:
+        times = (str(self.prep_time), str(self.step_time))
+        # the subprocess imports this package from where the caller found it
+        root = str(Path(__file__).parents[2])
+        path = os.pathsep.join([root, *filter(None, [os.environ.get("PYTHONPATH")])])
+        env = {**os.environ, "PYTHONPATH": path}
+        return SolverCommand([sys.executable, "-c", _MOCK_MAIN, cmd, prob_name, *times], env)
+
+    def prep_command(self, prob_name: str) -> SolverCommand:
+        return self._command("prep", prob_name)
+
+    def problem_command(
+        self,
+        prob_name: str,
+        *,
+        pedantic: bool,  # noqa: ARG002
+        cores: int,  # noqa: ARG002
+    ) -> SolverCommand:
+        return self._command("problem", prob_name)
@@ -2,8 +2,9 @@ from pathlib import Path
 from typing import TYPE_CHECKING, TypedDict, Unpack
 
 import numpy as np
+from aorta_personalization.profiling.api import traced
+from aorta_personalization.storage.api import chread_d, chwrite_d_utf, is_up_to_date
 from cheartpy.cl.api import ll_interp
-from cheartpy.io.api import chread_d, chwrite_d_utf
 from cheartpy.search.api import get_var_index
 from pytools.result import Err, Ok
 
@@ -29,8 +30,10 @@ def expand_cl_variable_to_main_topology[F: np.floating, I: np.integer](
 
 class _CLVarExpandKwargs(TypedDict, total=False):
     root_dir: Path
+    overwrite: bool
 
 
+@traced()
 def expand_cl_variables_to_main_topology[F: np.floating, I: np.integer](
     part: CLPartition[F, I] | None, cl: A2[F], *variables: str, **kwargs: Unpack[_CLVarExpandKwargs]
 ) -> Ok[list[str]] | Err:
@@ -46,7 +49,11 @@ def expand_cl_variables_to_main_topology[F: np.floating, I: np.integer](
     if len(items) == 0:
         msg = f"No data files found for variable(s) {variables} with prefix {part.prefix}"
         return Err(FileNotFoundError(msg))
+    overwrite = kwargs.get("overwrite", True)
     for v in variables:
         for i in items:
+            out, src = root_dir / f"{v}-{i}.D", root_dir / f"{part.prefix}{v}-{i}.D"
+            if not overwrite and is_up_to_date(out, src):
+                continue
             expand_cl_variable_to_main_topology(part, cl[:, 0], v, i, root_dir=root_dir)
     return Ok(list(variables))
@@ -1,56 +1,132 @@
 from pathlib import Path
-from typing import TYPE_CHECKING, Required, TypedDict, Unpack
+from typing import TYPE_CHECKING, Literal, NamedTuple, Required, TypedDict, Unpack
 
 import numpy as np
-from cheartpy.fe.cmd import run_prep, run_problem
+from aorta_personalization.profiling.api import span, traced
 from cheartpy.paraview.api import cheart2vtu_find
-from pytools.path import clear_dir
+
+from ._backend import CHeartBackend
+from ._prep_cache import prep_cache_key, restore_prep_artifacts, store_prep_artifacts
+from ._scaling import auto_select_cores
+from ._scratch import remove_scratch, stage_mesh_dir
+from ._streaming import watch_outputs
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from aorta_personalization.mesh.types import MeshInfo
     from aorta_personalization.problem.types import ProblemParameters
     from cheartpy.cl.struct import CLPartition
     from pytools.logging import ILogger
 
-    from ._types import PFileGenerator
+    from ._types import PFileGenerator, SolverBackend
 
 
-class _RunnerKwargs(TypedDict, total=False):
+class RunnerKwargs(TypedDict, total=False):
     log: Required[ILogger]
     pedantic: bool
+    cores: int | Literal["auto"]
+    scaling: Path
+    max_cores: int
+    scratch: Path
+    keep_scratch: bool
+    prep_cache: bool
+    backend: SolverBackend
+    on_output: Callable[[int], None]
+    watch: Sequence[str]
+
+
+class RunFiles(NamedTuple):
+    prob_name: str
+    prob_log: str
+    prep_log: str
+    output_dir: Path
+    scratch: Path
+    prep_key: str
     cores: int
 
 
-def run_simulation[F: np.floating, I: np.integer](
+def prepare_run[F: np.floating, I: np.integer](
     pfile_call: PFileGenerator[F, I],
     pb: ProblemParameters,
     mesh: MeshInfo,
     *parts: CLPartition[F, I] | None,
-    **kwargs: Unpack[_RunnerKwargs],
-) -> None:
+    **kwargs: Unpack[RunnerKwargs],
+) -> RunFiles:
+    """Pick the core count, stage the mesh and write the P-file for a run."""
     log = kwargs.get("log")
-    pedantic = kwargs.get("pedantic", False)
     cores = kwargs.get("cores", 16)
-    prob_name, prob_log = [pb.P.N + ext for ext in [".P", ".log"]]
-    prep_log = pb.P.N + ".prep.log"
+    if cores == "auto":
+        cores = auto_select_cores(
+            pb,
+            mesh,
+            log=log,
+            store=kwargs.get("scaling", Path("scaling.json")),
+            max_cores=kwargs.get("max_cores", 32),
+        )
+    scratch = kwargs.get("scratch", Path(pb.P.N + ".scratch"))
+    prob_name = str(scratch / (Path(pb.P.N).name + ".P"))
+    prob_log, prep_log = [pb.P.N + ext for ext in [".log", ".prep.log"]]
     log.info(f"Starting {prob_name}")
+    run_mesh = stage_mesh_dir(mesh, scratch, log=log)
     log.info("Making P-file")
-    pfile = pfile_call(pb, mesh, *parts).unwrap()
-    with Path(prob_name).open("w") as f:
-        pfile.write(f)
+    with span("pfile", log=log):
+        # generate first, a failed generation must not leave an empty P-file behind
+        pfile = pfile_call(pb, run_mesh, *parts).unwrap()
+        with Path(prob_name).open("w") as f:
+            pfile.write(f)
     log.info(f"{prob_name} is written to file")
-    clear_dir(mesh.DIR, "*.PART", "*.IN")
-    err = run_prep(prob_name, log=prep_log)
-    if err > 0:
-        msg = f"Cheart prep failed with error code {err}"
-        log.error(msg)
-    log.info(f"Running Cheart ({prob_log}):")
-    log.info(f"Results are saved to {pfile.output_dir}:")
-    err = run_problem(prob_name, pedantic=pedantic, cores=cores, log=prob_log)
+    prep_key = prep_cache_key(Path(prob_name), run_mesh, cores)
+    return RunFiles(
+        prob_name, prob_log, prep_log, Path(pfile.output_dir), scratch, prep_key, cores
+    )
+
+
+def run_simulation[F: np.floating, I: np.integer](
+    pfile_call: PFileGenerator[F, I],
+    pb: ProblemParameters,
+    mesh: MeshInfo,
+    *parts: CLPartition[F, I] | None,
+    **kwargs: Unpack[RunnerKwargs],
+) -> None:
+    log = kwargs.get("log")
+    pedantic = kwargs.get("pedantic", False)
+    backend = kwargs.get("backend", CHeartBackend())
+    run = prepare_run(pfile_call, pb, mesh, *parts, **kwargs)
+    use_cache = kwargs.get("prep_cache", True)
+    if use_cache and restore_prep_artifacts(mesh, run.prep_key, run.scratch):
+        log.info(f"Cheart prep artifacts restored from cache {run.prep_key}, skipping prep")
+    else:
+        with span("run_prep", log=log):
+            err = backend.prep(run.prob_name, log=run.prep_log)
+        if err > 0:
+            msg = f"Cheart prep failed with error code {err}"
+            log.error(msg)
+        elif use_cache:
+            store_prep_artifacts(mesh, run.prep_key, run.scratch)
+    log.info(f"Running Cheart ({run.prob_log}):")
+    log.info(f"Results are saved to {run.output_dir}:")
+    watcher = watch_outputs(
+        run.output_dir, kwargs.get("watch", ("Disp",)), kwargs.get("on_output")
+    )
+    with span("run_problem", log=log, cores=run.cores), watcher:
+        err = backend.problem(
+            run.prob_name, pedantic=pedantic, cores=run.cores, log=run.prob_log
+        )
+    finish_run(run, err, keep_scratch=kwargs.get("keep_scratch", False), log=log)
+
+
+def finish_run(run: RunFiles, err: int, *, keep_scratch: bool, log: ILogger) -> None:
+    """Report the solver exit code and remove the scratch directory of a successful run.
+
+    Failed runs keep theirs so the P-file and prep artifacts can be inspected.
+    """
     log.info(f"Simulation exited with error {err}")
     if err > 0:
         msg = f"Cheart simulation failed with error code {err}"
-        log.error(msg)
+        log.error(msg, f"Keeping {run.scratch} for inspection")
+    elif not keep_scratch:
+        remove_scratch(run.scratch, log=log)
 
 
 def cheart2vtu_cmdline_args(
@@ -65,6 +141,7 @@ def cheart2vtu_cmdline_args(
     ]  # fmt: skip
 
 
+@traced()
 def run_vtu(
     mesh: MeshInfo,
     pb: ProblemParameters,
@@ -0,0 +1,179 @@
+import asyncio
+import re
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Unpack
+
+import numpy as np
+from aorta_personalization.profiling.api import span
+
+from ._backend import CHeartBackend
+from ._cmd import RunnerKwargs, finish_run, prepare_run
+from ._prep_cache import restore_prep_artifacts, store_prep_artifacts
+from ._scratch import remove_scratch
+from ._streaming import watch_outputs
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from aorta_personalization.mesh.types import MeshInfo
+    from aorta_personalization.problem.types import ProblemParameters
+    from cheartpy.cl.struct import CLPartition
+
+    from ._cmd import RunFiles
+    from ._types import PFileGenerator, SolverBackend, SolverCommand
+
+
+_TERMINATE_TIMEOUT = 10.0
+_READ_SIZE = 1 << 16
+_STEP_PATTERN = re.compile(rb"time\s*step\D{0,3}(\d+)", re.IGNORECASE)
+
+
+class CoreBudget:
+    """Shared pool of cores for runs launched concurrently from one event loop."""
+
+    __slots__ = ("_available", "_cond", "_total")
+
+    def __init__(self, cores: int) -> None:
+        self._total = cores
+        self._available = cores
+        self._cond = asyncio.Condition()
+
+    @asynccontextmanager
+    async def reserve(self, cores: int) -> AsyncIterator[None]:
+        # a run larger than the whole budget gets all of it rather than waiting forever
+        cores = min(cores, self._total)
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._available >= cores)
+            self._available -= cores
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._available += cores
+                self._cond.notify_all()
+
+
+async def _pipe_output(
+    stream: asyncio.StreamReader, log_file: Path, on_step: Callable[[int], None] | None
+) -> None:
+    # read in blocks rather than lines, a solver line has no length limit
+    tail = b""
+    with log_file.open("wb") as f:
+        while block := await stream.read(_READ_SIZE):
+            f.write(block)
+            if on_step is None:
+                continue
+            *lines, tail = (tail + block).split(b"\n")
+            for line in lines:
+                if m := _STEP_PATTERN.search(line):
+                    on_step(int(m.group(1)))
+
+
+async def run_command_async(
+    command: SolverCommand, *, log_file: Path, on_step: Callable[[int], None] | None = None
+) -> int:
+    """Run a solver command, streaming its merged stdout/stderr into log_file.
+
+    on_step gets the step number of every "time step <n>" line. Cancelling the awaiting task
+    terminates the process, and kills it if it does not exit within a few seconds, before the
+    cancellation propagates.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *command.argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        env=command.env,
+    )
+    try:
+        if proc.stdout is not None:
+            await _pipe_output(proc.stdout, log_file, on_step)
+        return await proc.wait()
+    except asyncio.CancelledError:
+        proc.terminate()
+        try:
+            await asyncio.wait_for(proc.wait(), _TERMINATE_TIMEOUT)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+        raise
+
+
+class _AsyncRunnerKwargs(RunnerKwargs, total=False):
+    on_step: Callable[[int], None]
+    budget: CoreBudget
+
+
+async def run_simulation_async[F: np.floating, I: np.integer](
+    pfile_call: PFileGenerator[F, I],
+    pb: ProblemParameters,
+    mesh: MeshInfo,
+    *parts: CLPartition[F, I] | None,
+    **kwargs: Unpack[_AsyncRunnerKwargs],
+) -> None:
+    """Async counterpart of run_simulation.
+
+    Many runs can be awaited together (asyncio.gather / TaskGroup) from one driver process;
+    pass a shared CoreBudget to keep the total number of cores in use bounded. The solver runs
+    as a subprocess from the backend's command lines (CHeartBackend by default), its output is
+    streamed into the log files and on_step. Staging, the prep cache and clean up run in worker
+    threads. Cancelling the task terminates the solver and removes the scratch directory unless
+    keep_scratch is set.
+    """
+    log = kwargs.get("log")
+    backend = kwargs.get("backend", CHeartBackend())
+    keep_scratch = kwargs.get("keep_scratch", False)
+    run = await asyncio.to_thread(prepare_run, pfile_call, pb, mesh, *parts, **kwargs)
+    try:
+        err = await _solve(backend, mesh, run, **kwargs)
+    except asyncio.CancelledError:
+        log.info(f"{run.prob_name} was cancelled")
+        if not keep_scratch:
+            # not awaited, a second cancellation must not leave the directory behind
+            remove_scratch(run.scratch, log=log)
+        raise
+    await asyncio.to_thread(finish_run, run, err, keep_scratch=keep_scratch, log=log)
+
+
+async def _solve(
+    backend: SolverBackend,
+    mesh: MeshInfo,
+    run: RunFiles,
+    /,
+    **kwargs: Unpack[_AsyncRunnerKwargs],
+) -> int:
+    log = kwargs.get("log")
+    pedantic = kwargs.get("pedantic", False)
+    use_cache = kwargs.get("prep_cache", True)
+    if use_cache and await asyncio.to_thread(
+        restore_prep_artifacts, mesh, run.prep_key, run.scratch
+    ):
+        log.info(f"Cheart prep artifacts restored from cache {run.prep_key}, skipping prep")
+    else:
+        with span("run_prep", log=log):
+            err = await run_command_async(
+                backend.prep_command(run.prob_name), log_file=Path(run.prep_log)
+            )
+        if err > 0:
+            msg = f"Cheart prep failed with error code {err}"
+            log.error(msg)
+        elif use_cache:
+            await asyncio.to_thread(store_prep_artifacts, mesh, run.prep_key, run.scratch)
+    command = backend.problem_command(run.prob_name, pedantic=pedantic, cores=run.cores)
+    budget = kwargs.get("budget")
+    async with budget.reserve(run.cores) if budget else _no_budget():
+        log.info(f"Running Cheart ({run.prob_log}):")
+        log.info(f"Results are saved to {run.output_dir}:")
+        watcher = watch_outputs(
+            run.output_dir, kwargs.get("watch", ("Disp",)), kwargs.get("on_output")
+        )
+        with span("run_problem", log=log, cores=run.cores):
+            async with watcher:
+                return await run_command_async(
+                    command, log_file=Path(run.prob_log), on_step=kwargs.get("on_step")
+                )
+
+
+@asynccontextmanager
+async def _no_budget() -> AsyncIterator[None]:
+    yield
@@ -0,0 +1,120 @@
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING
+
+from aorta_personalization.mesh.api import (
+    SharedMeshCache,
+    aorta_mesh_is_current,
+    attach_mesh_cache,
+    load_mesh_tuple,
+    mesh_lock,
+)
+from aorta_personalization.mesh.types import Geometries
+from cheartpy.io.api import check_for_meshes
+from pytools.logging import get_logger
+from pytools.result import Err, Ok
+
+from ._setup import run_setup
+from ._types import PatientReport
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from aorta_personalization.mesh.types import MeshInfo
+    from aorta_personalization.problem.types import ProblemParameters
+    from pytools.logging import ILogger, LogLevel
+
+
+# a mesh is parsed in the driver once at least this many patients use it
+_SHARED = 2
+
+
+def _is_cached(mesh: MeshInfo) -> bool:
+    if mesh.GEO is Geometries.AORTA:
+        return aorta_mesh_is_current(mesh)
+    return check_for_meshes(mesh.DISP, mesh.PRES, home=mesh.DIR)
+
+
+def setup_patient(pb: ProblemParameters, mesh: MeshInfo, level: LogLevel) -> PatientReport:
+    """Mesh import, CL/DL topologies and field export for one patient, never raises."""
+    log = get_logger(level=level)
+    start = time.perf_counter()
+    cached = False
+    try:
+        cached = _is_cached(mesh)
+        # a stale aorta mesh is rebuilt, which also clears the topologies derived from it
+        res = run_setup(pb, mesh, log=log, override=not cached)
+    except Exception as e:
+        res = Err(e)
+    elapsed = time.perf_counter() - start
+    match res:
+        case Ok():
+            return PatientReport(str(mesh.DIR), "cached" if cached else "created", elapsed)
+        case Err(e):
+            return PatientReport(str(mesh.DIR), "failed", elapsed, f"{type(e).__name__}: {e}")
+
+
+def _preload_shared_meshes(
+    patients: Sequence[tuple[ProblemParameters, MeshInfo]], *, log: ILogger
+) -> None:
+    """Parse existing meshes used by several patients once, in the driver's mesh cache."""
+    users = Counter(mesh.DIR for _, mesh in patients)
+    loaded: set[Path] = set()
+    for _, mesh in patients:
+        if users[mesh.DIR] < _SHARED or mesh.DIR in loaded:
+            continue
+        loaded.add(mesh.DIR)
+        try:
+            current = _is_cached(mesh)
+        except OSError:
+            continue
+        if not current:
+            continue
+        with mesh_lock(mesh, shared=True):
+            match load_mesh_tuple(mesh):
+                case Ok():
+                    log.debug(f"Sharing parsed mesh {mesh.DIR} with {users[mesh.DIR]} patients")
+                case Err(e):
+                    log.debug(f"Mesh {mesh.DIR} is parsed by each worker ({e})")
+
+
+def setup_cohort(
+    patients: Sequence[tuple[ProblemParameters, MeshInfo]],
+    *,
+    log: ILogger,
+    workers: int = 4,
+    level: LogLevel = "ERROR",
+) -> list[PatientReport]:
+    """Run the setup of many patients in a process pool.
+
+    Patients sharing a mesh.DIR must describe the same mesh (and mesh.DATA for aorta meshes).
+    Patients whose outputs are newer than their data are only checked, not rebuilt. Existing
+    meshes shared by several patients are parsed once here and reach the workers through
+    read-only shared memory, as does anything else already in this process's mesh cache.
+    Reports come back in the order of patients; failures are reported, not raised. level is
+    the log level of the workers.
+    """
+    reports: dict[int, PatientReport] = {}
+    _preload_shared_meshes(patients, log=log)
+    with (
+        SharedMeshCache() as cache,
+        ProcessPoolExecutor(
+            max_workers=workers, initializer=attach_mesh_cache, initargs=(cache.handles,)
+        ) as exe,
+    ):
+        futures = {
+            exe.submit(setup_patient, pb, mesh, level): k for k, (pb, mesh) in enumerate(patients)
+        }
+        for fut in as_completed(futures):
+            r = reports[futures[fut]] = fut.result()
+            msg = f"{r.name}: {r.status} in {r.elapsed:.1f}s"
+            if r.error is None:
+                log.info(msg)
+            else:
+                log.error(f"{msg} ({r.error})")
+    failed = sum(r.status == "failed" for r in reports.values())
+    cached = sum(r.status == "cached" for r in reports.values())
+    log.info(f"Cohort setup: {len(reports)} patients, {cached} cached, {failed} failed")
+    return [reports[k] for k in range(len(patients))]
@@ -1,19 +1,43 @@
-from ._forward import (
-    postprocess_physical_space,
-    update_physical_space,
-)
-from ._inverse import (
-    compute_stiffness_from_dl_field,
-    postprocess_inverse_prob,
-    update_stiffness,
-)
-from ._reference_data import make_reference_data_for_inverse_estimation
+from typing import TYPE_CHECKING
+
+from aorta_personalization._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from ._forward import (
+        forward_step_postprocessing,
+        postprocess_physical_space,
+        update_physical_space,
+    )
+    from ._inverse import (
+        compute_stiffness_from_dl_field,
+        postprocess_inverse_prob,
+        update_stiffness,
+    )
+    from ._reference_data import make_reference_data_for_inverse_estimation
 
 __all__ = [
     "compute_stiffness_from_dl_field",
+    "forward_step_postprocessing",
     "make_reference_data_for_inverse_estimation",
     "postprocess_inverse_prob",
     "postprocess_physical_space",
     "update_physical_space",
     "update_stiffness",
 ]
+
+__getattr__ = lazy_getattr(
+    globals(),
+    {
+        "compute_stiffness_from_dl_field": "._inverse",
+        "forward_step_postprocessing": "._forward",
+        "make_reference_data_for_inverse_estimation": "._reference_data",
+        "postprocess_inverse_prob": "._inverse",
+        "postprocess_physical_space": "._forward",
+        "update_physical_space": "._forward",
+        "update_stiffness": "._inverse",
+    },
+)
+
+
+def __dir__() -> list[str]:
+    return __all__
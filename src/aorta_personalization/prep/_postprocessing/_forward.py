@@ -2,14 +2,29 @@ from pathlib import Path
 from typing import TYPE_CHECKING, TypedDict, Unpack
 
 import numpy as np
-from cheartpy.io.api import chread_d, chwrite_d_utf
+from aorta_personalization.profiling.api import traced
+from aorta_personalization.storage.api import (
+    chread_d,
+    chwrite_d_utf,
+    io_since,
+    io_snapshot,
+    is_up_to_date,
+    log_io_summary,
+)
 from cheartpy.search.api import get_var_index
+from pytools.logging import get_logger
 from pytools.parallel import ThreadedRunner
 from pytools.progress import ProgressBar
 from pytools.result import Err, Ok
 
+from .._cl_variables import expand_cl_variable_to_main_topology
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from cheartpy.cl.struct import CLPartition
     from pytools.arrays import A2, DType
+    from pytools.logging import ILogger
 
 
 class _UPSKW(TypedDict, total=False):
@@ -20,9 +35,10 @@ class _UPSKW(TypedDict, total=False):
 class _PostProcessPhysicalSpaceKwargs(TypedDict, total=False):
     home: Path
     space: str
-    stiff: str
     cores: int
     prog_bar: bool
+    log: ILogger
+    overwrite: bool
 
 
 def update_physical_space[F: np.floating](
@@ -39,13 +55,7 @@ def update_physical_space[F: np.floating](
     chwrite_d_utf((data_dir / f"{space}-{i}.D"), cur + ref)
 
 
-def stripe_modulus_from_stiff_var(i: int, **kwargs: Unpack[_UPSKW]) -> None:
-    root = kwargs.get("home", Path())
-    prefix = kwargs.get("prefix", "Stiff")
-    stiff = chread_d(root / f"{prefix}-{i}.D")
-    chwrite_d_utf(root / f"{prefix}-{i}.D", stiff[:, [0]])
-
-
+@traced()
 def postprocess_physical_space(
     ref_space: Path, disp: str, **kwargs: Unpack[_PostProcessPhysicalSpaceKwargs]
 ) -> Ok[None] | Err:
@@ -57,10 +67,14 @@ def postprocess_physical_space(
 
     """
     _bar = kwargs.get("prog_bar", False)
+    log = kwargs.get("log", get_logger())
+    io_start = io_snapshot()
+    # shared by every worker thread, read-only so no thread can mutate it under another
     x_i = chread_d(ref_space)
+    x_i.flags.writeable = False
     home = kwargs.get("home", Path())
-    files = (f.name for f in home.glob(f"{disp}-*.D"))
-    if not any(files):
+    files = [f.name for f in home.glob(f"{disp}-*.D")]
+    if not files:
         msg = f"No variable files found for displacement variable '{disp}' in directory '{home}'."
         return Err(ValueError(msg))
     match get_var_index(files, disp):
@@ -68,14 +82,46 @@ def postprocess_physical_space(
             pass
         case Err(e):
             return Err(e)
-    phys_args = [
-        ([x_i, disp, i], {"home": home, "space": kwargs.get("space", "Space")}) for i in items
-    ]
-    stiff_args = [([i], {"home": home, "prefix": kwargs.get("stiff", "Stiff")}) for i in items]
-    bart = ProgressBar(len(phys_args) + len(stiff_args)) if _bar else None
+    space = kwargs.get("space", "Space")
+    if not kwargs.get("overwrite", True):
+        # steps already handled while the solver was running
+        items = [
+            i
+            for i in items
+            if not is_up_to_date(home / f"{space}-{i}.D", home / f"{disp}-{i}.D")
+        ]
+    phys_args = [([x_i, disp, i], {"home": home, "prefix": space}) for i in items]
+    bart = ProgressBar(len(phys_args)) if _bar else None
     with ThreadedRunner(thread=kwargs.get("cores", 1), prog_bar=bart) as exe:
         for args, kw in phys_args:
             exe.submit(update_physical_space, *args, **kw)
-        for args, kw in stiff_args:
-            exe.submit(stripe_modulus_from_stiff_var, *args, **kw)
+    log_io_summary(io_since(io_start), log=log, title="Physical space I/O")
     return Ok(None)
+
+
+def forward_step_postprocessing[F: np.floating, I: np.integer](
+    ref_space: Path,
+    disp: str,
+    *,
+    home: Path,
+    cl_top: CLPartition[F, I] | None = None,
+    cl: A2[F] | None = None,
+    cl_vars: Sequence[str] = (),
+    space: str = "Space",
+) -> Callable[[int], None]:
+    """Per step counterpart of postprocess_physical_space and the CL variable expansion.
+
+    Pass the result as on_output to run_simulation; the batch stages run afterwards with
+    overwrite=False then only pick up steps the watcher did not get to.
+    """
+    x_i = chread_d(ref_space)
+    x_i.flags.writeable = False
+
+    def _step(i: int) -> None:
+        update_physical_space(x_i, disp, i, home=home, prefix=space)
+        if cl_top is None or cl is None:
+            return
+        for v in cl_vars:
+            expand_cl_variable_to_main_topology(cl_top, cl[:, 0], v, i, root_dir=home)
+
+    return _step
@@ -2,12 +2,21 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Required, TypedDict, Unpack
 
 import numpy as np
-from aorta_personalization.prep import expand_cl_variables_to_main_topology, write_subvar
-from cheartpy.io.api import chread_d, chwrite_d_utf
+from aorta_personalization.prep import expand_cl_variables_to_main_topology
+from aorta_personalization.profiling.api import span, traced
+from aorta_personalization.storage.api import (
+    chread_d,
+    chwrite_d_utf,
+    io_since,
+    io_snapshot,
+    log_io_summary,
+)
 from cheartpy.search.api import get_var_index
 from pytools.logging import get_logger
 from pytools.result import Err, Ok
 
+from .._prefetch import run_step_pipeline
+from .._tools import read_subvar, store_subvar, subvar
 from ._forward import postprocess_physical_space
 
 if TYPE_CHECKING:
@@ -23,13 +32,18 @@ class _UpdateStiffnessKwargs(TypedDict, total=False):
     output: str
 
 
+def _stiffness_from_lm[F: np.floating](lm: A2[F]) -> A2[F]:
+    return 10.0 * (1.0 + lm)
+
+
 def update_stiffness(root: Path, i: int, **kwargs: Unpack[_UpdateStiffnessKwargs]) -> None:
     var = kwargs.get("lm", "DM")
     out = kwargs.get("output", "Stiff")
     lm = chread_d(root / f"{var}-{i}.D")
-    chwrite_d_utf(root / f"{out}-{i}.D", 10.0 * (1.0 + lm))
+    chwrite_d_utf(root / f"{out}-{i}.D", _stiffness_from_lm(lm))
 
 
+@traced()
 def compute_stiffness_from_dl_field[F: np.floating, I: np.integer](
     part: CLPartition[F, I] | None,
     prefix: str,
@@ -57,18 +71,18 @@ def compute_stiffness_from_dl_field[F: np.floating, I: np.integer](
             pass
         case Err(e):
             return Err(e)
-    for i in items:
-        update_stiffness(root_dir, i, **kwargs)
+    var = kwargs.get("lm", "DM")
+    out = kwargs.get("output", "Stiff")
+    run_step_pipeline(
+        items,
+        lambda i: chread_d(root_dir / f"{var}-{i}.D"),
+        lambda _, lm: _stiffness_from_lm(lm),
+        lambda i, stiff: chwrite_d_utf(root_dir / f"{out}-{i}.D", stiff),
+    )
     return Ok(prefix)
 
 
-def invert_var_for_inverse_mechanics(var: Path, out: Path) -> None:
-    if not var.is_file():
-        return
-    data = chread_d(var)
-    chwrite_d_utf(out, -data)
-
-
+@traced()
 def postprocess_inverse_mechanics(
     *var: tuple[str, str],
     root_dir: Path,
@@ -84,10 +98,12 @@ def postprocess_inverse_mechanics(
             case Err(e):
                 log.error(f"Failed to get variable indices for {v_in}: {e}")
                 continue
-        for i in items:
-            invert_var_for_inverse_mechanics(
-                root_dir / f"{v_in}-{i}.D", root_dir / f"{v_out}-{i}.D"
-            )
+        run_step_pipeline(
+            items,
+            lambda i, v=v_in: chread_d(root_dir / f"{v}-{i}.D"),
+            lambda _, data: -data,
+            lambda i, data, v=v_out: chwrite_d_utf(root_dir / f"{v}-{i}.D", data),
+        )
 
 
 class _PostProcessInverseProbKwargs(TypedDict, total=False):
@@ -96,6 +112,7 @@ class _PostProcessInverseProbKwargs(TypedDict, total=False):
     cores: int
 
 
+@traced()
 def postprocess_inverse_prob[F: np.floating, I: np.integer](
     pb: ProblemParameters,
     mesh: MeshInfo,
@@ -107,9 +124,15 @@ def postprocess_inverse_prob[F: np.floating, I: np.integer](
     log = kwargs.get("log", get_logger())
     _bar = kwargs.get("prog_bar", True)
     _cores = kwargs.get("cores", 1)
+    io_start = io_snapshot()
     log.info("Post processing exported variables")
     postprocess_physical_space(
-        mesh.DIR / (mesh.DISP + "_FE.X"), "Disp", home=pb.P.D, cores=_cores, prog_bar=_bar
+        mesh.DIR / (mesh.DISP + "_FE.X"),
+        "Disp",
+        home=pb.P.D,
+        cores=_cores,
+        prog_bar=_bar,
+        log=log,
     )
     postprocess_inverse_mechanics(("U0", "RefDisp"), root_dir=pb.P.D, log=log)
     match expand_cl_variables_to_main_topology(cl_top, cl, "0LM", "tLM", root_dir=pb.P.D):
@@ -145,8 +168,14 @@ def postprocess_inverse_prob[F: np.floating, I: np.integer](
         case Err(e):
             log.error(f"Failed to get variable indices for Ut: {e}")
             items = []
-    for i in items:
-        write_subvar(pb.P, i, disp_i="U0", disp_t="Ut", disp="Disp")
+    with span("write_subvar", log=log):
+        run_step_pipeline(
+            items,
+            lambda i: read_subvar(pb.P, i),
+            lambda _, pair: subvar(pair),
+            lambda i, disp: store_subvar(pb.P, i, disp),
+        )
+    log_io_summary(io_since(io_start), log=log, title="Inverse postprocessing I/O")
     log.info("Creating vtus")
     export_vars = ["Disp", "RefDisp", "CLField", "X0", "Xt", "Xi", "U0", "Ut", "CLz"]
     return [*export_vars, *cl_vars, *stiff]
@@ -2,8 +2,9 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Required, TypedDict, Unpack, cast
 
 import numpy as np
+from aorta_personalization.profiling.api import traced
+from aorta_personalization.storage.api import chread_d, chwrite_d_utf
 from cheartpy.cl.noise import create_noise
-from cheartpy.io.api import chread_d, chwrite_d_utf
 from cheartpy.search.api import get_var_index
 from pytools.logging import ILogger, get_logger
 from pytools.result import Err, Ok
@@ -49,6 +50,7 @@ def _unpack_variable_prefixes(**kwargs: Unpack[_MakeReferenceDataKwargs]) -> Pro
     )
 
 
+@traced()
 def make_reference_data_for_inverse_estimation[F: np.floating, I: np.integer](
     pb: ProblemParameters,
     mesh: MeshInfo,
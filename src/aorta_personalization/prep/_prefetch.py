@@ -0,0 +1,44 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from concurrent.futures import Future
+
+
+def run_step_pipeline[T, R](
+    items: Iterable[int],
+    load: Callable[[int], T],
+    compute: Callable[[int, T], R],
+    store: Callable[[int, R], None],
+    *,
+    depth: int = 2,
+) -> None:
+    """Run load -> compute -> store over the steps with reading and writing in the background.
+
+    Up to depth steps are loaded ahead of the one being computed and up to depth results wait
+    to be stored, so memory stays bounded by roughly 2 * depth + 1 steps. compute runs on the
+    calling thread in step order. The first exception from any stage is raised here.
+    """
+    depth = max(depth, 1)
+    steps = iter(items)
+    with (
+        ThreadPoolExecutor(1, thread_name_prefix="step-read") as reader,
+        ThreadPoolExecutor(1, thread_name_prefix="step-write") as writer,
+    ):
+        ahead: deque[tuple[int, Future[T]]] = deque()
+        pending: deque[Future[None]] = deque()
+        for i in steps:
+            ahead.append((i, reader.submit(load, i)))
+            if len(ahead) >= depth:
+                break
+        while ahead:
+            i, loaded = ahead.popleft()
+            if (nxt := next(steps, None)) is not None:
+                ahead.append((nxt, reader.submit(load, nxt)))
+            pending.append(writer.submit(store, i, compute(i, loaded.result())))
+            while len(pending) > depth:
+                pending.popleft().result()
+        for written in pending:
+            written.result()
@@ -0,0 +1,65 @@
+import hashlib
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ._scratch import RUN_ARTIFACTS
+
+if TYPE_CHECKING:
+    from aorta_personalization.mesh.types import MeshInfo
+
+
+# P-file directives that determine what cheart prep generates
+_PREP_DIRECTIVES = ("!DefTopology", "!DefInterface", "!SetTopology")
+
+
+def prep_cache_dir(mesh: MeshInfo) -> Path:
+    return mesh.DIR.parent / f".{mesh.DIR.name}.prep"
+
+
+def prep_cache_key(pfile: Path, staged: MeshInfo, cores: int) -> str:
+    """Hash of everything cheart prep depends on.
+
+    That is the mesh files staged for the run (name, size and mtime, which hard links and copies
+    keep from the shared mesh), the topology and interface declarations of the P-file with the
+    scratch path stripped, and the core count. Hashing the staged copy rather than the shared
+    directory keys exactly the files prep reads, even if the shared mesh is being regenerated.
+    """
+    h = hashlib.sha256()
+    for f in sorted(staged.DIR.iterdir()):
+        if f.is_file() and f.suffix not in RUN_ARTIFACTS and f.name != pfile.name:
+            st = f.stat()
+            h.update(f"{f.name}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    with pfile.open("r") as fp:
+        for line in fp:
+            if line.lstrip().startswith(_PREP_DIRECTIVES):
+                h.update(line.replace(str(staged.DIR), "").encode())
+    h.update(f"cores:{cores}".encode())
+    return h.hexdigest()[:16]
+
+
+def restore_prep_artifacts(mesh: MeshInfo, key: str, scratch: Path) -> bool:
+    if not (cached := prep_cache_dir(mesh) / key).is_dir():
+        return False
+    # copied rather than linked, cheart may rewrite them in place during the run
+    for f in cached.iterdir():
+        shutil.copy2(f, scratch / f.name)
+    return True
+
+
+def store_prep_artifacts(mesh: MeshInfo, key: str, scratch: Path) -> None:
+    cache = prep_cache_dir(mesh)
+    if (cache / key).is_dir():
+        return
+    cache.mkdir(parents=True, exist_ok=True)
+    # populate a private directory first and rename it, readers never see a partial entry
+    tmp = Path(tempfile.mkdtemp(dir=cache, prefix=f".{key}."))
+    for f in scratch.iterdir():
+        if f.is_file() and f.suffix in RUN_ARTIFACTS:
+            shutil.copy2(f, tmp / f.name)
+    try:
+        tmp.rename(cache / key)
+    except OSError:
+        # another run stored the same key first
+        shutil.rmtree(tmp, ignore_errors=True)
@@ -0,0 +1,165 @@
+import dataclasses as dc
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Required, TypedDict, Unpack
+
+import numpy as np
+from aorta_personalization.mesh.api import mesh_size
+from pytools.result import Err, Ok
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from aorta_personalization.mesh.types import MeshInfo
+    from aorta_personalization.problem.types import ProblemParameters
+    from pytools.logging import ILogger
+
+
+_MIN_SAMPLES = 2
+
+
+@dc.dataclass(slots=True, frozen=True)
+class ScalingModel:
+    """Strong-scaling fit of the run time, t(p) = serial + parallel / p + overhead * p."""
+
+    serial: float
+    parallel: float
+    overhead: float
+    samples: tuple[tuple[int, float], ...] = ()
+
+    def predict(self, cores: int) -> float:
+        return self.serial + self.parallel / cores + self.overhead * cores
+
+    def efficiency(self, cores: int) -> float:
+        return self.predict(1) / (cores * self.predict(cores))
+
+
+def scaling_key(pb: ProblemParameters, mesh: MeshInfo) -> str:
+    """Class of problems sharing a scaling curve: geometry, discretization, size and CL/DL sizes.
+
+    The size is the element and node count in the header of the displacement topology, the mesh
+    must exist.
+    """
+    ne, nn = mesh_size(mesh)
+    parts = [f"{lbl}{n}" for lbl, n in [(pb.P.CL, pb.P.CL_n), (pb.P.DL, pb.P.DL_n)] if lbl]
+    return "-".join([mesh.GEO, f"{mesh.ELEM}{mesh.ORDER}", f"{ne}e{nn}n", *parts])
+
+
+def fit_scaling_model(samples: Sequence[tuple[int, float]]) -> Ok[ScalingModel] | Err:
+    if (distinct := len({p for p, _ in samples})) < _MIN_SAMPLES:
+        msg = f"At least {_MIN_SAMPLES} distinct core counts are needed, got {distinct}"
+        return Err(ValueError(msg))
+    p = np.array([s[0] for s in samples], dtype=float)
+    t = np.array([s[1] for s in samples], dtype=float)
+    basis = np.column_stack((np.ones_like(p), 1.0 / p, p))
+    coef, *_ = np.linalg.lstsq(basis, t, rcond=None)
+    # negative terms are unphysical, drop them and refit the remaining ones
+    keep = coef > 0.0
+    coef = np.zeros(3)
+    if keep.any():
+        coef[keep], *_ = np.linalg.lstsq(basis[:, keep], t, rcond=None)
+    coef = np.maximum(coef, 0.0)
+    samples = tuple((int(c), float(s)) for c, s in samples)
+    return Ok(ScalingModel(float(coef[0]), float(coef[1]), float(coef[2]), samples))
+
+
+def select_cores(model: ScalingModel, max_cores: int, *, min_efficiency: float = 0.5) -> int:
+    """Fastest predicted core count whose parallel efficiency stays above min_efficiency."""
+    candidates = [p for p in range(1, max_cores + 1) if model.efficiency(p) >= min_efficiency]
+    return min(candidates or [1], key=model.predict)
+
+
+def load_scaling_models(store: Path) -> dict[str, ScalingModel]:
+    if not store.is_file():
+        return {}
+    with store.open("r") as f:
+        raw: Mapping[str, Mapping[str, Any]] = json.load(f)
+    return {
+        k: ScalingModel(
+            float(v["serial"]),
+            float(v["parallel"]),
+            float(v["overhead"]),
+            tuple((int(p), float(t)) for p, t in v["samples"]),
+        )
+        for k, v in raw.items()
+    }
+
+
+def save_scaling_model(store: Path, key: str, model: ScalingModel) -> None:
+    models = load_scaling_models(store)
+    models[key] = model
+    store.parent.mkdir(parents=True, exist_ok=True)
+    with store.open("w") as f:
+        json.dump({k: dc.asdict(v) for k, v in models.items()}, f, indent=2)
+
+
+class _AutoCoresKwargs(TypedDict, total=False):
+    log: Required[ILogger]
+    store: Path
+    max_cores: int
+    min_efficiency: float
+    fallback: int
+
+
+def auto_select_cores(
+    pb: ProblemParameters, mesh: MeshInfo, **kwargs: Unpack[_AutoCoresKwargs]
+) -> int:
+    log = kwargs["log"]
+    store = kwargs.get("store", Path("scaling.json"))
+    max_cores = kwargs.get("max_cores", 32)
+    fallback = kwargs.get("fallback", 16)
+    try:
+        key = scaling_key(pb, mesh)
+    except (OSError, ValueError) as e:
+        log.info(f"Mesh size of {mesh.DIR} unavailable ({e}), using {fallback} cores")
+        return fallback
+    if (model := load_scaling_models(store).get(key)) is None:
+        log.info(f"No scaling model for {key} in {store}, using {fallback} cores")
+        return fallback
+    cores = select_cores(model, max_cores, min_efficiency=kwargs.get("min_efficiency", 0.5))
+    log.info(
+        f"Selected {cores} cores for {key}",
+        f"predicted time {model.predict(cores):.1f}s at efficiency {model.efficiency(cores):.2f}",
+    )
+    return cores
+
+
+class _CalibrateScalingKwargs(TypedDict, total=False):
+    log: Required[ILogger]
+    store: Path
+
+
+def calibrate_scaling(
+    run: Callable[[int], None],
+    pb: ProblemParameters,
+    mesh: MeshInfo,
+    cores: Sequence[int],
+    **kwargs: Unpack[_CalibrateScalingKwargs],
+) -> Ok[ScalingModel] | Err:
+    """Time `run` at each core count, fit a ScalingModel and store it under its problem class.
+
+    `run` is usually a `run_simulation` call with a shortened time scheme bound to everything
+    except the core count.
+    """
+    log = kwargs["log"]
+    store = kwargs.get("store", Path("scaling.json"))
+    try:
+        key = scaling_key(pb, mesh)
+    except (OSError, ValueError) as e:
+        return Err(e)
+    samples: list[tuple[int, float]] = []
+    for p in cores:
+        log.info(f"Calibrating {pb.P.N} on {p} cores")
+        start = time.perf_counter()
+        run(p)
+        samples.append((p, time.perf_counter() - start))
+        log.debug(f"{p} cores took {samples[-1][1]:.2f}s")
+    match fit_scaling_model(samples):
+        case Ok(model):
+            pass
+        case Err(e):
+            return Err(e)
+    save_scaling_model(store, key, model)
+    log.info(f"Scaling model for {key} saved to {store}")
+    return Ok(model)
@@ -0,0 +1,41 @@
+import dataclasses as dc
+import shutil
+from typing import TYPE_CHECKING
+
+from aorta_personalization.mesh.api import mesh_lock
+from aorta_personalization.storage.api import link_or_copy
+from pytools.path import clear_dir
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from aorta_personalization.mesh.types import MeshInfo
+    from pytools.logging import ILogger
+
+
+# produced by cheart prep for a specific run, never shared between runs
+RUN_ARTIFACTS = frozenset({".PART", ".IN"})
+
+
+def stage_mesh_dir(mesh: MeshInfo, scratch: Path, *, log: ILogger) -> MeshInfo:
+    """Hard link the shared mesh files into a per-run scratch directory.
+
+    Returns a MeshInfo pointing at the scratch directory, so the P-file and everything cheart
+    prep generates from it (.PART, .IN) stays private to the run. Hard links keep the staged
+    files valid even if the shared mesh is regenerated while the run is going. The run owns the
+    directory, the runners remove it with remove_scratch once the solver succeeded.
+    """
+    log.debug(f"Staging mesh {mesh.DIR} into {scratch}")
+    scratch.mkdir(parents=True, exist_ok=True)
+    clear_dir(scratch)
+    with mesh_lock(mesh, shared=True):
+        for f in mesh.DIR.iterdir():
+            if f.is_file() and f.suffix not in RUN_ARTIFACTS:
+                link_or_copy(f, scratch / f.name)
+    return dc.replace(mesh, DIR=scratch)
+
+
+def remove_scratch(scratch: Path, *, log: ILogger) -> None:
+    """Delete a run's scratch directory: its staged mesh links, P-file and prep artifacts."""
+    log.debug(f"Removing scratch directory {scratch}")
+    shutil.rmtree(scratch, ignore_errors=True)
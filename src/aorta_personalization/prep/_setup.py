@@ -1,6 +1,11 @@
 from typing import TYPE_CHECKING, NamedTuple
 
-from aorta_personalization.mesh.api import prep_cheart_mesh, prep_topology_meshes
+from aorta_personalization.mesh.api import (
+    preflight_mesh_check,
+    prep_cheart_mesh,
+    prep_topology_meshes,
+)
+from aorta_personalization.profiling.api import traced
 from pytools.result import Err, Ok
 
 if TYPE_CHECKING:
@@ -18,8 +23,14 @@ class _SetupReturnType(NamedTuple):
     dl_top: CLPartition[np.float64, np.intc] | None
 
 
+@traced()
 def run_setup(
-    prob: ProblemParameters, mesh: MeshInfo, *, log: ILogger, override: bool = False
+    prob: ProblemParameters,
+    mesh: MeshInfo,
+    *,
+    log: ILogger,
+    override: bool = False,
+    check_quality: bool = True,
 ) -> Ok[_SetupReturnType] | Err:
     """Run the setup phase for aorta personalization problem.
 
@@ -33,6 +44,10 @@ def run_setup(
         Logger instance.
     override : bool, optional
         Whether to override existing setup data, by default False.
+    check_quality : bool, optional
+        Whether to check elements for inversion, distortion, stretching and normal orientation
+        before anything is derived from the mesh, by default True. A mesh that passed is not
+        checked again until its files change.
 
     Returns
     -------
@@ -53,6 +68,12 @@ def run_setup(
             pass
         case Err(e):
             return Err(e)
+    if check_quality:
+        match preflight_mesh_check(mesh, cheart_mesh, log=log):
+            case Ok():
+                pass
+            case Err(e):
+                return Err(e)
     match prep_topology_meshes(
         prob.P.CL, prob.P.CL_i, prob.P.CL_n, (mesh, cheart_mesh, cl_arr), log=log
     ):
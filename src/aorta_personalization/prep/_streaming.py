@@ -0,0 +1,132 @@
+import asyncio
+import os
+import re
+import threading
+from contextlib import nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from types import TracebackType
+
+
+_STEP_FILE = re.compile(r"^(.+)-(\d+)\.D$")
+
+
+class StepWatcher:
+    """Deliver each completed output step of a running simulation to a callback.
+
+    A step is complete once every watched variable has been written for it and the solver has
+    moved on to a later step, CHeart writes all exports of a step before starting the next one.
+    What is left is flushed when the watcher stops, i.e. after the solver exits. Steps are
+    delivered in order, exactly once, from a single background thread; the first exception
+    raised by the callback stops delivery and is re-raised on exit. Use it with `async with`
+    from a coroutine, waiting for the last steps then does not block the event loop.
+    """
+
+    __slots__ = (
+        "_directory",
+        "_error",
+        "_interval",
+        "_last",
+        "_on_step",
+        "_prefixes",
+        "_stop",
+        "_thread",
+    )
+
+    def __init__(
+        self,
+        directory: Path,
+        prefixes: Sequence[str],
+        on_step: Callable[[int], None],
+        *,
+        interval: float = 0.5,
+    ) -> None:
+        self._directory = Path(directory)
+        self._prefixes = tuple(prefixes)
+        self._on_step = on_step
+        self._interval = interval
+        self._last: int | None = None
+        self._error: Exception | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._poll, name="step-watcher", daemon=True)
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._stop.set()
+        self._thread.join()
+        if self._error is not None and exc is None:
+            raise self._error
+
+    async def __aenter__(self) -> Self:
+        return self.__enter__()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await asyncio.to_thread(self.__exit__, exc_type, exc, tb)
+
+    @property
+    def last_step(self) -> int | None:
+        return self._last
+
+    def _scan(self) -> dict[str, set[int]]:
+        found: dict[str, set[int]] = {p: set() for p in self._prefixes}
+        with os.scandir(self._directory) as it:
+            for entry in it:
+                if (m := _STEP_FILE.match(entry.name)) and m.group(1) in found:
+                    found[m.group(1)].add(int(m.group(2)))
+        return found
+
+    def _ready(self, *, final: bool) -> list[int]:
+        if not self._directory.is_dir():
+            return []
+        found = self._scan()
+        latest = max((i for steps in found.values() for i in steps), default=None)
+        if latest is None:
+            return []
+        # step files are only final once the solver has begun a later step
+        complete = set.intersection(*found.values())
+        return sorted(
+            i
+            for i in complete
+            if (final or i < latest) and (self._last is None or i > self._last)
+        )
+
+    def _deliver(self, *, final: bool) -> None:
+        if self._error is not None:
+            return
+        for i in self._ready(final=final):
+            try:
+                self._on_step(i)
+            except Exception as e:
+                self._error = e
+                return
+            self._last = i
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self._interval):
+            self._deliver(final=False)
+        self._deliver(final=True)
+
+
+def watch_outputs(
+    directory: Path, prefixes: Sequence[str], on_step: Callable[[int], None] | None
+) -> StepWatcher | nullcontext[None]:
+    """StepWatcher for on_step, or a no-op; both work with `with` and `async with`."""
+    if on_step is None:
+        return nullcontext()
+    return StepWatcher(directory, prefixes, on_step)
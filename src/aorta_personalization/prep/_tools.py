@@ -1,11 +1,13 @@
 from typing import TYPE_CHECKING, TypedDict, Unpack
 
-from cheartpy.io.api import chread_d, chwrite_d_utf
+from aorta_personalization.storage.api import chread_d, chwrite_d_utf
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    import numpy as np
     from aorta_personalization.problem.types import Labels
+    from pytools.arrays import A2
 
 
 def check_for_vars(root: Path, *vs: str, max_idx: int = 100) -> list[str]:
@@ -18,10 +20,26 @@ class _AddWriteVarKwargs(TypedDict, total=False):
     disp: str
 
 
-def write_subvar(lbl: Labels, i: int, **prefix: Unpack[_AddWriteVarKwargs]) -> None:
+def read_subvar(
+    lbl: Labels, i: int, **prefix: Unpack[_AddWriteVarKwargs]
+) -> tuple[A2[np.float64], A2[np.float64]]:
+    """Current and reference displacement of step i, the operands of write_subvar."""
     disp_i = prefix.get("disp_i", "U0")
     disp_t = prefix.get("disp_t", "Ut")
-    disp = prefix.get("disp", "Disp")
-    cur = chread_d(lbl.D / f"{disp_t}-{i}.D")
-    ref = chread_d(lbl.D / f"{disp_i}-{i}.D")
-    chwrite_d_utf((lbl.D / f"{disp}-{i}.D"), cur - ref)
+    return chread_d(lbl.D / f"{disp_t}-{i}.D"), chread_d(lbl.D / f"{disp_i}-{i}.D")
+
+
+def subvar(pair: tuple[A2[np.float64], A2[np.float64]]) -> A2[np.float64]:
+    cur, ref = pair
+    return cur - ref
+
+
+def store_subvar(
+    lbl: Labels, i: int, disp: A2[np.float64], **prefix: Unpack[_AddWriteVarKwargs]
+) -> None:
+    chwrite_d_utf(lbl.D / f"{prefix.get('disp', 'Disp')}-{i}.D", disp)
+
+
+def write_subvar(lbl: Labels, i: int, **prefix: Unpack[_AddWriteVarKwargs]) -> None:
+    """Write disp = disp_t - disp_i for step i; run_step_pipeline takes the three parts."""
+    store_subvar(lbl, i, subvar(read_subvar(lbl, i, **prefix)), **prefix)
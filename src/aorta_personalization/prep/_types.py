@@ -1,8 +1,11 @@
-from typing import TYPE_CHECKING, Protocol
+import dataclasses as dc
+from typing import TYPE_CHECKING, Literal, NamedTuple, Protocol
 
 import numpy as np
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from aorta_personalization.mesh.types import MeshInfo
     from aorta_personalization.problem.types import ProblemParameters
     from cheartpy.cl.struct import CLPartition
@@ -14,3 +17,35 @@ class PFileGenerator[F: np.floating, I: np.integer](Protocol):
     def __call__(
         self, prob: ProblemParameters, mesh: MeshInfo, *part: CLPartition[F, I] | None
     ) -> Ok[PFile] | Err: ...
+
+
+class SolverCommand(NamedTuple):
+    """Command line of a solver pass, env None inherits the environment of the caller."""
+
+    argv: list[str]
+    env: Mapping[str, str] | None = None
+
+
+class SolverBackend(Protocol):
+    """What the runners need from a solver: a prep pass and a problem run.
+
+    prep and problem run the pass to completion and return the exit code, log is the file the
+    solver output goes to. run_simulation_async launches the *_command lines as subprocesses
+    instead, so it can stream their output and terminate them when cancelled.
+    """
+
+    def prep(self, prob_name: str, *, log: str) -> int: ...
+
+    def problem(self, prob_name: str, *, pedantic: bool, cores: int, log: str) -> int: ...
+
+    def prep_command(self, prob_name: str) -> SolverCommand: ...
+
+    def problem_command(self, prob_name: str, *, pedantic: bool, cores: int) -> SolverCommand: ...
+
+
+@dc.dataclass(slots=True, frozen=True)
+class PatientReport:
+    name: str
+    status: Literal["created", "cached", "failed"]
+    elapsed: float
+    error: str | None = None
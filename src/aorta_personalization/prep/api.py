@@ -1,25 +1,83 @@
-from ._cmd import run_simulation, run_vtu
-from ._fields import make_longitudinal_field
-from ._postprocessing import (
-    compute_stiffness_from_dl_field,
-    make_reference_data_for_inverse_estimation,
-    postprocess_inverse_prob,
-    postprocess_physical_space,
-)
-from ._setup import (
-    run_setup,
-)
-from ._tools import check_for_vars, write_subvar
+from typing import TYPE_CHECKING
+
+from aorta_personalization._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from ._backend import CHeartBackend, MockBackend
+    from ._cmd import run_simulation, run_vtu
+    from ._cmd_async import CoreBudget, run_simulation_async
+    from ._cohort import setup_cohort, setup_patient
+    from ._fields import make_longitudinal_field
+    from ._postprocessing import (
+        compute_stiffness_from_dl_field,
+        forward_step_postprocessing,
+        make_reference_data_for_inverse_estimation,
+        postprocess_inverse_prob,
+        postprocess_physical_space,
+    )
+    from ._prefetch import run_step_pipeline
+    from ._scaling import calibrate_scaling, fit_scaling_model, scaling_key, select_cores
+    from ._setup import (
+        run_setup,
+    )
+    from ._streaming import StepWatcher
+    from ._tools import check_for_vars, write_subvar
 
 __all__ = [
+    "CHeartBackend",
+    "CoreBudget",
+    "MockBackend",
+    "StepWatcher",
+    "calibrate_scaling",
     "check_for_vars",
     "compute_stiffness_from_dl_field",
+    "fit_scaling_model",
+    "forward_step_postprocessing",
     "make_longitudinal_field",
     "make_reference_data_for_inverse_estimation",
     "postprocess_inverse_prob",
     "postprocess_physical_space",
     "run_setup",
     "run_simulation",
+    "run_simulation_async",
+    "run_step_pipeline",
     "run_vtu",
+    "scaling_key",
+    "select_cores",
+    "setup_cohort",
+    "setup_patient",
     "write_subvar",
 ]
+
+__getattr__ = lazy_getattr(
+    globals(),
+    {
+        "CHeartBackend": "._backend",
+        "CoreBudget": "._cmd_async",
+        "MockBackend": "._backend",
+        "StepWatcher": "._streaming",
+        "calibrate_scaling": "._scaling",
+        "check_for_vars": "._tools",
+        "compute_stiffness_from_dl_field": "._postprocessing._inverse",
+        "fit_scaling_model": "._scaling",
+        "forward_step_postprocessing": "._postprocessing._forward",
+        "make_longitudinal_field": "._fields",
+        "make_reference_data_for_inverse_estimation": "._postprocessing._reference_data",
+        "postprocess_inverse_prob": "._postprocessing._inverse",
+        "postprocess_physical_space": "._postprocessing._forward",
+        "run_setup": "._setup",
+        "run_simulation": "._cmd",
+        "run_simulation_async": "._cmd_async",
+        "run_step_pipeline": "._prefetch",
+        "run_vtu": "._cmd",
+        "scaling_key": "._scaling",
+        "select_cores": "._scaling",
+        "setup_cohort": "._cohort",
+        "setup_patient": "._cohort",
+        "write_subvar": "._tools",
+    },
+)
+
+
+def __dir__() -> list[str]:
+    return __all__
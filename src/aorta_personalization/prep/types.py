@@ -1,3 +1,4 @@
-from ._types import PFileGenerator
+from ._scaling import ScalingModel
+from ._types import PatientReport, PFileGenerator, SolverBackend, SolverCommand
 
-__all__ = ["PFileGenerator"]
+__all__ = ["PFileGenerator", "PatientReport", "ScalingModel", "SolverBackend", "SolverCommand"]
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Literal
 
+from aorta_personalization.mesh.api import branch_ends
 from aorta_personalization.mesh.types import Geometries, MeshInfo
 from cheartpy.fe.api import create_bcpatch
 
@@ -42,4 +43,4 @@ def create_boundary_condition_list(
         case Geometries.STRAIGHT_CYLINDER:
             return create_cylinder_bcs(v.U, motion, {1: 1, 2: 1})
         case Geometries.BRANCHED_CYLINDER:
-            return create_cylinder_bcs(v.U, motion, {1: 1, 2: 1})
+            return create_cylinder_bcs(v.U, motion, {1: 1, 2: 1} | branch_ends(mesh.SPEC))
@@ -18,7 +18,9 @@ class _MotionVarKwargs(TypedDict, total=False):
 def _update_motionvar_auto(
     var: IVariable, top: ICheartTopology, pb: ProblemParameters
 ) -> IVariable:
-    motion_data = create_variable(f"{var}Data", top, 3, (pb.P.D / f"{var}.INIT"), freq=pb.ex_freq)
+    motion_data = create_variable(
+        f"{var}Data", top, 3, (pb.P.D / f"{var}.INIT"), freq=pb.export_frequency(f"{var}Data")
+    )
     motion_expr = create_expr(
         f"{var}_expr",
         [f"{motion_data}.{i} * min(t/{pb.nt * pb.dt}, 1.0)" for i in [1, 2, 3]],
@@ -32,7 +34,7 @@ def _update_motionvar_step(
     var: IVariable, top: ICheartTopology, pb: ProblemParameters, step: int
 ) -> IVariable:
     motion_data = create_variable(
-        f"{var}Data", top, 3, (pb.P.D / f"Disp-{step}.D"), freq=pb.ex_freq
+        f"{var}Data", top, 3, (pb.P.D / f"Disp-{step}.D"), freq=pb.export_frequency(f"{var}Data")
     )
     motion_expr = create_expr(
         f"{var}_expr",
@@ -68,7 +70,7 @@ def create_motion_variable(
 ) -> Ok[IVariable] | Ok[None] | Err:
     if motion is None:
         return Ok(None)
-    var = create_variable(prefix, top.U, 3, freq=prob.ex_freq)
+    var = create_variable(prefix, top.U, 3, freq=prob.export_frequency(prefix))
     match motion:
         case "Zeros":
             zeros_3_expr = create_expr("zeros_3_expr", [0, 0, 0])
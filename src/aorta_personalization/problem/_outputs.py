@@ -0,0 +1,20 @@
+from ._types import OutputPlan
+
+
+def merge_output_plans(*plans: OutputPlan) -> OutputPlan:
+    reads: dict[str, frozenset[int]] = {}
+    for p in plans:
+        for v, steps in p.reads.items():
+            reads[v] = reads.get(v, frozenset()) | steps
+    return OutputPlan(reads, full_history=any(p.full_history for p in plans))
+
+
+def reference_data_output_plan(target: float, nt: int, *, cl: str | None = "CL") -> OutputPlan:
+    """Steps make_reference_data_for_inverse_estimation reads from the forward run it builds on.
+
+    That is the reference step int(target * nt) and the final step of the displacement
+    (Space is rebuilt from it in postprocessing), the pressure and the CL multipliers.
+    """
+    steps = frozenset({int(target * nt), nt})
+    variables = ["Disp", "Pres"] if cl is None else ["Disp", "Pres", f"{cl}LM"]
+    return OutputPlan(dict.fromkeys(variables, steps))
@@ -1,4 +1,5 @@
 import dataclasses as dc
+import math
 from collections.abc import Mapping
 from typing import TYPE_CHECKING, Final, Literal
 
@@ -59,6 +60,18 @@ class Labels:
     DL_i: int
 
 
+@dc.dataclass(slots=True, frozen=True)
+class OutputPlan:
+    """Time steps of each variable that downstream stages read from a run.
+
+    Variables that are not listed are read at the final step only. With full_history every
+    variable is exported at ProblemParameters.ex_freq instead.
+    """
+
+    reads: Mapping[str, frozenset[int]] = dc.field(default_factory=dict)
+    full_history: bool = False
+
+
 @dc.dataclass(slots=True)
 class ProblemParameters:
     P: Final[Labels]
@@ -75,3 +88,15 @@ class ProblemParameters:
     noise: float = 0.0
     spac: int = 1
     log: LogLevel = "DEBUG"
+    outputs: OutputPlan | None = None
+
+    def export_frequency(self, *variables: str) -> int:
+        """Largest export frequency that still writes every step the output plan needs.
+
+        CHeart exports a variable at the steps divisible by its frequency, so this is the gcd
+        of the steps read from any of the variables (which share one frequency) and nt.
+        """
+        if self.outputs is None or self.outputs.full_history:
+            return self.ex_freq
+        steps = {self.nt}.union(*(self.outputs.reads.get(v, ()) for v in variables))
+        return math.gcd(*steps)
@@ -1,10 +1,16 @@
-from ._bcs import create_boundary_condition_list
-from ._centerline import create_centerline_topology_list
-from ._constraint import create_rigid_body_constraints
-from ._material import create_stiffness_expressions
-from ._motion import create_motion_variable
-from ._pressure import create_pres_expressions
-from ._reference import create_pressure_coupling_problem, create_reference_space_problem
+from typing import TYPE_CHECKING
+
+from aorta_personalization._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from ._bcs import create_boundary_condition_list
+    from ._centerline import create_centerline_topology_list
+    from ._constraint import create_rigid_body_constraints
+    from ._material import create_stiffness_expressions
+    from ._motion import create_motion_variable
+    from ._outputs import merge_output_plans, reference_data_output_plan
+    from ._pressure import create_pres_expressions
+    from ._reference import create_pressure_coupling_problem, create_reference_space_problem
 
 __all__ = [
     "create_boundary_condition_list",
@@ -15,4 +21,26 @@ __all__ = [
     "create_reference_space_problem",
     "create_rigid_body_constraints",
     "create_stiffness_expressions",
+    "merge_output_plans",
+    "reference_data_output_plan",
 ]
+
+__getattr__ = lazy_getattr(
+    globals(),
+    {
+        "create_boundary_condition_list": "._bcs",
+        "create_centerline_topology_list": "._centerline",
+        "create_motion_variable": "._motion",
+        "create_pres_expressions": "._pressure",
+        "create_pressure_coupling_problem": "._reference",
+        "create_reference_space_problem": "._reference",
+        "create_rigid_body_constraints": "._constraint",
+        "create_stiffness_expressions": "._material",
+        "merge_output_plans": "._outputs",
+        "reference_data_output_plan": "._outputs",
+    },
+)
+
+
+def __dir__() -> list[str]:
+    return __all__
@@ -1,3 +1,17 @@
-from ._types import PRES_MODES, STIFF_MODES, Labels, MaterialProperty, ProblemParameters
+from ._types import (
+    PRES_MODES,
+    STIFF_MODES,
+    Labels,
+    MaterialProperty,
+    OutputPlan,
+    ProblemParameters,
+)
 
-__all__ = ["PRES_MODES", "STIFF_MODES", "Labels", "MaterialProperty", "ProblemParameters"]
+__all__ = [
+    "PRES_MODES",
+    "STIFF_MODES",
+    "Labels",
+    "MaterialProperty",
+    "OutputPlan",
+    "ProblemParameters",
+]
@@ -0,0 +1,225 @@
+import dataclasses as dc
+import functools
+import itertools
+import json
+import os
+import resource
+import sys
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+
+    from pytools.logging import ILogger
+
+
+_PROC_IO = Path("/proc/self/io")
+_KIB = 1024
+_MIB = 1024 * 1024
+# tracks of asyncio tasks are numbered above any native thread id
+_TASK_TRACK_BASE = 1 << 32
+_TASK_TRACKS: weakref.WeakKeyDictionary[object, tuple[int, str]] = weakref.WeakKeyDictionary()
+_TASK_COUNTER = itertools.count(1)
+_TASK_LOCK = threading.Lock()
+
+
+@dc.dataclass(slots=True, frozen=True)
+class SpanRecord:
+    name: str
+    start: float
+    wall: float
+    cpu: float
+    process_max_rss: int
+    read_bytes: int
+    write_bytes: int
+    tid: int
+    track: str
+    args: Mapping[str, str]
+
+
+class _Sample:
+    """Process counters at one instant, subtracted to get the cost of a span."""
+
+    __slots__ = ("cpu", "rchar", "t", "wchar")
+
+    def __init__(self) -> None:
+        self.t = time.perf_counter()
+        # children terms cover cheart and other subprocesses once they have been waited for
+        tms = os.times()
+        self.cpu = time.process_time() + tms.children_user + tms.children_system
+        self.rchar, self.wchar = _io_counters()
+
+
+def _io_counters() -> tuple[int, int]:
+    try:
+        fields = dict(line.split(": ") for line in _PROC_IO.read_text().splitlines())
+    except OSError:
+        return 0, 0
+    return int(fields.get("rchar", 0)), int(fields.get("wchar", 0))
+
+
+def _process_max_rss() -> int:
+    """High-water mark of the process (or a waited-for child) so far, not of one span."""
+    # ru_maxrss is in KiB on linux
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) * _KIB
+
+
+def _track() -> tuple[int, str]:
+    """Trace track of the caller: its asyncio task if it runs in one, else its thread.
+
+    Tasks interleave on one thread, a track per task keeps each task's spans nested.
+    """
+    # without asyncio imported there can be no running task
+    if (aio := sys.modules.get("asyncio")) is not None:
+        try:
+            task = aio.current_task()
+        except RuntimeError:
+            task = None
+        if task is not None:
+            with _TASK_LOCK:
+                if task not in _TASK_TRACKS:
+                    tid = _TASK_TRACK_BASE + next(_TASK_COUNTER)
+                    _TASK_TRACKS[task] = (tid, task.get_name())
+                return _TASK_TRACKS[task]
+    return threading.get_native_id(), threading.current_thread().name
+
+
+class Tracer:
+    """Thread-safe collection of finished spans for one process."""
+
+    __slots__ = ("_epoch", "_lock", "_records")
+
+    def __init__(self) -> None:
+        self._epoch = time.perf_counter()
+        self._lock = threading.Lock()
+        self._records: list[SpanRecord] = []
+
+    def add(self, record: SpanRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    def records(self) -> list[SpanRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def chrome_trace(self) -> dict[str, object]:
+        pid = os.getpid()
+        events: list[dict[str, object]] = []
+        tracks: dict[int, str] = {}
+        for r in self.records():
+            tracks[r.tid] = r.track
+            ts = (r.start - self._epoch) * 1e6
+            args = {
+                "cpu_s": round(r.cpu, 6),
+                "process_max_rss_mib": round(r.process_max_rss / _MIB, 1),
+                "read_mib": round(r.read_bytes / _MIB, 3),
+                "write_mib": round(r.write_bytes / _MIB, 3),
+                **r.args,
+            }
+            events.append(
+                {
+                    "name": r.name,
+                    "ph": "X",
+                    "ts": ts,
+                    "dur": r.wall * 1e6,
+                    "pid": pid,
+                    "tid": r.tid,
+                    "args": args,
+                }
+            )
+            events.append(
+                {
+                    "name": "process_max_rss",
+                    "ph": "C",
+                    "ts": ts + r.wall * 1e6,
+                    "pid": pid,
+                    "args": {"MiB": round(r.process_max_rss / _MIB, 1)},
+                }
+            )
+        events.extend(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in tracks.items()
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+_TRACER = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _TRACER
+
+
+def export_chrome_trace(file: Path, *, clear: bool = True) -> None:
+    """Write the recorded spans as Chrome/Perfetto trace JSON.
+
+    Open it in chrome://tracing or ui.perfetto.dev.
+    """
+    file.parent.mkdir(parents=True, exist_ok=True)
+    with file.open("w") as f:
+        json.dump(_TRACER.chrome_trace(), f)
+    if clear:
+        _TRACER.clear()
+
+
+@contextmanager
+def span(name: str, *, log: ILogger | None = None, **args: object) -> Iterator[None]:
+    """Record wall time, CPU time and bytes read/written by the enclosed block.
+
+    CPU and I/O are process counters, concurrent spans share them. The RSS reported is the
+    process high-water mark when the block ends. Spans opened in an asyncio task go on a track
+    of their own, those of concurrent runs would otherwise overlap on the loop's thread.
+    """
+    tid, track = _track()
+    start = _Sample()
+    try:
+        yield
+    finally:
+        end = _Sample()
+        record = SpanRecord(
+            name=name,
+            start=start.t,
+            wall=end.t - start.t,
+            cpu=end.cpu - start.cpu,
+            process_max_rss=_process_max_rss(),
+            read_bytes=end.rchar - start.rchar,
+            write_bytes=end.wchar - start.wchar,
+            tid=tid,
+            track=track,
+            args={k: str(v) for k, v in args.items()},
+        )
+        _TRACER.add(record)
+        if log is not None:
+            log.debug(
+                f"[{name}] wall {record.wall:.3f}s, cpu {record.cpu:.3f}s, "
+                f"process max rss {record.process_max_rss / _MIB:.0f} MiB, "
+                f"read {record.read_bytes / _MIB:.1f} MiB, "
+                f"write {record.write_bytes / _MIB:.1f} MiB"
+            )
+
+
+def traced[**P, R](name: str | None = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Wrap a function in a span, logging through its `log` keyword argument if it has one."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with span(label, log=cast("ILogger | None", kwargs.get("log"))):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
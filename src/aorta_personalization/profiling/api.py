@@ -0,0 +1,3 @@
+from ._span import export_chrome_trace, get_tracer, span, traced
+
+__all__ = ["export_chrome_trace", "get_tracer", "span", "traced"]
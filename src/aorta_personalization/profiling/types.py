@@ -0,0 +1,3 @@
+from ._span import SpanRecord, Tracer
+
+__all__ = ["SpanRecord", "Tracer"]
@@ -1,7 +1,7 @@
 from pathlib import Path
 from typing import TYPE_CHECKING, TypedDict, Unpack
 
-from cheartpy.fe.api import create_bcpatch, create_variable
+from cheartpy.fe.api import create_bcpatch, create_expr, create_variable
 from cheartpy.fe.physics.solid_mechanics.matlaws import Matlaw
 from cheartpy.fe.physics.solid_mechanics.solid_problems import (
     SolidProblem,
@@ -23,6 +23,7 @@ class _SetSolidICKwargs(TypedDict, total=False):
 
 
 def set_solid_ic(var: SolidProbVars, **kwargs: Unpack[_SetSolidICKwargs]) -> None:
+    """Start X, U and P from root/{var}{suffix}, e.g. a coarse run mapped by prolong_solution."""
     root = kwargs.get("root", Path())
     _sfx = kwargs.get("suffix", ".INIT")
     var.X.add_data((root / f"{var.X}").with_suffix(_sfx))
@@ -35,6 +36,7 @@ class _SolidProblemParameters(TypedDict, total=False):
     bcs: Sequence[IBCPatch]
     pres: IExpression | None
     fibers: IVariable | None
+    stiff: str | None
 
 
 def create_solid_problem(
@@ -57,12 +59,13 @@ def create_solid_problem(
     if v.U.order == v.P.order:
         mp.stabilize("Nearly-incompressible", 100)
     mp.add_state_variable(*kwargs.get("state_vars", []))
-    stiff = create_variable(
-        "Stiff",
-        v.U.get_top(),
-        len(pars),
-        freq=v.U.get_export_frequency(),
-    )
-    stiff.add_setting("TEMPORAL_UPDATE_EXPR", pars)
+    # only the modulus is exported, pass stiff=None when it is rebuilt in postprocessing
+    if (stiff_name := kwargs.get("stiff", "Stiff")) is None:
+        return mp
+    modulus = create_expr(f"{stiff_name}_modulus_expr", [f"{pars}.1"])
+    modulus.add_deps(pars)
+    stiff = create_variable(stiff_name, v.U.get_top(), 1, freq=v.U.get_export_frequency())
+    stiff.add_setting("TEMPORAL_UPDATE_EXPR", modulus)
+    mp.add_expr_deps(modulus)
     mp.add_var_deps(stiff)
     return mp
@@ -1,4 +1,22 @@
-from ._problem import create_solid_problem, set_solid_ic
-from ._variables import create_solid_vars
+from typing import TYPE_CHECKING
+
+from aorta_personalization._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from ._problem import create_solid_problem, set_solid_ic
+    from ._variables import create_solid_vars
 
 __all__ = ["create_solid_problem", "create_solid_vars", "set_solid_ic"]
+
+__getattr__ = lazy_getattr(
+    globals(),
+    {
+        "create_solid_problem": "._problem",
+        "create_solid_vars": "._variables",
+        "set_solid_ic": "._problem",
+    },
+)
+
+
+def __dir__() -> list[str]:
+    return __all__
@@ -0,0 +1,120 @@
+import dataclasses as dc
+import re
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from cheartpy.io.api import chread_d as _chread_d
+from cheartpy.io.api import chwrite_d_utf as _chwrite_d_utf
+
+from ._manifest import resolve_view
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pytools.arrays import A2, DType
+    from pytools.logging import ILogger
+
+
+# Disp-12.D -> Disp, LMAzLV_Support.INIT -> LMAzLV_Support
+_PREFIX = re.compile(r"^(.+?)(?:-\d+)?(?:\.\w+)?$")
+_MIB = 1024 * 1024
+
+
+@dc.dataclass(slots=True)
+class IOStats:
+    files_read: int = 0
+    bytes_read: int = 0
+    parse_time: float = 0.0
+    files_written: int = 0
+    bytes_written: int = 0
+    format_time: float = 0.0
+
+    def __sub__(self, other: IOStats) -> IOStats:
+        return IOStats(*(a - b for a, b in zip(dc.astuple(self), dc.astuple(other), strict=True)))
+
+
+_LOCK = threading.Lock()
+_STATS: dict[str, IOStats] = {}
+
+
+def variable_prefix(file: Path | str) -> str:
+    name = Path(file).name
+    return m.group(1) if (m := _PREFIX.match(name)) else name
+
+
+def chread_d[F: np.floating](file: Path | str, *, dtype: DType[F] = np.float64) -> A2[F]:
+    """Drop-in for cheartpy's chread_d that accounts the read to the variable prefix.
+
+    Files registered as column views (see register_column_views) are read from their source.
+    """
+    file = Path(file)
+    view = None if file.exists() else resolve_view(file)
+    start = time.perf_counter()
+    if view is None:
+        data = _chread_d(file, dtype=dtype)
+    else:
+        source, columns = view
+        data = _chread_d(source, dtype=dtype)[:, columns]
+    elapsed = time.perf_counter() - start
+    size = (file if view is None else view[0]).stat().st_size
+    with _LOCK:
+        stats = _STATS.setdefault(variable_prefix(file), IOStats())
+        stats.files_read += 1
+        stats.bytes_read += size
+        stats.parse_time += elapsed
+    return data
+
+
+def chwrite_d_utf(file: Path | str, data: A2[np.floating]) -> None:
+    """Drop-in for cheartpy's chwrite_d_utf that accounts the write to the variable prefix."""
+    file = Path(file)
+    # a static field links one file as many steps, never write through the shared inode
+    if file.is_file() and file.stat().st_nlink > 1:
+        file.unlink()
+    start = time.perf_counter()
+    _chwrite_d_utf(file, data)
+    elapsed = time.perf_counter() - start
+    size = file.stat().st_size
+    with _LOCK:
+        stats = _STATS.setdefault(variable_prefix(file), IOStats())
+        stats.files_written += 1
+        stats.bytes_written += size
+        stats.format_time += elapsed
+
+
+def is_up_to_date(target: Path | str, *sources: Path | str) -> bool:
+    """True if target exists and was written after every existing source."""
+    try:
+        mtime = Path(target).stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return all(mtime >= Path(s).stat().st_mtime_ns for s in sources if Path(s).exists())
+
+
+def io_snapshot() -> dict[str, IOStats]:
+    """Copy of the process-wide counters, pass it to io_since to get the cost of a stage."""
+    with _LOCK:
+        return {k: dc.replace(v) for k, v in _STATS.items()}
+
+
+def io_since(snapshot: Mapping[str, IOStats]) -> dict[str, IOStats]:
+    now = io_snapshot()
+    diff = {k: v - snapshot.get(k, IOStats()) for k, v in now.items()}
+    return {k: v for k, v in diff.items() if v.files_read or v.files_written}
+
+
+def log_io_summary(stats: Mapping[str, IOStats], *, log: ILogger, title: str = "I/O") -> None:
+    """Log one line per variable prefix, largest total traffic first."""
+    if not stats:
+        return
+    log.info(f"{title} summary by variable:")
+    order = sorted(stats.items(), key=lambda kv: kv[1].bytes_read + kv[1].bytes_written)
+    for k, s in reversed(order):
+        log.info(
+            f"  {k:<24} read {s.files_read:>5} files {s.bytes_read / _MIB:>9.1f} MiB "
+            f"{s.parse_time:>7.2f}s | write {s.files_written:>5} files "
+            f"{s.bytes_written / _MIB:>9.1f} MiB {s.format_time:>7.2f}s"
+        )
@@ -0,0 +1,20 @@
+import json
+from pathlib import Path
+
+# per directory, maps a derived file name to the file and columns it is a view of
+MANIFEST = "static_fields.json"
+
+
+def read_manifest(root: Path) -> dict[str, tuple[str, int, int]]:
+    if not (file := root / MANIFEST).is_file():
+        return {}
+    with file.open() as f:
+        return {k: (v["source"], *v["columns"]) for k, v in json.load(f).items()}
+
+
+def resolve_view(file: Path) -> tuple[Path, slice] | None:
+    """Source file and column slice for a file that is stored as a view, None otherwise."""
+    if (view := read_manifest(file.parent).get(file.name)) is None:
+        return None
+    source, start, stop = view
+    return file.parent / source, slice(start, stop)
@@ -0,0 +1,50 @@
+import json
+import os
+import shutil
+from typing import TYPE_CHECKING
+
+from ._io import chwrite_d_utf
+from ._manifest import MANIFEST, read_manifest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from pathlib import Path
+
+    import numpy as np
+    from pytools.arrays import A2
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def write_static_field(
+    root: Path, prefix: str, data: A2[np.floating], steps: Iterable[int]
+) -> None:
+    """Store a time-invariant variable once and hard link it as {prefix}-{i}.D for every step.
+
+    Readers (including cheart2vtu) see an ordinary file per step, only one is ever formatted.
+    """
+    first: Path | None = None
+    for i in steps:
+        file = root / f"{prefix}-{i}.D"
+        if first is None:
+            chwrite_d_utf(file, data)
+            first = file
+            continue
+        file.unlink(missing_ok=True)
+        link_or_copy(first, file)
+
+
+def register_column_views(root: Path, source: str, views: Mapping[str, tuple[int, int]]) -> None:
+    """Record files in root that are column ranges [start, stop) of source instead of copies.
+
+    chread_d resolves them on read, so they never need to be written.
+    """
+    manifest = {k: {"source": s, "columns": [a, b]} for k, (s, a, b) in read_manifest(root).items()}
+    manifest.update({k: {"source": source, "columns": [a, b]} for k, (a, b) in views.items()})
+    with (root / MANIFEST).open("w") as f:
+        json.dump(manifest, f, indent=2)
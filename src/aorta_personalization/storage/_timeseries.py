@@ -0,0 +1,128 @@
+import dataclasses as dc
+import json
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pytools.result import Err, Ok
+
+from ._io import chread_d, chwrite_d_utf
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from pytools.arrays import A2, A3, DType
+
+
+# per store directory, frames.npy holds every frame, fields/<name>.npy the static fields
+TIMESERIES_META = "timeseries.json"
+_FRAMES = "frames.npy"
+_FIELDS = "fields"
+
+
+@dc.dataclass(slots=True, frozen=True)
+class TimeSeriesStore:
+    """Read-only view of an ingested frame sequence, frames are memory mapped on open."""
+
+    root: Path
+    prefix: str
+    steps: tuple[int, ...]
+    frames: A3[np.floating]
+    fields: Mapping[str, Path]
+
+    @classmethod
+    def open(cls, root: Path) -> TimeSeriesStore:
+        with (root / TIMESERIES_META).open() as f:
+            meta = json.load(f)
+        return cls(
+            root=root,
+            prefix=meta["prefix"],
+            steps=tuple(meta["steps"]),
+            frames=np.load(root / _FRAMES, mmap_mode="r"),
+            fields={k: root / v for k, v in meta["fields"].items()},
+        )
+
+    def frame(self, step: int) -> A2[np.floating]:
+        """The frame recorded at step; a view into the map, only its pages are read."""
+        return self.frames[self.steps.index(step)]
+
+    def field(self, name: str) -> A2[np.floating]:
+        return np.load(self.fields[name], mmap_mode="r")
+
+    def decimate(
+        self, every: int, *, start: int | None = None, stop: int | None = None
+    ) -> list[int]:
+        """Every n-th recorded step within [start, stop], the last step in range is always kept."""
+        lo = self.steps[0] if start is None else start
+        hi = self.steps[-1] if stop is None else stop
+        steps = [s for s in self.steps if lo <= s <= hi]
+        kept = steps[::every]
+        if steps and kept[-1] != steps[-1]:
+            kept.append(steps[-1])
+        return kept
+
+    def export(
+        self, dest: Path, steps: Iterable[int] | dict[int, int], *, prefix: str | None = None
+    ) -> list[Path]:
+        """Write {prefix}-{i}.D for just the given steps.
+
+        A mapping writes recorded step k as output step v, e.g. to renumber a decimated
+        sequence onto the time steps of a run.
+        """
+        mapping = steps if isinstance(steps, dict) else {s: s for s in steps}
+        prefix = prefix or self.prefix
+        dest.mkdir(parents=True, exist_ok=True)
+        written: list[Path] = []
+        for src, out in mapping.items():
+            file = dest / f"{prefix}-{out}.D"
+            chwrite_d_utf(file, np.asarray(self.frame(src)))
+            written.append(file)
+        return written
+
+
+def _find_steps(src: Path, prefix: str) -> list[int]:
+    pattern = re.compile(rf"^{re.escape(prefix)}-(\d+)\.D$")
+    return sorted(int(m.group(1)) for f in src.iterdir() if (m := pattern.match(f.name)))
+
+
+def ingest_tracked_sequence[F: np.floating](
+    src: Path,
+    dest: Path,
+    *,
+    prefix: str = "TrackedSpace",
+    fields: Sequence[str] = ("CenterLineField-0.D", "CenterNormalField-0.D"),
+    dtype: DType[F] = np.float64,
+) -> Ok[TimeSeriesStore] | Err:
+    """Convert every {prefix}-{i}.D in src, plus the static fields, into one store in dest.
+
+    Each text file is parsed exactly once; afterwards frames are read straight from the map.
+    """
+    steps = _find_steps(src, prefix)
+    if not steps:
+        return Err(FileNotFoundError(f"No {prefix}-*.D frames found in {src}"))
+    dest.mkdir(parents=True, exist_ok=True)
+    first = chread_d(src / f"{prefix}-{steps[0]}.D", dtype=dtype)
+    frames = np.lib.format.open_memmap(
+        dest / _FRAMES, mode="w+", dtype=dtype, shape=(len(steps), *first.shape)
+    )
+    frames[0] = first
+    for k, s in enumerate(steps[1:], start=1):
+        data = chread_d(src / f"{prefix}-{s}.D", dtype=dtype)
+        if data.shape != first.shape:
+            msg = f"{prefix}-{s}.D has shape {data.shape}, expected {first.shape}"
+            return Err(ValueError(msg))
+        frames[k] = data
+    frames.flush()
+    del frames
+    (dest / _FIELDS).mkdir(exist_ok=True)
+    stored: dict[str, str] = {}
+    for name in fields:
+        if not (src / name).is_file():
+            return Err(FileNotFoundError(f"Static field {name} not found in {src}"))
+        stored[name] = f"{_FIELDS}/{Path(name).stem}.npy"
+        np.save(dest / stored[name], chread_d(src / name, dtype=dtype))
+    meta = {"prefix": prefix, "steps": steps, "fields": stored}
+    with (dest / TIMESERIES_META).open("w") as f:
+        json.dump(meta, f, indent=2)
+    return Ok(TimeSeriesStore.open(dest))
@@ -0,0 +1,29 @@
+from ._io import (
+    chread_d,
+    chwrite_d_utf,
+    io_since,
+    io_snapshot,
+    is_up_to_date,
+    log_io_summary,
+    variable_prefix,
+)
+from ._manifest import resolve_view
+from ._static import link_or_copy, register_column_views, write_static_field
+from ._timeseries import TIMESERIES_META, TimeSeriesStore, ingest_tracked_sequence
+
+__all__ = [
+    "TIMESERIES_META",
+    "TimeSeriesStore",
+    "chread_d",
+    "chwrite_d_utf",
+    "ingest_tracked_sequence",
+    "io_since",
+    "io_snapshot",
+    "is_up_to_date",
+    "link_or_copy",
+    "log_io_summary",
+    "register_column_views",
+    "resolve_view",
+    "variable_prefix",
+    "write_static_field",
+]
@@ -0,0 +1,3 @@
+from ._io import IOStats
+
+__all__ = ["IOStats"]